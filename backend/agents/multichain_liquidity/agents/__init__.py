@@ -5,9 +5,18 @@ This module contains all ADK agent definitions including:
 - Orchestrator agent (single agent that decides chains and calls tools directly)
 """
 
-from .orchestrator import liquidity_orchestrator_agent, root_agent
+from . import orchestrator
+from .orchestrator import create_liquidity_orchestrator_agent
 
 __all__ = [
+    "create_liquidity_orchestrator_agent",
     "liquidity_orchestrator_agent",
     "root_agent",
 ]
+
+
+def __getattr__(name: str):
+    """Forward lazily-built agent attributes to the orchestrator module."""
+    if name in ("liquidity_orchestrator_agent", "root_agent"):
+        return getattr(orchestrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,8 @@ Single agent that decides which chains to query and calls liquidity tools direct
 Returns JSON response with all results.
 """
 
+from functools import cache
+
 from google.adk.agents.llm_agent import LlmAgent
 
 from ..tools import (
@@ -115,8 +117,9 @@ Query: "Get liquidity for 0x5149... 0xdAC1... on polygon"
 """
 
 
+@cache
 def create_liquidity_orchestrator_agent() -> LlmAgent:
-    """Create the orchestrator agent with all liquidity tools."""
+    """Create the orchestrator agent with all liquidity tools (built once, on first use)."""
     return LlmAgent(
         name="LiquidityOrchestratorAgent",
         model="gemini-2.5-flash",
@@ -132,8 +135,9 @@ def create_liquidity_orchestrator_agent() -> LlmAgent:
     )
 
 
-# Create the orchestrator agent instance
-liquidity_orchestrator_agent = create_liquidity_orchestrator_agent()
-
-# For ADK compatibility, export root_agent
-root_agent = liquidity_orchestrator_agent
+def __getattr__(name: str) -> LlmAgent:
+    """Build the orchestrator agent lazily on first attribute access (PEP 562)."""
+    # For ADK compatibility, root_agent is exported as an alias of the orchestrator agent
+    if name in ("liquidity_orchestrator_agent", "root_agent"):
+        return create_liquidity_orchestrator_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
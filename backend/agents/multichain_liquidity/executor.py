@@ -18,7 +18,7 @@ from google.adk.runners import InMemoryRunner  # noqa: E402
 from google.genai import types  # noqa: E402
 
 # Local imports
-from .agents import liquidity_orchestrator_agent  # noqa: E402
+from .agents import create_liquidity_orchestrator_agent  # noqa: E402
 from .core.constants import (
     DEFAULT_SESSION_ID,
     ERROR_CANCEL_NOT_SUPPORTED,
@@ -27,6 +27,7 @@ from .core.constants import (
 )
 from .services.executor_validator import (  # noqa: E402
     log_sending_response,
+    parse_agent_response,
     validate_response_content,
 )
 
@@ -96,7 +97,7 @@ class LiquidityExecutor(AgentExecutor):
             )
 
             orchestrator_runner = InMemoryRunner(
-                agent=liquidity_orchestrator_agent,
+                agent=create_liquidity_orchestrator_agent(),
                 app_name=app_name,
             )
 
@@ -203,37 +204,23 @@ class LiquidityExecutor(AgentExecutor):
 
             # If not, try to parse from response_text
             if not liquidity_data and response_text and response_text.strip():
-                # Remove markdown code blocks if present
-                cleaned_text = response_text.strip()
-                if cleaned_text.startswith("```json"):
-                    cleaned_text = cleaned_text[7:]
-                if cleaned_text.startswith("```"):
-                    cleaned_text = cleaned_text[3:]
-                if cleaned_text.endswith("```"):
-                    cleaned_text = cleaned_text[:-3]
-                cleaned_text = cleaned_text.strip()
-
-                try:
-                    # Parse as JSON
-                    liquidity_data = json.loads(cleaned_text)
+                # Tolerates code fences and prose around the JSON object
+                liquidity_data = parse_agent_response(response_text)
+                if liquidity_data is not None:
                     print("   ✅ Successfully parsed JSON response from text")
-                    print(
-                        f"   Response keys: {list(liquidity_data.keys()) if isinstance(liquidity_data, dict) else 'N/A'}"
-                    )
-                    if isinstance(liquidity_data, dict):
-                        print(f"   Chain: {liquidity_data.get('chain', 'N/A')}")
-                        print(f"   Results count: {len(liquidity_data.get('results', []))}")
-                except json.JSONDecodeError as e:
-                    print(f"   ⚠️ Warning: Response is not valid JSON: {e}")
-                    print(f"   Content preview: {cleaned_text[:200]}")
-                    # Try to extract partial data or return error
+                    print(f"   Response keys: {list(liquidity_data.keys())}")
+                    print(f"   Chain: {liquidity_data.get('chain', 'N/A')}")
+                    print(f"   Results count: {len(liquidity_data.get('results', []))}")
+                else:
+                    print("   ⚠️ Warning: Response has no JSON object")
+                    print(f"   Content preview: {response_text[:200]}")
                     liquidity_data = {
                         "type": RESPONSE_TYPE,
                         "chain": "unknown",
                         "token_a": "unknown",
                         "token_b": "unknown",
                         "results": [],
-                        "error": f"Invalid JSON response from agent: {str(e)}",
+                        "error": "Invalid JSON response from agent",
                     }
 
             # If still no data, return error
@@ -258,7 +245,9 @@ class LiquidityExecutor(AgentExecutor):
                 # Ensure it has the required structure
                 if "type" not in liquidity_data:
                     liquidity_data["type"] = RESPONSE_TYPE
-                content = json.dumps(liquidity_data, indent=2)
+                # Serialized from a dict here, so it is valid JSON by construction and
+                # doesn't need to be parsed again by validate_response_content
+                validated_content = json.dumps(liquidity_data, indent=2)
                 print("   ✅ Formatted as JSON from dict")
             else:
                 # Convert to JSON if it's already a string
@@ -269,22 +258,24 @@ class LiquidityExecutor(AgentExecutor):
                     content = json.dumps(liquidity_data, indent=2)
                     print("   ✅ Converted to JSON string")
 
-            # Ensure content is not empty
-            if not content or not content.strip():
-                print("   ⚠️ Warning: Agent returned empty content, using error response")
-                content = _build_execution_error_response(Exception("Empty response from agent"))
+                # Ensure content is not empty
+                if not content or not content.strip():
+                    print("   ⚠️ Warning: Agent returned empty content, using error response")
+                    content = _build_execution_error_response(
+                        Exception("Empty response from agent")
+                    )
 
-            # Validate JSON (validate_response_content already checks JSON validity)
-            print(f"   Content length: {len(content)} characters")
-            try:
-                validated_content = validate_response_content(content)
-                print("   ✅ Content validated")
-            except ValueError as validation_error:
-                print(f"   ⚠️ Warning: Response validation failed: {validation_error}")
-                print(f"   Content preview: {content[:200]}")
-                validated_content = _build_execution_error_response(
-                    Exception(f"Invalid response: {str(validation_error)}")
-                )
+                # Validate JSON (validate_response_content already checks JSON validity)
+                try:
+                    validated_content = validate_response_content(content)
+                    print("   ✅ Content validated")
+                except ValueError as validation_error:
+                    print(f"   ⚠️ Warning: Response validation failed: {validation_error}")
+                    print(f"   Content preview: {content[:200]}")
+                    validated_content = _build_execution_error_response(
+                        Exception(f"Invalid response: {str(validation_error)}")
+                    )
+            print(f"   Content length: {len(validated_content)} characters")
 
             print()
             print("=" * 80)
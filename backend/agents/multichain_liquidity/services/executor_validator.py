@@ -6,8 +6,47 @@ as opposed to core/response_validator.py which handles domain-level validation.
 """
 
 import json
+from typing import Any
 
-from ..core.constants import ERROR_EMPTY_RESPONSE, ERROR_INVALID_JSON
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from ..core.constants import ERROR_EMPTY_RESPONSE, ERROR_INVALID_JSON  # noqa: E402
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def parse_agent_response(text: str) -> dict[str, Any] | None:
+    """
+    Parse the JSON object out of the liquidity agent's text response.
+
+    Besides bare JSON, accepts the object wrapped in a markdown code block or with
+    prose before or after it: decoding starts at the first "{" and stops at the end
+    of that object.
+
+    Args:
+        text: Response text from the agent
+
+    Returns:
+        Parsed object, or None if the text holds no complete JSON object
+    """
+    text = text.strip()
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        parsed = _json_loads(text)
+    except json.JSONDecodeError:
+        start = text.find("{")
+        if start == -1:
+            return None
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            return None
+    return parsed if isinstance(parsed, dict) else None
 
 
 def validate_response_content(content: str) -> str:
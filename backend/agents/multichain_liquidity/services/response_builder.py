@@ -0,0 +1,63 @@
+"""
+Response building utilities for liquidity agent.
+
+Builds the per-chain result dictionaries returned by the liquidity tools.
+All chains share the same result shape; only the chain name differs.
+"""
+
+from typing import Any
+
+DEFAULT_NETWORK = "mainnet"
+
+
+def build_pool_result(
+    chain: str,
+    token_a: str,
+    token_b: str,
+    pool_info: dict[str, Any],
+) -> dict[str, Any]:
+    """Build a successful liquidity result from a PoolInfo dictionary."""
+    slot0 = pool_info.get("slot0") or {}
+    liquidity = pool_info.get("liquidity")
+    sqrt_price_x96 = slot0.get("sqrtPriceX96")
+    return {
+        "chain": chain,
+        "network": DEFAULT_NETWORK,
+        "pool_address": pool_info.get("pool_address"),
+        "token_a": token_a,
+        "token_b": token_b,
+        "fee": pool_info.get("fee"),  # Actual fee tier the pool was found at
+        "liquidity": str(liquidity) if liquidity else "0",
+        "tick": slot0.get("tick", 0),
+        "sqrt_price_x96": str(sqrt_price_x96) if sqrt_price_x96 else "0",
+        "status": "success",
+    }
+
+
+def build_pool_not_found_result(chain: str, token_a: str, token_b: str, fee: int) -> dict[str, Any]:
+    """Build a liquidity result for a pair without a pool on any fee tier."""
+    return {
+        "chain": chain,
+        "network": DEFAULT_NETWORK,
+        "pool_address": None,
+        "token_a": token_a,
+        "token_b": token_b,
+        "fee": fee,
+        "liquidity": None,
+        "status": "pool_not_found",
+    }
+
+
+def build_error_result(
+    chain: str, token_a: str, token_b: str, fee: int, error: Exception
+) -> dict[str, Any]:
+    """Build a liquidity result for a failed lookup."""
+    return {
+        "chain": chain,
+        "network": DEFAULT_NETWORK,
+        "token_a": token_a,
+        "token_b": token_b,
+        "fee": fee,
+        "status": "error",
+        "error": str(error),
+    }
@@ -2,10 +2,17 @@
 
 import os
 
+from packages.blockchain.dex.base import FEE_TIERS
 from packages.blockchain.ethereum.uniswap.pool.web3_client import (
     UniswapWeb3Client as EthereumUniswapClient,
 )
 
+from ..services.response_builder import (
+    build_error_result,
+    build_pool_not_found_result,
+    build_pool_result,
+)
+
 ETHEREUM_MAINNET_RPC = os.getenv("ETHEREUM_MAINNET_RPC", "https://eth.llamarpc.com")
 
 
@@ -23,39 +30,15 @@ def get_ethereum_liquidity(token_a: str, token_b: str, fee: int = 3000) -> dict:
     """
     try:
         client = EthereumUniswapClient(rpc_url=ETHEREUM_MAINNET_RPC, network="mainnet")
-        pool_info = client.get_pool_info(token_a, token_b, fee=fee)
+        fee_tiers = (fee,) + tuple(f for f in FEE_TIERS if f != fee)
+        try:
+            # One aggregated getPool lookup across all fee tiers, then one pool read
+            pool_info = client.get_pool_info_multicall(token_a, token_b, fee_tiers)
+        except ValueError:
+            pool_info = client.get_pool_info(token_a, token_b, fee=fee)
 
         if pool_info:
-            return {
-                "chain": "ethereum",
-                "network": "mainnet",
-                "pool_address": pool_info["pool_address"],
-                "token_a": token_a,
-                "token_b": token_b,
-                "fee": fee,
-                "liquidity": pool_info["liquidity"],
-                "tick": pool_info["slot0"]["tick"],
-                "sqrt_price_x96": pool_info["slot0"]["sqrtPriceX96"],
-                "status": "success",
-            }
-        else:
-            return {
-                "chain": "ethereum",
-                "network": "mainnet",
-                "pool_address": None,
-                "token_a": token_a,
-                "token_b": token_b,
-                "fee": fee,
-                "liquidity": None,
-                "status": "pool_not_found",
-            }
+            return build_pool_result("ethereum", token_a, token_b, pool_info)
+        return build_pool_not_found_result("ethereum", token_a, token_b, fee)
     except Exception as e:
-        return {
-            "chain": "ethereum",
-            "network": "mainnet",
-            "token_a": token_a,
-            "token_b": token_b,
-            "fee": fee,
-            "status": "error",
-            "error": str(e),
-        }
+        return build_error_result("ethereum", token_a, token_b, fee, e)
@@ -3,9 +3,16 @@
 import os
 
 from packages.blockchain.hedera.saucerswap.pool.web3_client import (
+    HEDERA_FEE_TIERS,
     SaucerSwapWeb3Client,
 )
 
+from ..services.response_builder import (
+    build_error_result,
+    build_pool_not_found_result,
+    build_pool_result,
+)
+
 # Default to mainnet for now (as requested)
 HEDERA_MAINNET_RPC = os.getenv("HEDERA_MAINNET_RPC", "https://mainnet.hashio.io/api")
 HEDERA_TESTNET_RPC = os.getenv("HEDERA_TESTNET_RPC", HEDERA_MAINNET_RPC)
@@ -53,53 +60,22 @@ def get_hedera_liquidity(token_a: str, token_b: str, fee: int = 3000) -> dict:
             f"🔍 HEDERA_FEE_TIERS: {client._fee_tiers if hasattr(client, '_fee_tiers') else 'N/A'}"
         )
 
-        # Try all fee tiers (get_pool_info will try all Hedera fee tiers: 500, 1500, 3000, 10000)
-        pool_info = client.get_pool_info(token_a, token_b, fee=fee)
+        # Try all Hedera fee tiers (500, 1500, 3000, 10000) in a single aggregated lookup,
+        # falling back to the per-tier get_pool_info if Multicall3 is unavailable
+        fee_tiers = (fee,) + tuple(f for f in HEDERA_FEE_TIERS if f != fee)
+        try:
+            pool_info = client.get_pool_info_multicall(token_a, token_b, fee_tiers)
+        except ValueError as e:
+            print(f"⚠️ Multicall lookup failed, falling back to per-tier lookup: {e}")
+            pool_info = client.get_pool_info(token_a, token_b, fee=fee)
         print(f"🔍 Pool info result: {pool_info}")
 
         if pool_info:
-            # pool_info is a TypedDict (PoolInfo), access like a dictionary
-            pool_address = pool_info.get("pool_address", "")
-            liquidity = pool_info.get("liquidity", 0)
-            slot0 = pool_info.get("slot0", {})
-            found_fee = pool_info.get("fee", fee)
-
-            # Extract slot0 data
-            tick = slot0.get("tick", 0) if isinstance(slot0, dict) else 0
-            sqrt_price_x96 = slot0.get("sqrtPriceX96", 0) if isinstance(slot0, dict) else 0
-
-            print(f"✅ Found pool: address={pool_address}, fee={found_fee}, liquidity={liquidity}")
-
-            return {
-                "chain": "hedera",
-                "network": "mainnet",
-                "pool_address": pool_address,
-                "token_a": token_a,
-                "token_b": token_b,
-                "fee": found_fee,  # Use the actual fee tier found
-                "liquidity": str(liquidity) if liquidity else "0",
-                "tick": tick,
-                "sqrt_price_x96": str(sqrt_price_x96) if sqrt_price_x96 else "0",
-                "status": "success",
-            }
-        else:
-            return {
-                "chain": "hedera",
-                "network": "mainnet",
-                "pool_address": None,
-                "token_a": token_a,
-                "token_b": token_b,
-                "fee": fee,
-                "liquidity": None,
-                "status": "pool_not_found",
-            }
+            print(
+                f"✅ Found pool: address={pool_info['pool_address']}, fee={pool_info['fee']}, "
+                f"liquidity={pool_info['liquidity']}"
+            )
+            return build_pool_result("hedera", token_a, token_b, pool_info)
+        return build_pool_not_found_result("hedera", token_a, token_b, fee)
     except Exception as e:
-        return {
-            "chain": "hedera",
-            "network": "mainnet",
-            "token_a": token_a,
-            "token_b": token_b,
-            "fee": fee,
-            "status": "error",
-            "error": str(e),
-        }
+        return build_error_result("hedera", token_a, token_b, fee, e)
@@ -1,9 +1,18 @@
 """Token resolution tool for liquidity agents."""
 
+import re
 from typing import Any
 
 from ...swap.services.token_resolver import resolve_token_address
 
+# Exactly 40 hex digits; bytes.fromhex would also accept embedded whitespace
+_EVM_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+def _is_evm_address(value: str) -> bool:
+    """Check that value is an already-resolved 0x-prefixed 20-byte hex address."""
+    return _EVM_ADDRESS_RE.fullmatch(value) is not None
+
 
 def resolve_token_for_liquidity(token_symbol: str, chain: str) -> dict[str, Any]:
     """
@@ -21,17 +30,30 @@ def resolve_token_for_liquidity(token_symbol: str, chain: str) -> dict[str, Any]
             "address_evm": "0x...",  # For hedera
             "address_hedera": "0.0.123456",  # For hedera (if available)
             "decimals": 18,
-            "source": "constants" | "cache" | "token_research",
+            "source": "constants" | "cache" | "token_research" | "address",
             "explorer_url": "https://..."
         }
     """
+    # Upstream callers often pass addresses that are already resolved; return them as-is
+    # instead of going through the constants/Token Research lookup.
+    if _is_evm_address(token_symbol):
+        return {
+            "symbol": token_symbol,
+            "address": token_symbol,
+            "address_evm": token_symbol,
+            "source": "address",
+            "status": "success",
+        }
+
+    symbol_upper = token_symbol.upper()
     try:
         result = resolve_token_address(token_symbol, chain)
         if result:
+            address_evm = result.get("address_evm")
             return {
-                "symbol": result.get("symbol", token_symbol.upper()),
-                "address": result.get("address") or result.get("address_evm"),
-                "address_evm": result.get("address_evm"),
+                "symbol": result.get("symbol", symbol_upper),
+                "address": result.get("address") or address_evm,
+                "address_evm": address_evm,
                 "address_hedera": result.get("address_hedera"),
                 "decimals": result.get("decimals", 18),
                 "source": result.get("source", "unknown"),
@@ -40,14 +62,14 @@ def resolve_token_for_liquidity(token_symbol: str, chain: str) -> dict[str, Any]
             }
         else:
             return {
-                "symbol": token_symbol.upper(),
+                "symbol": symbol_upper,
                 "address": None,
                 "status": "not_found",
                 "error": f"Token {token_symbol} not found on {chain}",
             }
     except Exception as e:
         return {
-            "symbol": token_symbol.upper(),
+            "symbol": symbol_upper,
             "address": None,
             "status": "error",
             "error": str(e),
@@ -11,15 +11,41 @@ temporarily can't match response events to their corresponding function call eve
 Execution continues normally despite these errors.
 """
 
+import io
 import json
+import logging
 import os
+import re
 import time
-import uuid
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from itertools import count
 
 import uvicorn
 from fastapi import FastAPI
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+try:
+    import orjson
+
+    # orjson parses bytes directly and serializes straight to bytes, so the
+    # middlewares never need the intermediate UTF-8 str
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+    def _json_dumps_pretty(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _json_dumps_pretty(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
 try:
     from ag_ui_adk import add_adk_fastapi_endpoint  # noqa: E402
 except ImportError:
@@ -30,9 +56,239 @@ except ImportError:
     ADKAgent = None
 
 from .agent import build_adk_orchestrator_agent  # noqa: E402
-from .core.constants import DEFAULT_PORT  # noqa: E402
-from .core.logger import log_agent_message, log_error, log_request, log_response  # noqa: E402
-from .core.payment_verifier import PaymentVerifier, PaymentVerificationError  # noqa: E402
+from .core.constants import (  # noqa: E402
+    DEFAULT_PORT,
+    MAX_LOG_BODY_BYTES,
+    get_enabled_agents,
+    get_enabled_chains,
+)
+from .core.instruction import build_orchestrator_instruction  # noqa: E402
+from .core.logger import (  # noqa: E402
+    log_agent_message,
+    log_error,
+    log_in_background,
+    log_request,
+    log_response,
+    logger,
+)
+from .core.paid_sessions import PaidSessions  # noqa: E402
+from .core.payment_verifier import (  # noqa: E402
+    PaymentVerificationError,
+    PaymentVerifier,
+    aclose_facilitator_client,
+    flush_transaction_checks,
+)
+
+
+# Payment requirements are static for the life of the process, so they are built (and
+# serialized for the prompt) once at import instead of on every unpaid request.
+# These must match what's sent to the frontend.
+# Resolved once at import; like paid sessions, changing it requires a restart.
+_HEDERA_FACILITATOR_ACCOUNT_ID = os.getenv("HEDERA_FACILITATOR_ACCOUNT_ID", "0.0.0")
+
+_PAYMENT_REQUIREMENTS = {
+    "scheme": "exact",
+    "network": "hedera-testnet",
+    "maxAmountRequired": "10000000",  # 0.1 HBAR in tinybars
+    "asset": "0.0.0",  # HBAR
+    "payTo": _HEDERA_FACILITATOR_ACCOUNT_ID,
+    "resource": "agent101-orchestrator",
+    "description": "Payment required for DeFi agent services",
+    "mimeType": "application/json",
+    "outputSchema": None,
+    "maxTimeoutSeconds": 60,
+    "extra": {
+        "feePayer": _HEDERA_FACILITATOR_ACCOUNT_ID,
+    },
+}
+
+# Payment requirements in x402 format, parsed by the frontend from the orchestrator response
+_X402_PAYMENT_REQUIREMENTS = {
+    "x402Version": 1,
+    "error": "Payment required to access this resource",
+    "accepts": [_PAYMENT_REQUIREMENTS],
+}
+_X402_PAYMENT_REQUIREMENTS_JSON = _json_dumps_pretty(_X402_PAYMENT_REQUIREMENTS)
+
+_PAYMENT_INSTRUCTION = f"""🚨🚨🚨 CRITICAL PAYMENT REQUIREMENT - READ THIS FIRST 🚨🚨🚨
+
+**THIS SESSION HAS NOT PAID YET. YOU MUST REQUEST PAYMENT BEFORE DOING ANYTHING ELSE.**
+
+**MANDATORY FIRST ACTION FOR THIS REQUEST:**
+1. IMMEDIATELY call 'gather_payment' tool/action FIRST (before any other tool call)
+2. DO NOT call gather_balance_requirements, gather_swap_requirements, or any other tool
+3. DO NOT call send_message_to_a2a_agent for any agent
+4. ONLY call gather_payment right now
+5. Tell the user: "Before I can help you, payment is required. Please complete the payment."
+
+**IF YOU CALL ANY OTHER TOOL BEFORE gather_payment, YOU ARE VIOLATING THE PAYMENT REQUIREMENT.**
+
+**THE USER'S REQUEST CAN WAIT - PAYMENT COMES FIRST.**
+
+After payment is completed, then you can proceed with the user's original request.
+
+**PAYMENT REQUIREMENTS (x402 FORMAT):**
+You MUST include the following payment requirements JSON in your response when calling gather_payment or when the user asks about payment:
+
+```json
+{_X402_PAYMENT_REQUIREMENTS_JSON}
+```
+
+This payment requirements JSON must be included in your response so the frontend can parse it and use it for payment processing.
+
+================================================================================
+
+"""
+
+_PAYMENT_REQUIREMENTS_MESSAGE = (
+    f"Payment Requirements (x402 format):\n```json\n{_X402_PAYMENT_REQUIREMENTS_JSON}\n```"
+)
+
+_PAYMENT_REQUIRED_USER_MESSAGE = (
+    "🚨 PAYMENT REQUIRED: Before I can process your request, you must complete payment. "
+    "Please call gather_payment action now."
+)
+
+# Sequence for injected message IDs; they only need to be unique, so a counter seeded
+# from the start time replaces a uuid4 (and its urandom read) per message
+_message_seq = count(int(time.time()))
+
+# Serialized content of the injected messages, used when splicing them into the raw body
+_PAYMENT_REQUIREMENTS_MESSAGE_JSON = _json_dumps(_PAYMENT_REQUIREMENTS_MESSAGE)
+_PAYMENT_REQUIRED_USER_MESSAGE_JSON = _json_dumps(_PAYMENT_REQUIRED_USER_MESSAGE)
+
+
+def _splice_first_message(body: bytes, first_message: bytes, replacement: bytes) -> bytes | None:
+    """
+    Replace the serialized first element of the messages array in a raw request body.
+
+    Returns None when the element can't be located unambiguously (e.g. the client
+    serialized it differently), in which case the caller re-encodes the whole body.
+    """
+    idx = body.find(first_message)
+    if idx < 1 or body[idx - 1 : idx] != b"[" or body.find(first_message, idx + 1) != -1:
+        return None
+    view = memoryview(body)
+    return b"".join((view[:idx], replacement, view[idx + len(first_message) :]))
+
+
+# Response content types that are streamed and must not be buffered for logging
+_STREAMING_CONTENT_TYPES = (b"text/event-stream", b"application/x-ndjson")
+
+
+def _append_capped(buffer: bytearray, chunk: bytes, limit: int) -> bool:
+    """Append chunk to buffer without growing it past limit; return True if chunk was cut."""
+    remaining = limit - len(buffer)
+    if len(chunk) <= remaining:
+        buffer.extend(chunk)
+        return False
+    if remaining > 0:
+        buffer.extend(memoryview(chunk)[:remaining])
+    return True
+
+
+_FIRST_NON_WHITESPACE = re.compile(rb"\S")
+_JSON_START_BYTES = frozenset(b'{["')
+
+
+def _looks_like_json(body: bytes | bytearray, raw_headers=()) -> bool:
+    """Cheap content-type and first-byte check so non-JSON bodies never reach the parser."""
+    for key, value in raw_headers:
+        if key == b"content-type":
+            if b"json" not in value:
+                return False
+            break
+    first = _FIRST_NON_WHITESPACE.search(body)
+    return first is not None and body[first.start()] in _JSON_START_BYTES
+
+
+def _decode_body_for_log(body: bytes | bytearray, truncated: bool = False, raw_headers=()):
+    """Decode a captured body for logging; truncated bodies are logged as raw text."""
+    if not body:
+        return None
+    if truncated:
+        return {"truncated": True, "body": body.decode("utf-8", errors="ignore")}
+    if _looks_like_json(body, raw_headers):
+        try:
+            return _json_loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+    return body.decode("utf-8", errors="ignore")
+
+
+async def _read_request_body(receive: Receive) -> tuple[bytes, list[Message]]:
+    """Read the whole request body; returns it with the messages read, for replaying."""
+    # Chunks are written to a BytesIO: appends are amortized O(1) and getvalue() hands
+    # over the buffer without the copy bytes(bytearray) makes
+    body_buffer = io.BytesIO()
+    captured_messages = []
+    while True:
+        message = await receive()
+        captured_messages.append(message)
+        if message["type"] == "http.request":
+            body = message.get("body")
+            if body:
+                body_buffer.write(body)
+            if not message.get("more_body", False):
+                break
+        elif message["type"] == "http.disconnect":
+            break
+    return body_buffer.getvalue(), captured_messages
+
+
+def _parse_request_body(body: bytes) -> dict | None:
+    """Parse a request body holding a JSON object; None for anything else."""
+    if not body:
+        return None
+    try:
+        body_json = _json_loads(body)
+    except ValueError:
+        return None
+    return body_json if isinstance(body_json, dict) else None
+
+
+def _replay_messages(messages: list[Message], receive: Receive) -> Receive:
+    """Receive callable that returns already read messages before reading new ones."""
+    pending = iter(messages)
+
+    async def replay() -> Message:
+        message = next(pending, None)
+        return message if message is not None else await receive()
+
+    return replay
+
+
+# Non-agent paths that never need payment tracking or request logging
+_SKIP_PATHS = frozenset(
+    (
+        "/health",
+        "/healthz",
+        "/metrics",
+        "/agent.json",
+        "/.well-known/agent.json",
+        "/docs",
+        "/openapi.json",
+        "/favicon.ico",
+    )
+)
+
+
+class PathSkipMiddleware:
+    """Route CORS preflights, health and metadata paths around payment tracking and logging."""
+
+    def __init__(self, app: ASGIApp, bypass_app: ASGIApp):
+        self.app = app
+        self.bypass_app = bypass_app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI application callable that dispatches skipped paths to the bare app."""
+        # method and path are required keys of an ASGI http scope
+        if scope["type"] == "http" and (
+            scope["method"] == "OPTIONS" or scope["path"] in _SKIP_PATHS
+        ):
+            await self.bypass_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
 
 class PaymentTrackingMiddleware:
@@ -40,7 +296,7 @@ class PaymentTrackingMiddleware:
 
     def __init__(self, app: ASGIApp):
         self.app = app
-        self.paid_sessions = set()  # Track sessions that have paid
+        self.paid_sessions = PaidSessions()  # Track sessions that have paid (LRU + TTL bounded)
         self.payment_verifier = PaymentVerifier()  # Initialize payment verifier
         print("✅ PaymentTrackingMiddleware initialized with payment verification")
 
@@ -50,127 +306,115 @@ class PaymentTrackingMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Extract headers
-        headers = dict(scope.get("headers", []))
-        path = scope.get("path", "/")
-        method = scope.get("method", "UNKNOWN")
+        path = scope["path"]
+        method = scope["method"]
 
         # Skip for non-agent paths
-        if path in ["/health", "/agent.json", "/.well-known/agent.json", "/docs", "/openapi.json"]:
+        if path in _SKIP_PATHS:
             await self.app(scope, receive, send)
             return
 
-        # Check for X-PAYMENT header
+        # Single pass over the raw headers for the two we need (ASGI header names are
+        # already lower-cased)
         x_payment_header = None
-        for key, value in headers.items():
-            if key.lower() == b"x-payment":
+        header_session_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-payment":
                 x_payment_header = value.decode("utf-8")
-                break
-
-        # Extract session ID from request body and capture all messages
-        request_body = b""
-        captured_messages = []
-
-        async def receive_and_capture() -> Message:
-            nonlocal request_body
-            message = await receive()
-            captured_messages.append(message)
-            if message["type"] == "http.request" and "body" in message:
-                request_body += message.get("body", b"")
-            return message
-
-        # Read all request messages
-        while True:
-            msg = await receive_and_capture()
-            if msg["type"] == "http.request" and not msg.get("more_body", False):
-                break
-            if msg["type"] == "http.disconnect":
-                break
-
-        session_id = None
-        if request_body:
-            try:
-                body_json = json.loads(request_body.decode("utf-8"))
-                session_id = (
-                    body_json.get("threadId")
-                    or body_json.get("session_id")
-                    or body_json.get("sessionId")
-                )
-            except:
-                pass
+            elif key == b"x-session-id":
+                header_session_id = value.decode("utf-8")
 
-        # Check payment status
-        is_session_paid = session_id in self.paid_sessions if session_id else False
+        # Verify the X-PAYMENT header first; it does not depend on the request body
         is_valid_payment = False
         payment_verification_result = None
 
         # If X-PAYMENT header is present, verify it
         if x_payment_header and x_payment_header != "testing" and len(x_payment_header) > 10:
-            # Define payment requirements (should match what's sent to frontend)
-            payment_requirements = {
-                "scheme": "exact",
-                "network": "hedera-testnet",
-                "maxAmountRequired": "10000000",  # 0.1 HBAR in tinybars
-                "asset": "0.0.0",  # HBAR
-                "payTo": os.getenv("HEDERA_FACILITATOR_ACCOUNT_ID", "0.0.0"),
-                "resource": "agent101-orchestrator",
-                "description": "Payment required for DeFi agent services",
-                "mimeType": "application/json",
-                "outputSchema": None,
-                "maxTimeoutSeconds": 60,
-                "extra": {
-                    "feePayer": os.getenv("HEDERA_FACILITATOR_ACCOUNT_ID", "0.0.0"),
-                },
-            }
-
             # Verify payment
             try:
-                payment_verification_result = self.payment_verifier.verify_payment_header(
-                    x_payment_header, payment_requirements
+                # Awaited, so the facilitator round trip doesn't block the event loop
+                payment_verification_result = await self.payment_verifier.verify_payment_header(
+                    x_payment_header, _PAYMENT_REQUIREMENTS
                 )
                 is_valid_payment = payment_verification_result.get("isValid", False)
 
-                if is_valid_payment:
-                    print("   ✅ Payment verification: VALID")
-                else:
-                    invalid_reason = payment_verification_result.get("invalidReason", "unknown")
-                    print(f"   ❌ Payment verification: INVALID - {invalid_reason}")
+                if not is_valid_payment:
+                    logger.warning(
+                        "Payment verification INVALID: %s",
+                        payment_verification_result.get("invalidReason", "unknown"),
+                    )
             except Exception as e:
-                print(f"   ⚠️  Payment verification error: {e}")
+                logger.warning("Payment verification error: %s", e)
                 is_valid_payment = False
 
-        print("=" * 80)
-        print(f"💰 PAYMENT TRACKING - {method} {path}")
-        print(
-            f"   Session ID: {session_id[:30] + '...' if session_id and len(session_id) > 30 else session_id or 'None'}"
-        )
-        print(f"   X-PAYMENT header: {'Present' if x_payment_header else 'Missing'}")
-        print(f"   Payment verified: {'✅ VALID' if is_valid_payment else '❌ INVALID' if x_payment_header else 'N/A'}")
-        print(f"   Session paid: {is_session_paid}")
-        print(f"   Paid sessions count: {len(self.paid_sessions)}")
+        # Fast path: when the client names an already paid session in a header, the body is
+        # never buffered or rewritten. A request that pays takes the full path, so the
+        # session marked paid is the body's threadId the agent runs under, not the header's
+        if header_session_id and not is_valid_payment and header_session_id in self.paid_sessions:
+            await self.app(scope, receive, send)
+            return
+
+        # Extract session ID from request body and capture all messages. When
+        # LoggingMiddleware has already read and parsed the body, it is taken from scope
+        # state, and the single message LoggingMiddleware replays it as is captured
+        shared_state = scope.get("state", {})
+        if "request_body" in shared_state:
+            request_body = shared_state["request_body"]
+            body_json = shared_state["request_body_json"]
+            captured_messages = [await receive()]
+        else:
+            request_body, captured_messages = await _read_request_body(receive)
+            body_json = _parse_request_body(request_body)
+
+        session_id = None
+        if body_json is not None:
+            session_id = (
+                body_json.get("threadId")
+                or body_json.get("session_id")
+                or body_json.get("sessionId")
+            )
+
+        # Check payment status
+        is_session_paid = session_id in self.paid_sessions if session_id else False
 
         # Mark session as paid if payment is verified
         if is_valid_payment and session_id:
             self.paid_sessions.add(session_id)
-            print("   ✅ Session marked as PAID (verified)")
 
         # Determine payment status
         # Only mark as paid if payment is verified OR session was previously verified
         payment_status = "paid" if (is_valid_payment or is_session_paid) else "unpaid"
-        print(f"   Payment status: {payment_status.upper()}")
-        
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "💰 Payment tracking: method=%s path=%s session=%.30s header=%s verified=%s "
+                "session_paid=%s status=%s paid_sessions=%d",
+                method,
+                path,
+                session_id or "-",
+                bool(x_payment_header),
+                is_valid_payment,
+                is_session_paid,
+                payment_status,
+                len(self.paid_sessions),
+            )
+
         # If payment header is present but invalid, log warning
         if x_payment_header and not is_valid_payment and not is_session_paid:
-            print(f"   ⚠️  WARNING: Invalid payment header detected but not blocking request")
-            print(f"   ⚠️  This may indicate a security issue - payment verification failed")
+            logger.warning(
+                "Invalid payment header detected but not blocking request - "
+                "this may indicate a security issue (payment verification failed)"
+            )
 
         # Modify captured messages to inject payment requirement if unpaid
-        if payment_status == "unpaid" and request_body:
+        if payment_status == "unpaid" and body_json is not None:
+            modified_body = None
             try:
-                body_json = json.loads(request_body.decode("utf-8"))
-
                 # Inject a system message BEFORE the user message that instructs payment requirement
                 if "messages" in body_json and isinstance(body_json["messages"], list):
+                    # Copied before modifying; LoggingMiddleware may log the parsed body it
+                    # shared, which has to stay what the client sent
+                    body_json = {**body_json, "messages": list(body_json["messages"])}
                     # Find the system message index
                     system_message_idx = None
                     for i, msg in enumerate(body_json["messages"]):
@@ -180,74 +424,24 @@ class PaymentTrackingMiddleware:
 
                     # Modify the system message to include payment requirement at the very top
                     if system_message_idx is not None:
-                        system_msg = body_json["messages"][system_message_idx]
+                        system_msg = dict(body_json["messages"][system_message_idx])
                         original_content = system_msg.get("content", "")
-
-                        # Create payment requirements in x402 format
-                        # These will be parsed by the frontend from the orchestrator response
-                        payment_requirements = {
-                            "x402Version": 1,
-                            "error": "Payment required to access this resource",
-                            "accepts": [
-                                {
-                                    "scheme": "exact",
-                                    "network": "hedera-testnet",
-                                    "maxAmountRequired": "10000000",  # 0.1 HBAR in tinybars
-                                    "asset": "0.0.0",  # HBAR
-                                    "payTo": os.getenv("HEDERA_FACILITATOR_ACCOUNT_ID", "0.0.0"),
-                                    "resource": "agent101-orchestrator",
-                                    "description": "Payment required for DeFi agent services",
-                                    "mimeType": "application/json",
-                                    "outputSchema": None,
-                                    "maxTimeoutSeconds": 60,
-                                    "extra": {
-                                        "feePayer": os.getenv(
-                                            "HEDERA_FACILITATOR_ACCOUNT_ID", "0.0.0"
-                                        ),
-                                    },
-                                }
-                            ],
-                        }
+                        # The injected messages land right after a leading system message, so
+                        # only that element of the raw body has to be rewritten
+                        original_system_bytes = (
+                            _json_dumps(system_msg) if system_message_idx == 0 else None
+                        )
 
                         # Prepend payment requirement to system message - MAKE IT EXTREMELY PROMINENT
-                        payment_instruction = f"""🚨🚨🚨 CRITICAL PAYMENT REQUIREMENT - READ THIS FIRST 🚨🚨🚨
-
-**THIS SESSION HAS NOT PAID YET. YOU MUST REQUEST PAYMENT BEFORE DOING ANYTHING ELSE.**
-
-**MANDATORY FIRST ACTION FOR THIS REQUEST:**
-1. IMMEDIATELY call 'gather_payment' tool/action FIRST (before any other tool call)
-2. DO NOT call gather_balance_requirements, gather_swap_requirements, or any other tool
-3. DO NOT call send_message_to_a2a_agent for any agent
-4. ONLY call gather_payment right now
-5. Tell the user: "Before I can help you, payment is required. Please complete the payment."
-
-**IF YOU CALL ANY OTHER TOOL BEFORE gather_payment, YOU ARE VIOLATING THE PAYMENT REQUIREMENT.**
-
-**THE USER'S REQUEST CAN WAIT - PAYMENT COMES FIRST.**
-
-After payment is completed, then you can proceed with the user's original request.
-
-**PAYMENT REQUIREMENTS (x402 FORMAT):**
-You MUST include the following payment requirements JSON in your response when calling gather_payment or when the user asks about payment:
-
-```json
-{json.dumps(payment_requirements, indent=2)}
-```
-
-This payment requirements JSON must be included in your response so the frontend can parse it and use it for payment processing.
-
-================================================================================
-
-"""
-                        system_msg["content"] = payment_instruction + original_content
+                        system_msg["content"] = _PAYMENT_INSTRUCTION + original_content
                         body_json["messages"][system_message_idx] = system_msg
 
                         # Also store payment requirements in a way the agent can access
                         # Add payment requirements as a separate assistant message that the agent can reference
                         payment_req_msg = {
-                            "id": f"payment-requirements-{uuid.uuid4().hex[:8]}",
+                            "id": f"payment-requirements-{next(_message_seq):08x}",
                             "role": "assistant",
-                            "content": f"Payment Requirements (x402 format):\n```json\n{json.dumps(payment_requirements, indent=2)}\n```",
+                            "content": _PAYMENT_REQUIREMENTS_MESSAGE,
                         }
                         # Insert after system message, before payment user message
                         body_json["messages"].insert(1, payment_req_msg)
@@ -255,23 +449,46 @@ This payment requirements JSON must be included in your response so the frontend
                         # ALSO inject a user message that explicitly requires payment
                         # Insert it right after the system message, before the actual user message
                         payment_user_msg = {
-                            "id": f"payment-required-{uuid.uuid4().hex[:8]}",
+                            "id": f"payment-required-{next(_message_seq):08x}",
                             "role": "user",
-                            "content": "🚨 PAYMENT REQUIRED: Before I can process your request, you must complete payment. Please call gather_payment action now.",
+                            "content": _PAYMENT_REQUIRED_USER_MESSAGE,
                         }
                         # Insert after system message (index 0 typically)
                         body_json["messages"].insert(1, payment_user_msg)
 
-                        # Log what we injected
-                        print("   ✅ Injected PAYMENT REQUIRED into system message")
-                        print("   ✅ Injected payment requirement user message")
-                        print(f"   System message length: {len(system_msg['content'])} chars")
-                        print(f"   Total messages: {len(body_json['messages'])}")
+                        if original_system_bytes is not None:
+                            replacement = b",".join(
+                                (
+                                    _json_dumps(system_msg),
+                                    b'{"id":"%s","role":"user","content":%s}'
+                                    % (
+                                        payment_user_msg["id"].encode(),
+                                        _PAYMENT_REQUIRED_USER_MESSAGE_JSON,
+                                    ),
+                                    b'{"id":"%s","role":"assistant","content":%s}'
+                                    % (
+                                        payment_req_msg["id"].encode(),
+                                        _PAYMENT_REQUIREMENTS_MESSAGE_JSON,
+                                    ),
+                                )
+                            )
+                            modified_body = _splice_first_message(
+                                request_body, original_system_bytes, replacement
+                            )
+
+                        logger.debug(
+                            "Injected payment requirement: system message %d chars, %d messages",
+                            len(system_msg["content"]),
+                            len(body_json["messages"]),
+                        )
                     else:
-                        print("   ⚠️ No system message found in messages array")
+                        logger.debug("No system message found in messages array")
 
-                # Rebuild request body with payment requirement
-                modified_body = json.dumps(body_json).encode("utf-8")
+                # Rebuild request body with payment requirement, re-encoding the whole
+                # conversation only when the injected messages couldn't be spliced in
+                if modified_body is None:
+                    modified_body = _json_dumps(body_json)
+                request_body = modified_body
 
                 # Replace the body in captured messages
                 for i, msg in enumerate(captured_messages):
@@ -284,12 +501,7 @@ This payment requirements JSON must be included in your response so the frontend
                         break
 
             except Exception as e:
-                print(f"   ⚠️ Error injecting payment requirement: {e}")
-                import traceback
-
-                traceback.print_exc()
-
-        print("=" * 80)
+                logger.exception("Error injecting payment requirement: %s", e)
 
         # Replay captured messages
         message_index = 0
@@ -306,11 +518,127 @@ This payment requirements JSON must be included in your response so the frontend
         await self.app(scope, receive_replay, send)
 
 
+# Decoded header names; the same few names recur on every request. The size cap keeps
+# arbitrary client-supplied names from growing it without bound.
+_HEADER_NAME_CACHE: dict[bytes, str] = {}
+_HEADER_NAME_CACHE_MAX = 256
+
+
+def _decode_header_name(name: bytes) -> str:
+    decoded = _HEADER_NAME_CACHE.get(name)
+    if decoded is None:
+        decoded = name.decode("latin-1")
+        if len(_HEADER_NAME_CACHE) < _HEADER_NAME_CACHE_MAX:
+            _HEADER_NAME_CACHE[name] = decoded
+    return decoded
+
+
+def _headers_for_log(raw_headers) -> dict[str, str] | None:
+    """Convert raw ASGI headers to a str dict for logging."""
+    if not raw_headers:
+        return None
+    return {_decode_header_name(k): v.decode("latin-1") for k, v in raw_headers}
+
+
+# The two functions below run on the background log queue, so body decoding and log
+# formatting happen after the request/response step instead of in front of it
+
+
+def _log_captured_request(method, path, raw_headers, body, truncated, body_json=None) -> None:
+    if body_json is None:
+        body_json = _decode_body_for_log(body, truncated, raw_headers)
+    log_request(method=method, path=path, headers=_headers_for_log(raw_headers), body=body_json)
+
+
+def _log_captured_response(status, raw_headers, body, truncated, response_time_ms) -> None:
+    log_response(
+        status_code=status or 200,
+        headers=_headers_for_log(raw_headers) or {},
+        body=_decode_body_for_log(body, truncated, raw_headers) if body is not None else None,
+        response_time_ms=response_time_ms,
+    )
+
+
+class _ResponseCapturer:
+    """Send wrapper that buffers the response body and logs the response once it completes."""
+
+    __slots__ = (
+        "send",
+        "start_ns",
+        "status",
+        "raw_headers",
+        "body",
+        "capture_body",
+        "max_bytes",
+        "truncated",
+        "logged",
+    )
+
+    def __init__(self, send: Send, start_ns: int, max_bytes: int, logged: bool = True):
+        self.send = send
+        self.start_ns = start_ns
+        self.status = None
+        self.raw_headers = ()
+        self.body = bytearray()
+        # A max_bytes of 0 means body logging is off
+        self.capture_body = max_bytes > 0
+        self.max_bytes = max_bytes
+        self.truncated = False
+        # False for requests left out by sampling; an error status logs them anyway
+        self.logged = logged
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            if not self.logged:
+                self.logged = self.status >= 400
+                self.capture_body = self.capture_body and self.logged
+            # Kept raw; headers are only decoded by the background log worker
+            raw_headers = self.raw_headers = message.get("headers", ())
+            # Streaming (AG-UI SSE) responses are never buffered; only status,
+            # headers and duration are logged once the stream ends
+            for key, value in raw_headers:
+                if key == b"content-type" and value.startswith(_STREAMING_CONTENT_TYPES):
+                    self.capture_body = False
+                    break
+        elif message["type"] == "http.response.body":
+            body = message.get("body")
+            if body and self.capture_body and not self.truncated:
+                self.truncated = _append_capped(self.body, body, self.max_bytes)
+            if not message.get("more_body", False):
+                # Response complete: hand the last chunk to the client first, then queue
+                # the log so decoding it isn't on the client's critical path
+                response_time_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
+                await self.send(message)
+                if not self.logged:
+                    return
+                log_in_background(
+                    _log_captured_response,
+                    self.status,
+                    self.raw_headers,
+                    self.body if self.capture_body else None,
+                    self.truncated,
+                    response_time_ms,
+                )
+                return
+        await self.send(message)
+
+
 class LoggingMiddleware:
     """Middleware to log all requests and responses using ASGI protocol."""
 
     def __init__(self, app: ASGIApp):
         self.app = app
+        # Body logging is opt-in (LOG_BODIES=1) and capped at LOG_BODY_MAX bytes;
+        # otherwise only method, path, headers, status and timing are logged
+        self.max_body_bytes = (
+            int(os.getenv("LOG_BODY_MAX", MAX_LOG_BODY_BYTES))
+            if os.getenv("LOG_BODIES") == "1"
+            else 0
+        )
+        # LOG_SAMPLE=N logs one request in N; error responses are always logged
+        self.sample_every = max(1, int(os.getenv("LOG_SAMPLE", "1")))
+        self.request_count = count()
         print("✅ LoggingMiddleware initialized")
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
@@ -319,86 +647,63 @@ class LoggingMiddleware:
             await self.app(scope, receive, send)
             return
 
-        start_time = time.time()
-        request_body = b""
-        request_body_complete = False
-
-        # Extract method and path from scope for logging
-        method = scope.get("method", "UNKNOWN")
-        path = scope.get("path", "/")
-        headers = dict(scope.get("headers", []))
-
-        print(f"📝 LoggingMiddleware: Processing {method} {path}")
-
-        # Wrap receive to capture request body
-        async def receive_wrapper() -> Message:
-            nonlocal request_body, request_body_complete
-            message = await receive()
-            if message["type"] == "http.request":
-                if "body" in message:
-                    request_body += message.get("body", b"")
-                if not message.get("more_body", False):
-                    request_body_complete = True
-                    # Log request once body is complete
-                    try:
-                        body_json = (
-                            json.loads(request_body.decode("utf-8")) if request_body else None
-                        )
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        body_json = (
-                            request_body.decode("utf-8", errors="ignore") if request_body else None
-                        )
-
-                    log_request(
-                        method=method,
-                        path=path,
-                        headers={k.decode(): v.decode() for k, v in headers.items()}
-                        if headers
-                        else None,
-                        body=body_json,
-                    )
-            return message
-
-        # Wrap send to capture response
-        response_status = None
-        response_headers = {}
-        response_body = b""
-        response_started = False
-
-        async def send_wrapper(message: Message) -> None:
-            nonlocal response_status, response_headers, response_body, response_started
-            if message["type"] == "http.response.start":
-                response_status = message["status"]
-                response_headers = {k.decode(): v.decode() for k, v in message.get("headers", [])}
-                response_started = True
-            elif message["type"] == "http.response.body":
-                if "body" in message:
-                    response_body += message.get("body", b"")
-                if not message.get("more_body", False):
-                    # Response complete, log it
-                    response_time_ms = (time.time() - start_time) * 1000
-                    try:
-                        response_body_json = (
-                            json.loads(response_body.decode("utf-8")) if response_body else None
-                        )
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        response_body_json = (
-                            response_body.decode("utf-8", errors="ignore")
-                            if response_body
-                            else None
-                        )
+        # Read once; method, path and headers are required keys of an ASGI http scope
+        method = scope["method"]
+        path = scope["path"]
+        if method == "OPTIONS" or path in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
-                    log_response(
-                        status_code=response_status or 200,
-                        headers=response_headers,
-                        body=response_body_json,
-                        response_time_ms=response_time_ms,
-                    )
-            await send(message)
+        # Monotonic clock, so NTP adjustments can't produce negative durations
+        start_ns = time.perf_counter_ns()
+
+        logger.debug("📝 LoggingMiddleware: Processing %s %s", method, path)
+
+        # Resolved once per request; when INFO is off receive and send are passed
+        # through untouched and nothing is buffered or parsed
+        app_receive = receive
+        app_send = send
+        if logger.isEnabledFor(logging.INFO):
+            sampled = next(self.request_count) % self.sample_every == 0
+            raw_headers = scope["headers"]
+            max_body_bytes = self.max_body_bytes
+            if not sampled:
+                # Only the response is watched, in case it turns out to be an error
+                pass
+            elif not max_body_bytes:
+                # Without body logging the request is logged up front and receive is not
+                # wrapped
+                log_in_background(_log_captured_request, method, path, raw_headers, None, False)
+            else:
+                # The body is read and parsed once here and shared with
+                # PaymentTrackingMiddleware through scope["state"]; the log keeps the body
+                # the client sent, not the one rewritten for the agent
+                request_body, captured_messages = await _read_request_body(receive)
+                body_json = None
+                if captured_messages[-1]["type"] == "http.request":
+                    body_json = _parse_request_body(request_body)
+                    state = scope.setdefault("state", {})
+                    state["request_body"] = request_body
+                    state["request_body_json"] = body_json
+                    captured_messages = [
+                        {"type": "http.request", "body": request_body, "more_body": False}
+                    ]
+                app_receive = _replay_messages(captured_messages, receive)
+                truncated = len(request_body) > max_body_bytes
+                log_in_background(
+                    _log_captured_request,
+                    method,
+                    path,
+                    raw_headers,
+                    request_body[:max_body_bytes] if truncated else request_body,
+                    truncated,
+                    None if truncated else body_json,
+                )
+            app_send = _ResponseCapturer(send, start_ns, max_body_bytes, sampled)
 
         # Process request
         try:
-            await self.app(scope, receive_wrapper, send_wrapper)
+            await self.app(scope, app_receive, app_send)
         except Exception as e:
             # Suppress known ADK background execution errors (non-fatal)
             error_msg = str(e)
@@ -413,50 +718,96 @@ class LoggingMiddleware:
                 pass
             else:
                 # Log other errors normally
-                path = scope.get("path", "/")
                 log_error(e, context=f"Request to {path}")
                 raise
 
 
-def create_app() -> FastAPI:
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Let queued on-chain transaction checks finish before the server exits, then close
+    # the HTTP client they and the facilitator calls share
+    await flush_transaction_checks()
+    await aclose_facilitator_client()
+
+
+def create_app() -> ASGIApp:
     """Create FastAPI application with orchestrator agent."""
     if add_adk_fastapi_endpoint is None:
         raise ImportError(
             "ag_ui_adk is required. Install with: uv pip install ag-ui-adk or make backend-install"
         )
 
-    app = FastAPI(title="DeFi Orchestrator (ADK)")
+    inner_app = FastAPI(title="DeFi Orchestrator (ADK)", lifespan=_lifespan)
 
     adk_orchestrator_agent = build_adk_orchestrator_agent()
-    add_adk_fastapi_endpoint(app, adk_orchestrator_agent, path="/")
+    add_adk_fastapi_endpoint(inner_app, adk_orchestrator_agent, path="/")
 
-    # Wrap app with middleware in order: PaymentTracking first, then Logging
-    # Payment tracking monitors payment status and injects header for agent
-    # Logging logs all requests and responses
-    app = LoggingMiddleware(PaymentTrackingMiddleware(app))
+    # Wrap app with middleware in order: Logging first, then PaymentTracking
+    # Logging logs all requests and responses, timing and error handling included payment
+    # tracking; when it reads the body it shares the parse through scope["state"]
+    # Payment tracking monitors payment status and injects the payment requirement for
+    # the agent, reusing the body parsed by logging
+    # Health checks and static agent metadata skip both and go straight to FastAPI
+    app = PathSkipMiddleware(LoggingMiddleware(PaymentTrackingMiddleware(inner_app)), inner_app)
 
     return app
 
 
-app = create_app()
+class _LazyApp:
+    """ASGI app that builds the real application on its first call (uvicorn's lifespan startup)."""
+
+    __slots__ = ("factory", "_app")
+
+    def __init__(self, factory: Callable[[], ASGIApp]):
+        self.factory = factory
+        self._app = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # The factory is synchronous, so two calls can't both see _app unset; no lock needed
+        app = self._app
+        if app is None:
+            app = self._app = self.factory()
+        await app(scope, receive, send)
+
+
+# Importing the module (tests, uvicorn --reload) no longer builds the agent
+app = _LazyApp(create_app)
 
 
 def main():
     """Main entry point for orchestrator server."""
-    if not os.getenv("GOOGLE_API_KEY") and not os.getenv("GEMINI_API_KEY"):
+    env = os.environ
+    if not (env.get("GOOGLE_API_KEY") or env.get("GEMINI_API_KEY")):
         print("⚠️  Warning: GOOGLE_API_KEY environment variable not set!")
         print("   Set it with: export GOOGLE_API_KEY='your-key-here'")
         print("   Get a key from: https://aistudio.google.com/app/apikey")
         print()
 
     # Railway uses PORT env var, fallback to ORCHESTRATOR_PORT or DEFAULT_PORT
-    port = int(os.getenv("PORT", os.getenv("ORCHESTRATOR_PORT", DEFAULT_PORT)))
+    port = int(env.get("PORT") or env.get("ORCHESTRATOR_PORT") or DEFAULT_PORT)
     print(f"🚀 Starting Orchestrator Agent (ADK + AG-UI) on http://0.0.0.0:{port}")
     print("   Payment tracking: Active (sessions cleared on restart)")
+    # Full prompt size for this deployment, so prompt growth shows up in the startup log
+    instruction = build_orchestrator_instruction(get_enabled_agents(), get_enabled_chains())
+    print(f"   Instruction: {len(instruction.encode('utf-8'))} bytes (full prompt)")
     log_agent_message(
         "Orchestrator Agent started with payment tracking - All requests require payment on first interaction"
     )
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvicorn's default "auto" loop and http settings pick uvloop and httptools when
+    # uvicorn[standard] installed them (uvloop is not available on Windows); the access log
+    # is disabled and uvicorn's own logging limited to warnings because LoggingMiddleware
+    # already logs every request and the startup line is printed above
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        access_log=False,
+        log_level="warning",
+        # The app is built during lifespan startup; "on" makes a failed build stop the
+        # server instead of being logged as an unsupported lifespan and ignored
+        lifespan="on",
+    )
 
 
 if __name__ == "__main__":
@@ -4,12 +4,16 @@ Orchestrator Agent Definition
 Defines the OrchestratorAgent class.
 """
 
+from collections.abc import Callable
+from functools import cache
+
 try:
     from ag_ui_adk import ADKAgent  # noqa: E402
 except ImportError:
     ADKAgent = None  # type: ignore
 
 from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.readonly_context import ReadonlyContext
 
 from .core.constants import (
     AGENT_NAME,
@@ -17,24 +21,53 @@ from .core.constants import (
     DEFAULT_SESSION_TIMEOUT,  # noqa: E402
     DEFAULT_USER_ID,  # noqa: E402
     check_api_keys,  # noqa: E402
+    get_enabled_agents,  # noqa: E402
+    get_enabled_chains,  # noqa: E402
     get_model_name,  # noqa: E402
 )
-from .core.instruction import ORCHESTRATOR_INSTRUCTION  # noqa: E402
+from .core.instruction import build_instruction  # noqa: E402
+from .core.routing import classify_intents  # noqa: E402
+
+
+def _content_text(content) -> str:
+    if not content or not content.parts:
+        return ""
+    return " ".join(part.text for part in content.parts if part.text)
+
+
+def make_instruction_provider(
+    enabled_agents: frozenset[str], enabled_chains: frozenset[str]
+) -> Callable[[ReadonlyContext], str]:
+    """Instruction provider: the prompt sections needed for the session's user messages."""
+
+    def orchestrator_instruction(context: ReadonlyContext) -> str:
+        # Intents of every user turn so far, not just the latest: a follow-up in the middle
+        # of a workflow ("my wallet address is 0.0.1234" during a swap) keeps the sections
+        # of the workflow an earlier turn started. classify_intents caches per message
+        intents = classify_intents(_content_text(context.user_content))
+        for event in context.session.events:
+            if event.author == "user":
+                intents |= classify_intents(_content_text(event.content))
+        return build_instruction(intents, enabled_agents, enabled_chains)
+
+    return orchestrator_instruction
 
 
+@cache
 def build_orchestrator_agent() -> LlmAgent:
-    """Build and configure the orchestrator LLM agent."""
+    """Build and configure the orchestrator LLM agent (built once per process)."""
     model_name = get_model_name()
     check_api_keys()
     return LlmAgent(
         name=AGENT_NAME,
         model=model_name,
-        instruction=ORCHESTRATOR_INSTRUCTION,
+        instruction=make_instruction_provider(get_enabled_agents(), get_enabled_chains()),
     )
 
 
+@cache
 def build_adk_orchestrator_agent() -> ADKAgent:
-    """Build ADK agent wrapper for AG-UI Protocol."""
+    """Build ADK agent wrapper for AG-UI Protocol (built once per process)."""
     if ADKAgent is None:
         raise ImportError(
             "ag_ui_adk is not installed. Install it with: uv pip install ag-ui-adk or make backend-install"
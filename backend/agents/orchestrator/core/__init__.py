@@ -1,14 +1,25 @@
 """
 Core module for Orchestrator Agent.
 
-Contains constants, instruction, and logging utilities.
+Contains agent cards, constants, instruction, routing, and logging utilities.
 """
 
+from .agent_cards import AGENT_CARDS, AgentCard, render_cards  # noqa: F401
 from .constants import *  # noqa: F403, F401
-from .instruction import ORCHESTRATOR_INSTRUCTION  # noqa: F401
+from .instruction import build_instruction, build_orchestrator_instruction  # noqa: F401
 from .logger import (  # noqa: F401
     log_agent_message,
     log_error,
     log_request,
     log_response,
 )
+from .routing import classify_intents, nearest_intent, route_intent  # noqa: F401
+
+
+def __getattr__(name: str) -> str:
+    # Forwarded so the full prompt is only built when it is first used
+    if name == "ORCHESTRATOR_INSTRUCTION":
+        from . import instruction
+
+        return instruction.ORCHESTRATOR_INSTRUCTION
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
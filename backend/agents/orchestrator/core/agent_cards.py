@@ -0,0 +1,184 @@
+"""
+Agent cards for Orchestrator Agent.
+
+Registry of the A2A agents the orchestrator delegates to: the name each one is
+registered under, what it does and how to query it. Rendered into the
+instruction's agent list and read by the router.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+
+
+@dataclass(frozen=True, slots=True)
+class AgentCard:
+    """What an A2A agent does and how the orchestrator should query it."""
+
+    # Name the agent is registered under (its A2A card name), as passed to
+    # send_message_to_a2a_agent
+    name: str
+    capabilities: tuple[str, ...]
+    query_formats: tuple[str, ...]
+    examples: tuple[str, ...]
+    notes: tuple[str, ...] = ()
+
+
+# Cards keyed by the intent each agent serves (see routing.py), in prompt order
+AGENT_CARDS: Final[dict[str, AgentCard]] = {
+    "balance": AgentCard(
+        name="Balance Agent",
+        capabilities=(
+            "Fetches account balances for one chain or all chains",
+            "Provides comprehensive balance data including native token balances, token "
+            "balances, and USD values",
+            'Handles a specific token on a specific chain ("get USDT on Ethereum"), a token '
+            'across all chains ("get USDT balance") and popular tokens ("get popular '
+            'tokens" fetches trending tokens and returns their balances)',
+        ),
+        query_formats=(
+            "Get balance for [account_address] on [chain]",
+            "Get balance for [account_address]",
+            "Get [token_symbol] balance on [chain]",
+            "Get [token_symbol] balance",
+        ),
+        examples=(
+            "Get balance for 0x1234... on ethereum",
+            "Get balance for 0.0.123456 on hedera",
+            "get USDT on Ethereum",
+            "get USDT balance",
+            "get popular tokens",
+            "check USDC on Polygon",
+        ),
+        notes=(
+            "**CRITICAL**: Use Balance Agent for ALL balance-related queries, NOT Sentiment Agent",
+            "**NOTE**: If a token is not found in configuration, use Token Research to search "
+            "for token addresses",
+        ),
+    ),
+    "liquidity": AgentCard(
+        name="LiquidityFinder",
+        capabilities=(
+            "Fetches liquidity for one chain or all chains",
+            'Supports both token pair queries (e.g., "ETH/USDT") and general chain queries',
+            "Provides comprehensive liquidity data including pool addresses, DEX names, TVL, "
+            "reserves, liquidity, and slot0 data",
+            "Returns combined results from all queried chains in a single response",
+        ),
+        query_formats=("Get liquidity for [token_pair]", "Get liquidity on [chain]"),
+        examples=(
+            "Get liquidity for ETH/USDT",
+            "Find liquidity pools for HBAR/USDC",
+            "Get liquidity on Polygon",
+        ),
+    ),
+    "swap": AgentCard(
+        name="Swap Agent",
+        capabilities=(
+            "Handles token swaps on a supported chain",
+            "Supports swapping any tokens - automatically resolves token addresses using Token "
+            "Research if not in constants",
+            "Common tokens include: USDC, USDT, HBAR, MATIC, ETH, WBTC, DAI, but any token can "
+            "be swapped",
+            "Creates swap transactions and tracks their status",
+            "Returns swap configuration with transaction details",
+        ),
+        query_formats=("Swap [amount] [token_in] to [token_out] on [chain] for [account_address]",),
+        examples=(
+            "Swap 0.1 HBAR to USDC on hedera for 0.0.123456",
+            "Swap 10 USDC to ETH on ethereum for 0x1234...",
+        ),
+    ),
+    "sentiment": AgentCard(
+        name="Sentiment Agent",
+        capabilities=(
+            "Provides cryptocurrency sentiment analysis using Santiment API",
+            "Supports sentiment balance, social volume, social dominance, trending words, and "
+            "social shifts",
+            "Returns sentiment analysis data including metrics and insights",
+        ),
+        query_formats=(
+            "Get sentiment balance for [asset] over [days] days",
+            "Get social volume for [asset]",
+        ),
+        examples=(
+            "Get sentiment balance for Bitcoin over the last week",
+            "How many times has Ethereum been mentioned on social media?",
+            "What are the top 3 trending words in crypto?",
+            "How dominant is Ethereum in social media discussions?",
+        ),
+        notes=(
+            "**CRITICAL**: Use Sentiment Agent ONLY for sentiment/social analysis queries, NOT "
+            "for token, account or wallet balances (use Balance Agent instead)",
+        ),
+    ),
+    "trading": AgentCard(
+        name="Trading Agent",
+        capabilities=(
+            "Provides intelligent buy/sell recommendations for BTC and ETH",
+            "Combines technical analysis (RSI, MACD, Moving Averages), sentiment analysis, and "
+            "ML predictions",
+            "Returns buy/sell/hold recommendation with entry price, stop loss, targets, "
+            "confidence, and reasoning",
+        ),
+        query_formats=(
+            "Should I buy or sell [BTC/ETH]?",
+            "Get trading recommendation for [BTC/ETH]",
+        ),
+        examples=(
+            "Should I buy Bitcoin?",
+            "What's the trading recommendation for Ethereum?",
+            "Is it a good time to sell BTC?",
+            "Should I buy or sell ETH now?",
+        ),
+        notes=("Only supports Bitcoin (BTC) and Ethereum (ETH)",),
+    ),
+    "research": AgentCard(
+        name="Token Research",
+        capabilities=(
+            "Discovers and searches for tokens on one chain or all chains",
+            "Searches for token contract addresses using CoinGecko API and web search",
+            "Discovers popular/trending tokens and maps them across chains",
+            "Returns token information including contract addresses, chain mappings, market "
+            "cap rank, and decimals",
+        ),
+        query_formats=(
+            "Search for [token_symbol] token",
+            "Find [token_symbol] on [chain]",
+            "Discover popular tokens",
+        ),
+        examples=(
+            "Search for USDT token",
+            "Find WBTC on Polygon",
+            "Discover popular tokens",
+            "Get trending tokens",
+            "Find token address for LINK on Ethereum",
+        ),
+        notes=("Use this agent when you need to find token addresses or discover new tokens",),
+    ),
+}
+
+
+def _quoted(values: Iterable[str], separator: str) -> str:
+    return separator.join(f'"{value}"' for value in values)
+
+
+def render_cards(cards: Iterable[AgentCard]) -> str:
+    """
+    Render agent cards as the numbered agent list of the instruction.
+
+    Args:
+        cards: Cards to list, in order
+
+    Returns:
+        Prompt text with one numbered entry per card
+    """
+    entries = []
+    for number, card in enumerate(cards, 1):
+        lines = [f"{number}. **{card.name}** (A2A Protocol)"]
+        lines.extend(f"   - {capability}" for capability in card.capabilities)
+        lines.append(f"   - Format: {_quoted(card.query_formats, ' or ')}")
+        lines.append(f"   - Example queries: {_quoted(card.examples, ', ')}")
+        lines.extend(f"   - {note}" for note in card.notes)
+        entries.append("\n".join(lines))
+    return "\n\n".join(entries)
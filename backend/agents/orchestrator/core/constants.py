@@ -13,9 +13,23 @@ DEFAULT_APP_NAME = "agents"
 DEFAULT_SESSION_TIMEOUT = 3600
 DEFAULT_PORT = 9000
 
+# Default cap on logged request/response bodies (LOG_BODY_MAX overrides it)
+MAX_LOG_BODY_BYTES = 64 * 1024
+
+# Paid session tracking
+PAID_SESSIONS_MAX_SIZE = 10_000
+PAID_SESSION_TTL_SECONDS = 24 * 3600
+
 # Agent configuration
 AGENT_NAME = "OrchestratorAgent"
 
+# A2A agents (by the intent each serves) and chains a deployment can enable; the
+# ORCHESTRATOR_AGENTS and ORCHESTRATOR_CHAINS variables narrow them
+SUPPORTED_AGENTS = ("balance", "liquidity", "swap", "sentiment", "trading", "research")
+SUPPORTED_CHAINS = ("ethereum", "polygon", "hedera")
+# Agents whose workflow calls other agents first (the swap checks balance and liquidity)
+AGENT_DEPENDENCIES = {"swap": ("balance", "liquidity")}
+
 
 # Model configuration
 def get_model_name() -> str:
@@ -27,3 +41,39 @@ def check_api_keys() -> None:
     """Check if API keys are configured."""
     if not os.getenv("GOOGLE_API_KEY") and not os.getenv("GEMINI_API_KEY"):
         print("⚠️  Warning: No API key found! Set GOOGLE_API_KEY or GEMINI_API_KEY")
+
+
+def _get_enabled(variable: str, supported: tuple[str, ...]) -> frozenset[str]:
+    value = os.getenv(variable, "")
+    enabled = frozenset(name.strip().lower() for name in value.split(",") if name.strip())
+    if not enabled:
+        return frozenset(supported)
+    unknown = enabled.difference(supported)
+    if unknown:
+        raise ValueError(
+            f"{variable} has unknown entries {sorted(unknown)}; expected some of {list(supported)}"
+        )
+    return enabled
+
+
+def get_missing_dependencies(agents: frozenset[str]) -> dict[str, list[str]]:
+    """Get, per enabled agent, the agents its workflow needs that are not enabled."""
+    return {
+        agent: missing
+        for agent, required in AGENT_DEPENDENCIES.items()
+        if agent in agents and (missing := [name for name in required if name not in agents])
+    }
+
+
+def get_enabled_agents() -> frozenset[str]:
+    """Get the agents this deployment registers (all unless ORCHESTRATOR_AGENTS is set)."""
+    enabled = _get_enabled("ORCHESTRATOR_AGENTS", SUPPORTED_AGENTS)
+    missing = get_missing_dependencies(enabled)
+    if missing:
+        raise ValueError(f"ORCHESTRATOR_AGENTS is missing agents that others need: {missing}")
+    return enabled
+
+
+def get_enabled_chains() -> frozenset[str]:
+    """Get the chains this deployment serves (all unless ORCHESTRATOR_CHAINS is set)."""
+    return _get_enabled("ORCHESTRATOR_CHAINS", SUPPORTED_CHAINS)
@@ -0,0 +1,74 @@
+"""
+Query examples for Orchestrator Agent.
+
+Example user messages mapped to the agent and query the orchestrator should send,
+kept per intent and rendered into the matching workflow section of the instruction.
+"""
+
+from typing import Final
+
+# (user message, agent, query to send). Popular-token queries are passed to the
+# Balance Agent unchanged; the sentiment entries are there to contrast with balances
+QUERY_EXAMPLES: Final[dict[str, tuple[tuple[str, str, str], ...]]] = {
+    "balance": (
+        ("get balance on Polygon", "Balance Agent", "Get balance for [account] on polygon"),
+        (
+            "check USDT on Ethereum",
+            "Balance Agent",
+            "Get USDT balance on ethereum for [account]",
+        ),
+        ("get USDT balance", "Balance Agent", "Get USDT balance"),
+        ("what's my HBAR balance?", "Balance Agent", "Get HBAR balance for [account]"),
+        ("get popular tokens", "Balance Agent", "get popular tokens"),
+        ("show popular tokens", "Balance Agent", "show popular tokens"),
+        ("top tokens", "Balance Agent", "top tokens"),
+        (
+            "What are the top 3 trending words in crypto?",
+            "Sentiment Agent",
+            "What are the top 3 trending words in crypto?",
+        ),
+        (
+            "Get sentiment balance for Bitcoin",
+            "Sentiment Agent",
+            "Get sentiment balance for Bitcoin",
+        ),
+    ),
+    "liquidity": (
+        ("get liquidity from ETH USDT", "LiquidityFinder", "Get liquidity for ETH/USDT"),
+        (
+            "get liquidity from LINK USDT on ethereum",
+            "LiquidityFinder",
+            "Get liquidity for LINK/USDT on ethereum",
+        ),
+        ("find liquidity of chainlink usdt", "LiquidityFinder", "Get liquidity for LINK/USDT"),
+        (
+            "get liquidity for HBAR/USDC on hedera",
+            "LiquidityFinder",
+            "Get liquidity for HBAR/USDC on hedera",
+        ),
+        (
+            "Show liquidity pools for MATIC/USDC on Polygon",
+            "LiquidityFinder",
+            "Get liquidity for MATIC/USDC on polygon",
+        ),
+        ("Get liquidity on Polygon", "LiquidityFinder", "Get liquidity on polygon"),
+        ("Show me all pools on Hedera", "LiquidityFinder", "Get liquidity on hedera"),
+        ("What's the liquidity across all chains?", "LiquidityFinder", "Get liquidity on all"),
+        ("Compare Polygon and Hedera liquidity", "LiquidityFinder", "Get liquidity on all"),
+    ),
+}
+
+
+def render_examples(intent: str) -> list[str]:
+    """
+    Render an intent's examples as prompt lines.
+
+    Args:
+        intent: Intent name (a key of QUERY_EXAMPLES)
+
+    Returns:
+        One '- "message" → Agent: "query"' line per example
+    """
+    return [
+        f'- "{message}" → {agent}: "{query}"' for message, agent, query in QUERY_EXAMPLES[intent]
+    ]
@@ -1,176 +1,173 @@
-ORCHESTRATOR_INSTRUCTION = """
+import json
+import sys
+import textwrap
+from collections.abc import Collection
+from functools import lru_cache
+from typing import Final
+
+from .agent_cards import AGENT_CARDS, render_cards
+from .constants import SUPPORTED_AGENTS, SUPPORTED_CHAINS, get_missing_dependencies
+from .examples import render_examples
+from .routing import route_intent
+from .schemas import LIQUIDITY_RESPONSE_V1
+
+
+def _section(text: str) -> str:
+    # Dedented at import so the common indent isn't sent to the model on every turn
+    return textwrap.dedent(text).strip()
+
+
+# Rules for calling agents, sent after the agent list
+_CALL_CONSTRAINTS = _section(
+    """
+    PARALLEL DISPATCH:
+    - When a request needs several agent calls that don't depend on each other's results,
+      make them in the same turn (several send_message_to_a2a_agent calls in one response)
+      and wait for all the results before answering
+    - Independent: the swap checks (Balance Agent and LiquidityFinder), and requests that
+      ask separate agents separate things (e.g. a balance and a sentiment question)
+    - Dependent, so one at a time: a call that needs an earlier result (Swap Agent only after
+      both swap checks pass), and anything after a gather_* or gather_payment call
+    - Multi-chain queries are ONE call: LiquidityFinder and Balance Agent aggregate chains
+      themselves, so never split "all chains" into per-chain calls
+"""
+)
+
+
+def _examples(intent: str) -> str:
+    # Indented like the section text around the placeholder, so _section's dedent still
+    # strips the whole section evenly
+    return "\n    ".join(render_examples(intent))
+
+
+# Example queries per agent for the routing rules
+_VALID_QUERIES: Final[dict[str, str]] = {
+    "balance": (
+        '- Balance queries: "get balance", "check USDT", "get popular tokens", '
+        '"show trending tokens"'
+    ),
+    "liquidity": (
+        '- Liquidity queries: "get liquidity", "show pools", "find liquidity for ETH/USDT"'
+    ),
+    "swap": '- Swap queries: "swap tokens", "exchange HBAR for USDC"',
+    "sentiment": '- Sentiment queries: "trending words", "sentiment analysis", "social volume"',
+    "trading": '- Trading queries: "should I buy BTC", "trading recommendation"',
+    "research": (
+        '- Token research queries: "search for USDT token", "find WBTC on Polygon", '
+        '"discover popular tokens", "find token address"'
+    ),
+}
+
+_POPULAR_TOKENS_RULE = _section(
+    """
+    **CRITICAL**: "get popular tokens" is a VALID balance query. You MUST route it to the Balance Agent.
+    DO NOT say "I cannot fulfill this request" for "get popular tokens" - it is fully supported.
+"""
+)
+
+# Only needed when both agents are deployed, since their queries share vocabulary
+_BALANCE_VS_SENTIMENT_RULES = _section(
+    """
+    **CRITICAL ROUTING RULES**:
+    - **Balance queries** → ALWAYS use **Balance Agent**
+    - **Sentiment queries** (trending words, social volume, sentiment analysis) → use **Sentiment Agent**
+    - **DO NOT confuse**:
+      * "get USDT balance" = Balance query → Balance Agent
+      * "What are trending words in crypto?" = Sentiment query → Sentiment Agent
+      * "get popular tokens" = Balance query (wants token balances) → Balance Agent
+      * "What are the top 3 trending words in crypto?" = Sentiment query → Sentiment Agent
+"""
+)
+
+
+def _render_agents(agents: frozenset[str], chains: frozenset[str]) -> str:
+    chain_list = ", ".join(chain for chain in SUPPORTED_CHAINS if chain in chains)
+    if len(chains) > 1:
+        chain_list += ", or all (cross-chain aggregate)"
+    cards = (AGENT_CARDS[agent] for agent in SUPPORTED_AGENTS if agent in agents)
+    return "\n\n".join(
+        (
+            f"SUPPORTED CHAINS: {chain_list}. Every agent below works on each of them unless "
+            "it says otherwise.",
+            "AVAILABLE SPECIALIZED AGENTS:",
+            render_cards(cards),
+            _CALL_CONSTRAINTS,
+        )
+    )
+
+
+def _render_routing_rules(agents: frozenset[str]) -> str:
+    queries = "\n".join(_VALID_QUERIES[agent] for agent in SUPPORTED_AGENTS if agent in agents)
+    rules = ["**IMPORTANT - VALID QUERIES YOU CAN HANDLE**:\n" + queries]
+    if "balance" in agents:
+        rules.append(_POPULAR_TOKENS_RULE)
+    if {"balance", "sentiment"} <= agents:
+        rules.append(_BALANCE_VS_SENTIMENT_RULES)
+    return "\n\n".join(rules)
+
+
+# The orchestrator prompt, split into named sections in the order they are sent.
+# The sections that apply to every request come first and form a fixed prefix; the
+# routing rules are only sent when route_intent can't pick the agent itself, and the
+# workflow and schema sections only for the intents that need them (see
+# build_instruction).
+#
+# Gemini caches the leading part of a request that is byte-identical to an earlier
+# one, so the prefix must stay free of timestamps, per-request values and anything
+# else that varies between calls. Only requests above the model's minimum (2048 tokens
+# for gemini-2.5-pro, 1024 for Flash) are cached at all. Request-specific state, such
+# as the payment requirement, is sent in its own messages by PaymentTrackingMiddleware
+INSTRUCTION_SECTIONS: Final[dict[str, str]] = {
+    "role": _section(
+        """
     You are a DeFi orchestrator agent. Your role is to coordinate
     specialized agents to fetch and aggregate on-chain liquidity, balance, and swap
     information across multiple blockchain networks.
+"""
+    ),
+    "payment": _section(
+        """
+    **PAYMENT (ONCE PER SESSION, BEFORE ANY SERVICE)**:
+    - Sessions that have not paid get a PAYMENT REQUIRED instruction and the x402 payment
+      requirements injected into the conversation (by the server, not the user). When they
+      are present, call 'gather_payment' before ANY other tool - no gather_* form and no
+      send_message_to_a2a_agent call - and include the payment requirements JSON in your
+      response so the frontend can read it. Once payment completes, carry on with the
+      user's original request.
+    - Without them the session has already paid: handle the request directly and never
+      call gather_payment.
+"""
+    ),
+    "agents": _render_agents(frozenset(SUPPORTED_AGENTS), frozenset(SUPPORTED_CHAINS)),
+    "response_rules": _section(
+        """
+    RESPONSE STRATEGY:
+    - After receiving agent response, briefly acknowledge what you received
+    - Present complete, well-organized results with clear summaries
+    - Highlight important metrics and comparisons across chains
+    - Don't just list agent responses - synthesize them into actionable insights
+    - Show chain-by-chain breakdown when multiple chains are queried
+    - Include the structured JSON data (balances, pools, tokens, TVL, reserves, liquidity) with the summary
 
-    **CRITICAL - PAYMENT REQUIREMENT (MANDATORY FOR ALL FIRST REQUESTS)**:
-    - **PAYMENT IS REQUIRED FOR THE FIRST REQUEST OF ANY TYPE**:
-      * Balance queries → Payment required FIRST
-      * Liquidity queries → Payment required FIRST
-      * Swap queries → Payment required FIRST
-      * Sentiment queries → Payment required FIRST
-      * Trading queries → Payment required FIRST
-      * Token research → Payment required FIRST
-      * Bridge queries → Payment required FIRST
-      * ANY task → Payment required FIRST
-
-    - **CHECK PAYMENT STATUS**: On EVERY request, check if payment is required:
-      * Look for `payment_required` in the request state
-      * If `payment_required: true` → Payment is needed (FIRST REQUEST)
-      * If `payment_required` is missing or false → Payment already completed (subsequent requests)
-
-    - **WHEN PAYMENT IS REQUIRED** (payment_required: true):
-      1. IMMEDIATELY call 'gather_payment' action FIRST (before ANY other tool call)
-      2. DO NOT call gather_balance_requirements, gather_swap_requirements, gather_liquidity_requirements, or any other tool
-      3. DO NOT call send_message_to_a2a_agent for any agent
-      4. Tell user: "Before I can help you, payment is required. Please complete the payment."
-      5. **CRITICAL**: Include the payment requirements JSON (x402 format) in your response when calling gather_payment.
-         The payment requirements JSON is provided in the system message - you MUST include it in your response
-         so the frontend can parse and use it. Format: Include the full JSON object with x402Version, error, and accepts array.
-      6. Wait for payment to be completed
-      7. After payment completion → Proceed with the user's original request
-      8. DO NOT process any other requests until payment is completed
-
-    - **WHEN PAYMENT IS COMPLETED** (payment_required: false or missing):
-      * Proceed normally with the user's request
-      * Session is marked as paid (tracked by middleware)
-      * All future requests work without payment
-
-    - **EXAMPLE PAYMENT WORKFLOWS**:
-      ```
-      FIRST REQUEST - Balance (payment_required: true):
-        User: "help to find my balance"
-        You: "Before I can help you, payment is required."
-        You: Call gather_payment FIRST
-        [Payment form opens]
-        User: Completes payment
-        You: "Payment received! Now processing your balance request..."
-        You: Call gather_balance_requirements
-        You: Process balance request normally
-
-      FIRST REQUEST - Swap (payment_required: true):
-        User: "swap 0.1 HBAR to USDC"
-        You: "Before I can help you, payment is required."
-        You: Call gather_payment FIRST
-        [Payment form opens]
-        User: Completes payment
-        You: "Payment received! Now processing your swap request..."
-        You: Call gather_swap_requirements
-        You: Process swap request normally
-
-      SUBSEQUENT REQUEST (payment_required: false):
-        User: "now get liquidity"
-        You: Process immediately (no payment call needed)
-      ```
-
-    - **CRITICAL RULES**:
-      * ALWAYS check for `payment_required` flag in request state
-      * If true → Call gather_payment FIRST (before ANY other action), then process request
-      * If false/missing → Process request normally
-      * Payment is required ONCE per session (until page refresh)
-      * ALL service types require payment on first request: balance, liquidity, swap, sentiment, trading, token research, bridge
-      * NO EXCEPTIONS - payment comes before everything else on first request
-
-    **IMPORTANT - VALID QUERIES YOU CAN HANDLE**:
-    - Balance queries: "get balance", "check USDT", "get popular tokens", "show trending tokens"
-    - Liquidity queries: "get liquidity", "show pools", "find liquidity for ETH/USDT"
-    - Swap queries: "swap tokens", "exchange HBAR for USDC"
-    - Sentiment queries: "trending words", "sentiment analysis", "social volume"
-    - Trading queries: "should I buy BTC", "trading recommendation"
-    - Token research queries: "search for USDT token", "find WBTC on Polygon", "discover popular tokens", "find token address"
-
-    **CRITICAL**: "get popular tokens" is a VALID balance query. You MUST route it to the Balance Agent.
-    DO NOT say "I cannot fulfill this request" for "get popular tokens" - it is fully supported.
-
-    AVAILABLE SPECIALIZED AGENTS:
-
-    1. **Balance Agent** (A2A Protocol)
-       - Fetches account balance information from multiple blockchain chains including Ethereum, Polygon, and Hedera
-       - Can query specific chains or get balances from all chains
-       - Provides comprehensive balance data including native token balances, token balances, and USD values
-       - **ENHANCED FEATURES**:
-         * Specific token on specific chain: "get USDT on Ethereum" → Returns USDT balance on Ethereum
-         * Token across all chains: "get USDT balance" → Returns USDT balances from all chains
-         * Popular tokens: "get popular tokens" → Fetches trending tokens and returns their balances
-       - Format: "Get balance for [account_address] on [chain]" or "Get balance for [account_address]"
-       - Token-specific format: "Get [token_symbol] balance on [chain]" or "Get [token_symbol] balance"
-       - Example queries:
-         * "Get balance for 0x1234... on ethereum"
-         * "Get balance for 0.0.123456 on hedera"
-         * "get USDT on Ethereum"
-         * "get USDT balance" (across all chains)
-         * "get popular tokens"
-         * "check USDC on Polygon"
-       - Returns balance information for the specified account
-       - **CRITICAL**: Use Balance Agent for ALL balance-related queries, NOT Sentiment Agent
-       - **NOTE**: If a token is not found in configuration, use Token Research to search for token addresses
-
-    2. **LiquidityFinder** (A2A Protocol)
-       - Fetches liquidity information from multiple blockchain chains (Hedera, Polygon, Ethereum)
-       - Can query specific chains or get liquidity from all chains
-       - Supports both token pair queries (e.g., "ETH/USDT") and general chain queries
-       - Provides comprehensive liquidity data including pool addresses, DEX names, TVL, reserves, liquidity, and slot0 data
-       - Format: "Get liquidity for [token_pair]" (e.g., "Get liquidity for ETH/USDT") or "Get liquidity on [chain]"
-       - Example queries: "Get liquidity for ETH/USDT", "Find liquidity pools for HBAR/USDC", "Get liquidity on Polygon"
-       - Returns combined results from all queried chains in a single response
-
-    3. **Swap Agent** (A2A Protocol)
-       - Handles token swaps on blockchain chains including Ethereum, Polygon, and Hedera
-       - Supports swapping any tokens - automatically resolves token addresses using Token Research if not in constants
-       - Common tokens include: USDC, USDT, HBAR, MATIC, ETH, WBTC, DAI, but any token can be swapped
-       - Creates swap transactions and tracks their status
-       - Format: "Swap [amount] [token_in] to [token_out] on [chain] for [account_address]"
-       - Example queries: "Swap 0.1 HBAR to USDC on hedera for 0.0.123456", "Swap 10 USDC to ETH on ethereum for 0x1234..."
-       - Returns swap configuration with transaction details
-
-    4. **Sentiment Agent** (A2A Protocol)
-       - Provides cryptocurrency sentiment analysis using Santiment API
-       - Supports sentiment balance, social volume, social dominance, trending words, and social shifts
-       - Format: "Get sentiment balance for [asset] over [days] days" or "Get social volume for [asset]"
-       - Example queries: "Get sentiment balance for Bitcoin over the last week", "How many times has Ethereum been mentioned on social media?", "What are the top 3 trending words in crypto?", "How dominant is Ethereum in social media discussions?"
-       - Returns sentiment analysis data including metrics and insights
-       - **CRITICAL**: Use Sentiment Agent ONLY for sentiment/social analysis queries, NOT for balance queries
-       - **DO NOT use for**: Token balances, account balances, wallet balances (use Balance Agent instead)
-
-    5. **Trading Agent** (A2A Protocol)
-       - Provides intelligent buy/sell recommendations for BTC and ETH
-       - Combines technical analysis (RSI, MACD, Moving Averages), sentiment analysis, and ML predictions
-       - Format: "Should I buy or sell [BTC/ETH]?" or "Get trading recommendation for [BTC/ETH]"
-       - Example queries: "Should I buy Bitcoin?", "What's the trading recommendation for Ethereum?", "Is it a good time to sell BTC?", "Should I buy or sell ETH now?"
-       - Returns buy/sell/hold recommendation with entry price, stop loss, targets, confidence, and reasoning
-       - Only supports Bitcoin (BTC) and Ethereum (ETH)
-
-    6. **Token Research** (A2A Protocol)
-       - Discovers and searches for tokens across blockchain chains (Ethereum, Polygon, Hedera)
-       - Searches for token contract addresses using CoinGecko API and web search
-       - Discovers popular/trending tokens and maps them across chains
-       - Format: "Search for [token_symbol] token" or "Find [token_symbol] on [chain]" or "Discover popular tokens"
-       - Example queries: "Search for USDT token", "Find WBTC on Polygon", "Discover popular tokens", "Get trending tokens", "Find token address for LINK on Ethereum"
-       - Returns token information including contract addresses, chain mappings, market cap rank, and decimals
-       - Use this agent when you need to find token addresses or discover new tokens
-
-    SUPPORTED CHAINS:
-    - Ethereum
-    - Polygon
-    - Hedera
-    - All chains (cross-chain aggregate)
-
-    WHAT YOU CAN DO:
-    - Fetch account balances (native tokens, ERC-20/HTS tokens) across Ethereum, Polygon, and Hedera
-    - Fetch specific token balances on specific chains or across all chains
-    - Fetch popular/trending token balances automatically
-    - Search for token contract addresses across chains
-    - Discover popular/trending tokens and map them across chains
-    - Fetch liquidity, reserves, pairs/pools per supported chain
-    - Compare and aggregate liquidity across chains
-    - Execute token swaps with balance and liquidity verification
-    - Return structured JSON for balances, pools, tokens, TVL, reserves, and liquidity data
-
-    CRITICAL CONSTRAINTS:
-    - You MUST call agents ONE AT A TIME, never make multiple tool calls simultaneously
-    - After making a tool call, WAIT for the result before making another tool call
-    - Do NOT make parallel/concurrent tool calls - this is not supported
+    ERROR HANDLING AND LOOP PREVENTION:
+    - **CRITICAL**: Maximum ONE call per agent per user request. Once an agent returns ANY response
+      (success, partial data, or an error), DO NOT call it again for the same information - never loop or retry
+    - The tool result from send_message_to_a2a_agent is the agent's formatted response - use it directly
+    - **CRITICAL**: Present what the agent returned: acknowledge data (even partial) and show errors to the
+      user with an explanation of what happened. For token discovery, apply the success rules below - an
+      empty balances array does NOT mean failure
 
+    **TOKEN DISCOVERY RESPONSE FORMAT**:
+    - Token discovery responses will have: "query_type": "token_discovery", "success": true/false
+    - Successful discovery: "success": true, "discovery_result" with tokens, OR tokens in "balances" array
+    - If you see tokens in the "balances" array or "discovery_result" field, the discovery was successful
+    - "query_type": "token_discovery" with "success": true is successful even if the balances array is empty
+    - DO NOT retry if you see "success": true or any tokens in the response
+"""
+    ),
+    "routing_rules": _render_routing_rules(frozenset(SUPPORTED_AGENTS)),
+    "workflow_balance": _section(
+        f"""
     RECOMMENDED WORKFLOW FOR BALANCE QUERIES:
 
     **For Balance Queries** (CRITICAL - Use Balance Agent, NOT Sentiment Agent):
@@ -207,24 +204,6 @@ ORCHESTRATOR_INSTRUCTION = """
        - **IMPORTANT**: The Balance Agent will automatically detect this as a popular tokens query and fetch trending tokens from CoinGecko, then return their balances
        - **DO NOT** reformat or change the query - pass it directly to Balance Agent
 
-    **CRITICAL ROUTING RULES**:
-    - **Balance queries** → ALWAYS use **Balance Agent**
-    - **Sentiment queries** (trending words, social volume, sentiment analysis) → use **Sentiment Agent**
-    - **DO NOT confuse**:
-      * "get USDT balance" = Balance query → Balance Agent
-      * "What are trending words in crypto?" = Sentiment query → Sentiment Agent
-      * "get popular tokens" = Balance query (wants token balances) → Balance Agent
-      * "What are the top 3 trending words in crypto?" = Sentiment query → Sentiment Agent
-
-    **Balance Query Examples**:
-    - "get balance on Polygon" → Balance Agent: "Get balance for [account] on polygon"
-    - "check USDT on Ethereum" → Balance Agent: "Get USDT balance on ethereum for [account]"
-    - "get USDT balance" → Balance Agent: "Get USDT balance"
-    - "get popular tokens" → Balance Agent: "get popular tokens" (pass AS-IS)
-    - "show popular tokens" → Balance Agent: "show popular tokens" (pass AS-IS)
-    - "top tokens" → Balance Agent: "top tokens" (pass AS-IS)
-    - "what's my HBAR balance?" → Balance Agent: "Get HBAR balance for [account]"
-
     **CRITICAL FOR POPULAR TOKENS**:
     - When user says "get popular tokens", "show trending tokens", "top tokens", etc.
     - DO NOT reformat the query
@@ -236,70 +215,61 @@ ORCHESTRATOR_INSTRUCTION = """
       3. Query balances for those tokens across all chains
       4. Return the results
 
-    **Sentiment Query Examples** (for comparison):
-    - "What are the top 3 trending words in crypto?" → Sentiment Agent
-    - "Get sentiment balance for Bitcoin" → Sentiment Agent
-    - "How many times has Ethereum been mentioned?" → Sentiment Agent
-
+    **Query Examples** (sentiment ones for comparison):
+    {_examples("balance")}
+"""
+    ),
+    "workflow_swap": _section(
+        """
     RECOMMENDED WORKFLOW FOR SWAP QUERIES:
 
-    **For Swap Queries** (CRITICAL - Follow this exact sequence):
-
-    When a user wants to swap tokens, you MUST follow this sequence:
-
-    1. **STEP 1: Check Balance** - Call Balance Agent FIRST
-       - Extract account address from user query (if provided)
-       - Extract chain from user query (e.g., "hedera", "polygon", "ethereum")
-       - Extract token_in symbol from user query (the token they want to swap FROM)
-       - Call Balance Agent: "Get balance for [account_address] on [chain]"
-       - Wait for balance response
-       - Check if user has sufficient balance for the swap amount
-       - If balance is insufficient, inform user and STOP - do not proceed to swap
-       - If balance is sufficient, proceed to Step 2
-
-    2. **STEP 2: Check Pool/Liquidity** - Call LiquidityFinder
-       - Extract token pair from user query (token_in and token_out)
-       - Extract chain from user query
-       - Call LiquidityFinder: "Get liquidity for [token_in]/[token_out] on [chain]"
-       - Wait for liquidity response
-       - Verify that a pool exists for the token pair on the specified chain
-       - If no pool exists, inform user and STOP - do not proceed to swap
-       - If pool exists, proceed to Step 3
-
-    3. **STEP 3: Execute Swap** - Call Swap Agent
-       - Extract all swap parameters: amount, token_in, token_out, chain, account_address, slippage
+    **For Swap Queries** (CRITICAL - Check first, then execute):
+
+    When a user wants to swap tokens, you MUST check before executing. The balance and
+    liquidity checks do not depend on each other, so make both calls in the same turn:
+
+    1. **STEP 1: Pre-swap Checks** - Call Balance Agent and LiquidityFinder
+       - Extract from the user query: amount, token_in (the token they swap FROM), token_out,
+         chain (one of the SUPPORTED CHAINS) and account address (if provided)
+       - Balance check: call Balance Agent: "Get balance for [account_address] on [chain]"
+       - Liquidity check: call LiquidityFinder: "Get liquidity for [token_in]/[token_out] on [chain]"
+       - Once both responses are in:
+         * Check the user has enough token_in for the swap amount
+         * Check a pool exists for the token pair on the chain
+       - If either check fails, inform the user (report both failures if both fail) and
+         STOP - do not proceed to swap
+       - If both pass, proceed to Step 2
+
+    2. **STEP 2: Execute Swap** - Call Swap Agent
        - Call Swap Agent: "Swap [amount] [token_in] to [token_out] on [chain] for [account_address]"
+       - Include the slippage if the user gave one
        - Wait for swap response
        - Present the swap transaction details to the user
 
     **Example Swap Workflow**:
     User: "Swap 0.1 HBAR to USDC on hedera for 0.0.123456"
 
-    Step 1: Call Balance Agent
-    → Query: "Get balance for 0.0.123456 on hedera"
+    Step 1: Call Balance Agent and LiquidityFinder
+    → Balance Agent query: "Get balance for 0.0.123456 on hedera"
     → Response: { "balances": [{"token_symbol": "HBAR", "balance": "1.5", ...}] }
-    → Check: User has 1.5 HBAR, needs 0.1 HBAR → Sufficient balance ✓
-
-    Step 2: Call LiquidityFinder
-    → Query: "Get liquidity for HBAR/USDC on hedera"
+    → LiquidityFinder query: "Get liquidity for HBAR/USDC on hedera"
     → Response: { "results": [{"pool_address": "0x...", "liquidity": "1000000", ...}] }
-    → Check: Pool exists with liquidity ✓
+    → Check: User has 1.5 HBAR, needs 0.1 HBAR ✓; pool exists with liquidity ✓
 
-    Step 3: Call Swap Agent
+    Step 2: Call Swap Agent
     → Query: "Swap 0.1 HBAR to USDC on hedera for 0.0.123456"
     → Response: { "transaction": {...}, "status": "pending", ... }
     → Present: Swap transaction created successfully
 
     **CRITICAL RULES FOR SWAP WORKFLOW**:
-    - ALWAYS call Balance Agent FIRST before Swap Agent
-    - ALWAYS call LiquidityFinder SECOND to verify pool exists
+    - ALWAYS complete both checks (Balance Agent and LiquidityFinder) before Swap Agent
     - ALWAYS call Swap Agent LAST to execute the swap
-    - NEVER skip balance check - it's mandatory
-    - NEVER skip liquidity check - it's mandatory
-    - If balance is insufficient, STOP and inform user
-    - If pool doesn't exist, STOP and inform user
-    - Call agents ONE AT A TIME - wait for each response before calling the next
-
+    - NEVER skip the balance or liquidity check - both are mandatory
+    - If balance is insufficient or the pool doesn't exist, STOP and inform user
+"""
+    ),
+    "workflow_token_research": _section(
+        """
     RECOMMENDED WORKFLOW FOR TOKEN RESEARCH QUERIES:
 
     **For Token Research Queries**:
@@ -325,18 +295,20 @@ ORCHESTRATOR_INSTRUCTION = """
     - If Balance Agent reports a token not found, suggest using Token Research
     - Token Research can search across all chains or specific chains
     - Results include contract addresses, chain mappings, and token metadata
-
+"""
+    ),
+    "workflow_liquidity": _section(
+        f"""
     RECOMMENDED WORKFLOW FOR LIQUIDITY QUERIES:
 
     **For Liquidity Queries**:
     - **IMPORTANT**: If the user mentions a token pair (e.g., "ETH/USDT", "ETH USDT", "HBAR/USDC"), use LiquidityFinder directly without gathering requirements
     - If user asks for liquidity with a token pair, extract the pair and call LiquidityFinder immediately
     - Format: "Get liquidity for [token_pair]" where token_pair is normalized (e.g., "ETH/USDT", "HBAR/USDC")
-    - Examples: "get liquidity from ETH USDT" -> "Get liquidity for ETH/USDT" -> LiquidityFinder
     - If no token pair is mentioned, then call 'gather_liquidity_requirements' to collect essential information
     - Try to extract any mentioned details from the user's message (chain, token pair)
     - Pass any extracted values as parameters to pre-fill the form:
-      * chain: Extract chain if mentioned (e.g., "hedera", "polygon", "ethereum") or default to "all"
+      * chain: Extract chain if mentioned (one of the SUPPORTED CHAINS) or default to "all"
       * tokenPair: Extract token pair if mentioned (e.g., "HBAR/USDC", "MATIC/USDC")
     - Wait for the user to submit the complete requirements
     - Use the returned values for all subsequent agent calls
@@ -347,27 +319,15 @@ ORCHESTRATOR_INSTRUCTION = """
     - **DO NOT call Token Research** before calling LiquidityFinder - it will resolve tokens itself
     - Simply pass the query with token symbols (e.g., "LINK/USDT", "ETH/USDT") and the chain
     - Format: "Get liquidity for [token_pair] on [chain]" where token_pair uses symbols (e.g., "LINK/USDT", "ETH/USDT")
-    - Examples:
-      * "Get liquidity for LINK/USDT on ethereum"
-      * "Get liquidity for HBAR/USDC on hedera"
-      * "Get liquidity for ETH/USDT" (no chain = all chains)
-      * "Get liquidity on polygon" (no token pair)
+    - No chain in the query means all chains; no token pair means every pool on the chain
     - The agent will automatically:
       1. Parse the token symbols from the pair
       2. Resolve token addresses using its internal token resolution tool
       3. Query liquidity pools on the specified chain(s)
       4. Return structured JSON with results
     - **NEVER** call Token Research for liquidity queries - LiquidityFinder handles everything
-    - Examples:
-      * "get liquidity from LINK USDT on ethereum" -> "Get liquidity for LINK/USDT on ethereum"
-      * "find liquidity of chainlink usdt" -> "Get liquidity for LINK/USDT" (no chain = all chains)
-      * "get liquidity for HBAR/USDC on hedera" -> "Get liquidity for HBAR/USDC on hedera"
-      * "Get liquidity on Polygon" -> "Get liquidity on polygon" (no token pair)
-      * "Show me all pools on Hedera" -> "Get liquidity on hedera" (no token pair)
     - Call send_message_to_a2a_agent with agentName="LiquidityFinder" and the formatted query
     - The tool result will contain the liquidity data as text/JSON with results from all queried chains
-    - IMPORTANT: The tool result IS the response - use it directly without parsing
-    - If you see "Invalid JSON" warnings, IGNORE them - the actual response data is in the tool result text
     - Present the liquidity information to the user in a clear format showing results from all chains
     - DO NOT call LiquidityFinder again after receiving a response
 
@@ -385,96 +345,136 @@ ORCHESTRATOR_INSTRUCTION = """
     - **For liquidity queries without token pairs**: ALWAYS START by calling 'gather_liquidity_requirements' FIRST
     - For liquidity queries with token pairs (e.g., "ETH/USDT", "ETH USDT"), extract pair and call LiquidityFinder immediately
     - For liquidity queries without token pairs, always gather requirements before calling agents
-    - When querying 'all chains', aggregate results from Ethereum, Polygon, and Hedera
+    - When querying 'all chains', aggregate results from every supported chain
     - Present cross-chain comparisons when relevant
 
     REQUEST EXTRACTION EXAMPLES:
-      - "Get liquidity for HBAR/USDC" -> LiquidityFinder
-      - "Get liquidity from ETH USDT" -> LiquidityFinder (extract "ETH/USDT")
-      - "Show me liquidity for ETH/USDT" -> LiquidityFinder
-      - "Show me all pools on Hedera" -> LiquidityFinder, query: "Get liquidity on hedera"
-      - "What's the liquidity across all chains?" -> LiquidityFinder, query: "Get liquidity on all"
-      - "Compare Polygon and Hedera liquidity" -> LiquidityFinder, query: "Get liquidity on all"
-      - "Show liquidity pools for MATIC/USDC on Polygon" -> LiquidityFinder, query: "Get liquidity for MATIC/USDC on polygon"
-
-    RESPONSE FORMAT (example schema):
-
-    Multi-Chain Liquidity Response:
-    {
-      "type": "liquidity",
-      "chain": "ethereum | polygon | hedera | all",
-      "token_a": "0x...",
-      "token_b": "0x...",
-      "results": [
-        {
-          "chain": "ethereum",
-          "pool_address": "0x...",
-          "token_a": "0x...",
-          "token_b": "0x...",
-          "fee": 3000,
-          "liquidity": "1000000",
-          "tick": 12345,
-          "sqrt_price_x96": "0x...",
-          "status": "success"
-        },
-        {
-          "chain": "polygon",
-          "pool_address": "0x...",
-          "token_a": "0x...",
-          "token_b": "0x...",
-          "fee": 3000,
-          "liquidity": "500000",
-          "tick": 12340,
-          "sqrt_price_x96": "0x...",
-          "status": "success"
-        },
-        {
-          "chain": "hedera",
-          "pool_address": "0x...",
-          "token_a": "0x...",
-          "token_b": "0x...",
-          "fee": 3000,
-          "liquidity": "200000",
-          "tick": 12335,
-          "sqrt_price_x96": "0x...",
-          "status": "success"
-        }
-      ],
-      "error": null
-    }
-
-    RESPONSE STRATEGY:
-    - After receiving agent response, briefly acknowledge what you received
-    - Present complete, well-organized results with clear summaries
-    - Highlight important metrics and comparisons across chains
-    - Don't just list agent responses - synthesize them into actionable insights
-    - Show chain-by-chain breakdown when multiple chains are queried
-
-    ERROR HANDLING AND LOOP PREVENTION:
-    - **CRITICAL**: If an agent call succeeds (returns any response), DO NOT call it again
-    - **CRITICAL**: If an agent call fails or returns an error, DO NOT retry - present the error to the user and stop
-    - **CRITICAL**: If you receive a response from an agent (even if it's not perfect), use it and move on
-    - **CRITICAL**: DO NOT make multiple attempts to call the same agent for the same request
-    - **CRITICAL**: If you get "Invalid JSON" or parsing errors, IGNORE the error message and use the response text as-is
-    - **CRITICAL**: The tool result from send_message_to_a2a_agent contains the agent's response - use it directly
-    - **CRITICAL**: Do NOT try to parse JSON from tool results - the response is already formatted
-    - **CRITICAL**: Maximum ONE call per agent per user request - never loop or retry
-    - **CRITICAL**: When you see "Invalid JSON" warnings, these are just warnings - the actual response data is still available
-    - **CRITICAL**: For token discovery queries, if the response has "success": true or "discovery_result" or any tokens in "balances", it is SUCCESSFUL - do NOT retry
-    - **CRITICAL**: Empty balances array does NOT mean failure - check for "success" flag, "discovery_result", or "query_type" fields
-    - **CRITICAL**: If response has "query_type": "token_discovery" and "success": true, it is successful even if balances array is empty
-    - If an agent returns data (even partial), acknowledge it and present it to the user
-    - If an agent returns an error message, show it to the user and explain what happened
-    - Never call the same agent multiple times for the same query
-    - Tool results may contain JSON strings - use them directly without additional parsing
-    - For token discovery: Check for "discovery_result" field or tokens in "balances" array - if present, it's successful
-
-    IMPORTANT: Once you have received ANY response from an agent (success or error), do NOT call that same
-    agent again for the same information. Use what you received and present it to the user.
-
-    **TOKEN DISCOVERY RESPONSE FORMAT**:
-    - Token discovery responses will have: "query_type": "token_discovery", "success": true/false
-    - Successful discovery: "success": true, "discovery_result" with tokens, OR tokens in "balances" array
-    - If you see tokens in the "balances" array or "discovery_result" field, the discovery was successful
-    - DO NOT retry if you see "success": true or any tokens in the response
+    {_examples("liquidity")}
 """
+    ),
+    "response_schema": _section(
+        f"""
+    RESPONSE FORMAT (liquidity_v1 schema):
+    Multi-chain liquidity responses are JSON shaped like this, with one "results" entry
+    per queried chain:
+    {json.dumps(LIQUIDITY_RESPONSE_V1)}
+"""
+    ),
+}
+
+# Extra sections each intent needs on top of the base ones
+_INTENT_SECTIONS: Final[dict[str, tuple[str, ...]]] = {
+    "balance": ("workflow_balance",),
+    "swap": ("workflow_swap",),
+    "liquidity": ("workflow_liquidity", "response_schema"),
+    "sentiment": (),
+    "trading": (),
+    "research": ("workflow_token_research",),
+}
+
+# Sections sent with every request; they lead the dict, so they are also the prefix
+_BASE_SECTIONS = ("role", "payment", "agents", "response_rules")
+
+_ALL_AGENTS: Final = frozenset(SUPPORTED_AGENTS)
+_ALL_CHAINS: Final = frozenset(SUPPORTED_CHAINS)
+
+
+@lru_cache(maxsize=8)
+def _deployment_sections(agents: frozenset[str], chains: frozenset[str]) -> dict[str, str]:
+    # INSTRUCTION_SECTIONS narrowed to a deployment: only the enabled agents are
+    # described, and the workflows of the others are left out
+    unknown = agents.difference(SUPPORTED_AGENTS) | chains.difference(SUPPORTED_CHAINS)
+    if not agents or not chains or unknown:
+        raise ValueError(f"Invalid agents or chains for the orchestrator: {sorted(unknown)}")
+    missing = get_missing_dependencies(agents)
+    if missing:
+        # The swap workflow's pre-swap checks would reference agents that are not registered
+        raise ValueError(f"Agents missing the agents their workflows call: {missing}")
+    if agents == _ALL_AGENTS and chains == _ALL_CHAINS:
+        return INSTRUCTION_SECTIONS
+    dropped = {
+        name
+        for intent in SUPPORTED_AGENTS
+        if intent not in agents
+        for name in _INTENT_SECTIONS[intent]
+    }
+    sections = {name: text for name, text in INSTRUCTION_SECTIONS.items() if name not in dropped}
+    sections["agents"] = _render_agents(agents, chains)
+    sections["routing_rules"] = _render_routing_rules(agents)
+    return sections
+
+
+def build_orchestrator_instruction(
+    enabled_agents: Collection[str] = SUPPORTED_AGENTS,
+    enabled_chains: Collection[str] = SUPPORTED_CHAINS,
+) -> str:
+    """
+    Build the full orchestrator prompt for the agents and chains a deployment enables.
+
+    Args:
+        enabled_agents: Intent names of the registered agents (see SUPPORTED_AGENTS)
+        enabled_chains: Chains to offer (see SUPPORTED_CHAINS)
+
+    Returns:
+        Instruction text
+
+    Raises:
+        ValueError: If either collection is empty or has unknown names, or an agent is
+            enabled without the agents its workflow calls (swap needs balance and liquidity)
+    """
+    sections = _deployment_sections(frozenset(enabled_agents), frozenset(enabled_chains))
+    return sys.intern("\n\n".join(sections.values()))
+
+
+def __getattr__(name: str) -> str:
+    # ORCHESTRATOR_INSTRUCTION, the full prompt with every agent, is built on first
+    # access, so a deployment that narrows its agents or chains never renders it
+    if name == "ORCHESTRATOR_INSTRUCTION":
+        value = globals()[name] = build_orchestrator_instruction()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=64)
+def build_instruction(
+    intents: frozenset[str],
+    enabled_agents: frozenset[str] = _ALL_AGENTS,
+    enabled_chains: frozenset[str] = _ALL_CHAINS,
+) -> str:
+    """
+    Compose the orchestrator prompt from only the sections the given intents need.
+
+    When route_intent resolves the agent, the routing rules and query examples are
+    replaced by a one-line routing hint at the end of the prompt.
+
+    Identical arguments return the same string object. An empty set (or one naming
+    only agents the deployment doesn't enable) returns the deployment's full prompt,
+    since unclassified follow-ups ("yes", an account address, a tool result) can
+    belong to any workflow.
+
+    Args:
+        intents: Intent names from classify_intents
+        enabled_agents: Intent names of the agents the deployment registers
+        enabled_chains: Chains the deployment serves
+
+    Returns:
+        Instruction text
+    """
+    sections = _deployment_sections(enabled_agents, enabled_chains)
+    intents &= enabled_agents
+    if not intents:
+        return build_orchestrator_instruction(enabled_agents, enabled_chains)
+    agent = route_intent(intents)
+    wanted = set() if agent else {"routing_rules"}
+    for intent in intents:
+        wanted.update(_INTENT_SECTIONS[intent])
+    parts = [sections[name] for name in _BASE_SECTIONS]
+    parts.extend(text for name, text in sections.items() if name in wanted)
+    if agent:
+        parts.append(
+            f"ROUTING HINT: This request looks like one for the {agent}. After any required "
+            f'payment, call send_message_to_a2a_agent with agentName="{agent}", unless the '
+            "user is clearly asking for another agent's task."
+        )
+    # Every variant starts with the same prefix, so switching intents never moves it
+    return sys.intern("\n\n".join(parts))
@@ -4,11 +4,88 @@ Logging utilities for Orchestrator Agent.
 Provides structured logging for requests and responses.
 """
 
+import asyncio
+import atexit
+import copy
 import json
 import logging
-from datetime import datetime
+import os
+import queue
+from collections.abc import Callable, Mapping
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    # orjson reads bytes without a separate UTF-8 decode and writes the indented
+    # form several times faster than the stdlib encoder
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits or non-str keys
+            return json.dumps(obj, indent=2)
+
+    def _json_dumps_line(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, default=str).decode("utf-8")
+        except TypeError:
+            return json.dumps(obj, ensure_ascii=False, default=str)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _json_dumps_line(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+# Rule framing each request/response/error block
+_SEPARATOR = "=" * 80
+
+# LOG_FORMAT: "pretty" (default) logs text with indented JSON bodies and headers,
+# "compact" logs text with single-line JSON, "json" logs JSON lines
+_LOG_FORMAT = os.getenv("LOG_FORMAT", "pretty")
+_json_dumps_body = _json_dumps_pretty if _LOG_FORMAT == "pretty" else _json_dumps_line
+
+# Structured fields the log functions attach to their records (see _log_block)
+_RECORD_FIELDS = ("http_method", "http_path", "http_status", "response_time_ms", "error_type")
+
+
+class _JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line, for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in _RECORD_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return _json_dumps_line(entry)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueues records unformatted, so the listener thread does all the formatting."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats the message (and traceback) on the logging thread and
+        # drops args and exc_info; a copy with them intact defers that to the listener.
+        # Arguments must not change after the call (headers/bodies are logged as received)
+        return copy.copy(record)
+
+
 # Configure logger
 logger = logging.getLogger("orchestrator")
 logger.setLevel(logging.INFO)
@@ -17,12 +94,84 @@ logger.setLevel(logging.INFO)
 if not logger.handlers:
     handler = logging.StreamHandler()
     handler.setLevel(logging.INFO)
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    # JSON lines carry the structured fields instead of text
+    if _LOG_FORMAT == "json":
+        formatter = _JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            # Every record carries its own timestamp (to the millisecond), so the request
+            # and response blocks don't log a separate one
+            "%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    # The logger only enqueues records; a listener thread formats and writes them, so
+    # neither serializing headers/bodies nor a blocking write to stderr stalls the event loop
+    _record_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = QueueListener(_record_queue, handler, respect_handler_level=True)
+    logger.addHandler(_DeferredQueueHandler(_record_queue))
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def _format_body(body: Any, max_chars: int) -> tuple[str | None, str, bool]:
+    """
+    Prepare a request/response body for logging.
+
+    Already-parsed bodies are serialized directly and bytes/str bodies are
+    parsed at most once, so no body goes through a dumps/loads/dumps round trip.
+    Bodies that aren't JSON are cut down before decoding, so a large upload is
+    never decoded in full just to log its first few hundred characters.
+
+    Args:
+        body: Request/response body
+        max_chars: Longest raw text to return
+
+    Returns:
+        (JSON text or None if the body isn't JSON, raw text of at most
+        max_chars characters, whether the raw text was cut short)
+    """
+    if isinstance(body, (bytes, bytearray, str)):
+        try:
+            parsed = _json_loads(body)
+        except ValueError:
+            if isinstance(body, str):
+                return None, body[:max_chars], len(body) > max_chars
+            # A UTF-8 character is at most 4 bytes, so this slice covers max_chars
+            text = bytes(memoryview(body)[: max_chars * 4]).decode("utf-8", errors="replace")
+            return None, text[:max_chars], len(text) > max_chars or len(body) > max_chars * 4
+        return _json_dumps_body(parsed), "", False
+    return _json_dumps_body(body), "", False
+
+
+class _LazyJSON:
+    """Serializes its value as JSON only when a handler formats the record."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        value = self.value
+        # Dicts are serialised as-is; other mappings (e.g. Starlette Headers) are
+        # copied here, only when the record is actually formatted
+        if isinstance(value, Mapping) and not isinstance(value, dict):
+            value = dict(value)
+        return _json_dumps_body(value)
+
+
+def _log_block(
+    level: int,
+    lines: list[str],
+    args: list[Any],
+    fields: dict[str, Any],
+    exc_info: BaseException | None = None,
+) -> None:
+    # The lines are %-style templates for args; the block goes out framed by separators as
+    # one record, with fields attached for handlers that emit structured logs
+    message = "\n".join((_SEPARATOR, *lines, _SEPARATOR))
+    logger.log(level, message, *args, exc_info=exc_info, extra=fields)
 
 
 def log_request(
@@ -40,43 +189,43 @@ def log_request(
         headers: Request headers (optional)
         body: Request body (optional)
     """
-    logger.info("=" * 80)
-    logger.info("📥 INCOMING REQUEST")
-    logger.info(f"   Method: {method}")
-    logger.info(f"   Path: {path}")
-    logger.info(f"   Timestamp: {datetime.now().isoformat()}")
+    # Skip all formatting (and body parsing) when INFO is muted
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    level = logging.INFO
+    lines = ["📥 INCOMING REQUEST", "   Method: %s", "   Path: %s"]
+    args: list[Any] = [method, path]
 
     if headers:
-        logger.info(f"   Headers: {json.dumps(dict(headers), indent=2)}")
-        # Specifically log X-PAYMENT header if present
-        x_payment = headers.get("X-PAYMENT") or headers.get("x-payment")
+        lines.append("   Headers: %s")
+        args.append(_LazyJSON(headers))
+        # Specifically log X-PAYMENT header if present. ASGI header names are lower-case,
+        # so that spelling is tried first and usually the only lookup
+        x_payment = headers.get("x-payment") or headers.get("X-PAYMENT")
         if x_payment:
-            logger.info(
-                f"   💰 X-PAYMENT Header: {x_payment[:50]}..."
+            lines.append(
+                "   💰 X-PAYMENT Header: %s..."
                 if len(x_payment) > 50
-                else f"   💰 X-PAYMENT Header: {x_payment}"
+                else "   💰 X-PAYMENT Header: %s"
             )
+            args.append(x_payment[:50])
 
     if body:
         try:
-            if isinstance(body, bytes):
-                body_str = body.decode("utf-8")
-            elif isinstance(body, str):
-                body_str = body
+            body_json, body_str, _ = _format_body(body, 500)  # Limit raw bodies to 500 chars
+            if body_json is not None:
+                lines.append("   Body (JSON):\n%s")
+                args.append(body_json)
             else:
-                body_str = json.dumps(body, indent=2)
-
-            # Try to parse as JSON for pretty printing
-            try:
-                body_json = json.loads(body_str)
-                logger.info(f"   Body (JSON):\n{json.dumps(body_json, indent=2)}")
-            except json.JSONDecodeError:
-                logger.info(f"   Body (Raw): {body_str[:500]}")  # Limit to 500 chars
+                lines.append("   Body (Raw): %s")
+                args.append(body_str)
         except Exception as e:
-            logger.warning(f"   Error parsing body: {e}")
-            logger.info(f"   Body (Raw): {str(body)[:500]}")
+            level = logging.WARNING
+            lines.extend(("   Error parsing body: %s", "   Body (Raw): %s"))
+            args.extend((e, str(body)[:500]))
 
-    logger.info("=" * 80)
+    _log_block(level, lines, args, {"http_method": method, "http_path": path})
 
 
 def log_response(
@@ -94,48 +243,50 @@ def log_response(
         body: Response body (optional)
         response_time_ms: Response time in milliseconds (optional)
     """
-    logger.info("=" * 80)
-    logger.info("📤 OUTGOING RESPONSE")
-    logger.info(f"   Status Code: {status_code}")
-    logger.info(f"   Timestamp: {datetime.now().isoformat()}")
+    # Skip all formatting (and body parsing) when INFO is muted
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    level = logging.INFO
+    lines = ["📤 OUTGOING RESPONSE", "   Status Code: %s"]
+    args: list[Any] = [status_code]
 
     if response_time_ms is not None:
-        logger.info(f"   Response Time: {response_time_ms:.2f}ms")
+        lines.append("   Response Time: %.2fms")
+        args.append(response_time_ms)
 
     if headers:
-        logger.info(f"   Headers: {json.dumps(dict(headers), indent=2)}")
+        lines.append("   Headers: %s")
+        args.append(_LazyJSON(headers))
 
     if body:
         try:
-            if isinstance(body, bytes):
-                body_str = body.decode("utf-8")
-            elif isinstance(body, str):
-                body_str = body
-            else:
-                body_str = json.dumps(body, indent=2)
-
-            # Try to parse as JSON for pretty printing
-            try:
-                body_json = json.loads(body_str)
+            body_str_formatted, body_str, cut = _format_body(body, 1000)
+            if body_str_formatted is not None:
                 # Truncate very long responses
-                body_str_formatted = json.dumps(body_json, indent=2)
                 if len(body_str_formatted) > 2000:
-                    logger.info(f"   Body (JSON - truncated):\n{body_str_formatted[:2000]}...")
-                    logger.info(f"   Body length: {len(body_str_formatted)} characters")
+                    lines.extend(
+                        ("   Body (JSON - truncated):\n%s...", "   Body length: %d characters")
+                    )
+                    args.extend((body_str_formatted[:2000], len(body_str_formatted)))
                 else:
-                    logger.info(f"   Body (JSON):\n{body_str_formatted}")
-            except json.JSONDecodeError:
-                if len(body_str) > 1000:
-                    logger.info(f"   Body (Raw - truncated): {body_str[:1000]}...")
-                    logger.info(f"   Body length: {len(body_str)} characters")
+                    lines.append("   Body (JSON):\n%s")
+                    args.append(body_str_formatted)
+            else:
+                if cut:
+                    lines.extend(("   Body (Raw - truncated): %s...", "   Body length: %d %s"))
+                    unit = "characters" if isinstance(body, str) else "bytes"
+                    args.extend((body_str, len(body), unit))
                 else:
-                    logger.info(f"   Body (Raw): {body_str}")
+                    lines.append("   Body (Raw): %s")
+                    args.append(body_str)
         except Exception as e:
-            logger.warning(f"   Error parsing body: {e}")
-            body_preview = str(body)[:500]
-            logger.info(f"   Body (Raw): {body_preview}")
+            level = logging.WARNING
+            lines.extend(("   Error parsing body: %s", "   Body (Raw): %s"))
+            args.extend((e, str(body)[:500]))
 
-    logger.info("=" * 80)
+    fields = {"http_status": status_code, "response_time_ms": response_time_ms}
+    _log_block(level, lines, args, fields)
 
 
 def log_agent_message(message: str, direction: str = "processing") -> None:
@@ -157,16 +308,53 @@ def log_agent_message(message: str, direction: str = "processing") -> None:
 
 def log_error(error: Exception, context: str | None = None) -> None:
     """
-    Log error with context.
+    Log error with context and its traceback.
 
     Args:
         error: Exception that occurred
         context: Additional context (optional)
     """
-    logger.error("=" * 80)
-    logger.error("❌ ERROR")
+    lines = ["❌ ERROR"]
+    args: list[Any] = []
     if context:
-        logger.error(f"   Context: {context}")
-    logger.error(f"   Error Type: {type(error).__name__}")
-    logger.error(f"   Error Message: {str(error)}")
-    logger.error("=" * 80)
+        lines.append("   Context: %s")
+        args.append(context)
+    lines.extend(("   Error Type: %s", "   Error Message: %s"))
+    args.extend((type(error).__name__, error))
+    # The traceback is formatted by the logging framework, once, when the record is handled
+    _log_block(logging.ERROR, lines, args, {"error_type": type(error).__name__}, exc_info=error)
+
+
+# Bounded queue of deferred log calls, drained by a single worker task on the event loop
+LOG_QUEUE_MAX_SIZE = 1024
+_log_queue: asyncio.Queue | None = None
+_log_worker: asyncio.Task | None = None
+
+
+async def _drain_log_queue(queue: asyncio.Queue) -> None:
+    while True:
+        log_fn, args = await queue.get()
+        try:
+            log_fn(*args)
+        except Exception as e:
+            logger.warning("Deferred log call failed: %s", e)
+
+
+def log_in_background(log_fn: Callable[..., None], *args: Any) -> None:
+    """
+    Run a log call after the current request step instead of inline.
+
+    Must be called from a running event loop. The worker task is started on first
+    use; when the queue is full the oldest pending call is dropped.
+
+    Args:
+        log_fn: Logging function to call
+        *args: Positional arguments for log_fn
+    """
+    global _log_queue, _log_worker
+    if _log_worker is None or _log_worker.done():
+        _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+        _log_worker = asyncio.get_running_loop().create_task(_drain_log_queue(_log_queue))
+    if _log_queue.full():
+        _log_queue.get_nowait()
+    _log_queue.put_nowait((log_fn, args))
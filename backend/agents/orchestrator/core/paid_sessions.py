@@ -0,0 +1,48 @@
+"""
+Paid session tracking for Orchestrator Agent.
+
+Bounded, expiring record of sessions that have completed payment.
+"""
+
+import time
+from collections import OrderedDict
+
+from .constants import PAID_SESSION_TTL_SECONDS, PAID_SESSIONS_MAX_SIZE
+
+
+class PaidSessions:
+    """
+    LRU-bounded set of paid session IDs whose entries expire after a TTL.
+
+    All operations are synchronous, so they can't interleave on the event loop
+    and need no lock.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = PAID_SESSIONS_MAX_SIZE,
+        ttl: float = PAID_SESSION_TTL_SECONDS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._expires_at: OrderedDict[str, float] = OrderedDict()
+
+    def __contains__(self, session_id: object) -> bool:
+        expires_at = self._expires_at.get(session_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._expires_at[session_id]
+            return False
+        self._expires_at.move_to_end(session_id)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def add(self, session_id: str) -> None:
+        """Mark a session as paid, evicting the least recently used one when full."""
+        self._expires_at[session_id] = time.monotonic() + self.ttl
+        self._expires_at.move_to_end(session_id)
+        while len(self._expires_at) > self.maxsize:
+            self._expires_at.popitem(last=False)
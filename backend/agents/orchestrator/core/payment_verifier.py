@@ -11,32 +11,238 @@ The facilitator API method is preferred as it uses the same verification logic
 as the frontend facilitator.
 """
 
+import asyncio
 import base64
 import json
 import os
 import re
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Any, Optional
 
+from .logger import logger
+
+try:
+    import orjson
+
+    # Parses the decoded bytes directly, with no intermediate str
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 try:
     import httpx
     HTTPX_AVAILABLE = True
 except ImportError:
     HTTPX_AVAILABLE = False
 
-try:
-    from hiero_sdk_python import (
-        AccountId,
-        Client,
-        PrivateKey,
-        TokenId,
-        Transaction,
-        TransferTransaction,
-    )
-    HIERO_AVAILABLE = True
-except ImportError:
-    HIERO_AVAILABLE = False
+# The Hedera SDK (and the protobuf/crypto stack under it) is only imported the first
+# time a client or token ID is needed; at startup we only check that it's installed
+HIERO_AVAILABLE = find_spec("hiero_sdk_python") is not None
+if not HIERO_AVAILABLE:
     print("⚠️  Warning: hiero-sdk-python not available. Payment verification will be limited.")
 
+_hiero_module = None
+
+
+def _hiero():
+    """Import hiero_sdk_python on first use."""
+    global _hiero_module
+    if _hiero_module is None:
+        import hiero_sdk_python
+
+        _hiero_module = hiero_sdk_python
+    return _hiero_module
+
+
+# Hedera entity ID format (0.0.xxxxx)
+_ENTITY_ID_RE = re.compile(r"^0\.0\.\d+$")
+
+# Standard base64 alphabet with optional padding (the length is checked separately)
+_B64_RE = re.compile(r"[A-Za-z0-9+/]+={0,2}")
+
+# Headers longer than this are decoded without being cached
+_DECODE_CACHE_MAX_HEADER_LEN = 64 * 1024
+
+
+def _parse_payment_payload(header: str) -> Any:
+    """Decode a base64 x402 payment header and parse its JSON."""
+    # Both parsers accept UTF-8 bytes, so the decoded bytes aren't turned into a str first
+    return _json_loads(base64.b64decode(header))
+
+
+# A client resends the same X-PAYMENT header with its retries and follow-up requests,
+# so parsed payloads are cached by header. Cached values are shared; callers get copies
+@lru_cache(maxsize=1024)
+def _cached_payment_payload(header: str) -> Any:
+    return _parse_payment_payload(header)
+
+
+# Frontend facilitator (Next.js API route), tried after the configured facilitator
+_FALLBACK_VERIFY_URL = "http://localhost:3000/api/facilitator/verify"
+
+# HTTP client shared by all facilitator API calls (and the mirror node lookups of settled
+# transactions), so they reuse pooled keep-alive connections; created on first use,
+# inside the running event loop. Its pool belongs to that loop, so a client created on
+# another (since closed) loop is replaced rather than reused
+_facilitator_client: Optional["httpx.AsyncClient"] = None
+_facilitator_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+# Payload verifications in progress, keyed by (X-PAYMENT header, id of the requirements
+# dict). The facilitator verifies one payload per request, so instead of batching,
+# concurrent requests that carry the same header (client retries, parallel calls from
+# one session) wait on a single verification. The requirements are keyed by identity,
+# not serialized: callers pass a shared constant, and the running verification keeps
+# its dict alive, so the id can't be reused while the entry exists
+_in_flight_verifications: dict[tuple[str, int], "asyncio.Task[dict[str, Any]]"] = {}
+
+
+def _get_facilitator_client() -> "httpx.AsyncClient":
+    """Get the shared facilitator API client, creating it on first use in this loop."""
+    global _facilitator_client, _facilitator_client_loop
+    loop = asyncio.get_running_loop()
+    if _facilitator_client is None or _facilitator_client_loop is not loop:
+        _facilitator_client_loop = loop
+        _facilitator_client = httpx.AsyncClient(
+            # Short timeouts for faster fallback; a facilitator that isn't running fails
+            # on connect, well before the read timeout
+            timeout=httpx.Timeout(5.0, connect=1.0),
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _facilitator_client
+
+
+async def aclose_facilitator_client() -> None:
+    """Close the shared facilitator API client; the next call creates a new one."""
+    global _facilitator_client, _facilitator_client_loop
+    client, _facilitator_client, _facilitator_client_loop = _facilitator_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+# Hedera mirror node REST APIs, where settled transactions are looked up
+_MIRROR_NODE_URLS = {
+    "testnet": "https://testnet.mirrornode.hedera.com",
+    "mainnet": "https://mainnet-public.mirrornode.hedera.com",
+}
+# A transaction reaches the mirror node a few seconds after consensus, so a lookup that
+# comes back 404 is retried
+_MIRROR_NODE_ATTEMPTS = 3
+_MIRROR_NODE_RETRY_DELAY = 2.0
+
+
+async def _check_transaction_on_chain(
+    transaction_id: str, network: str, payment_requirements: dict[str, Any]
+) -> None:
+    """
+    Look up a settled transaction on the mirror node and check that it paid.
+
+    Runs off the request path; the payment was already accepted, so problems are
+    logged rather than raised.
+    """
+    # 0.0.xxxxx@seconds.nanos is written 0.0.xxxxx-seconds-nanos (9-digit nanos) there
+    account, _, timestamp = transaction_id.partition("@")
+    seconds, _, nanos = timestamp.partition(".")
+    url = f"{_MIRROR_NODE_URLS[network]}/api/v1/transactions/{account}-{seconds}-{nanos:0>9}"
+
+    for attempt in range(_MIRROR_NODE_ATTEMPTS):
+        response = await _get_facilitator_client().get(url)
+        if response.status_code != 404:
+            break
+        if attempt + 1 < _MIRROR_NODE_ATTEMPTS:
+            await asyncio.sleep(_MIRROR_NODE_RETRY_DELAY)
+    if response.status_code == 404:
+        logger.warning("Transaction %s not found on the %s mirror node", transaction_id, network)
+        return
+    if response.status_code != 200:
+        logger.warning(
+            "Mirror node lookup of transaction %s failed: HTTP %s",
+            transaction_id,
+            response.status_code,
+        )
+        return
+
+    # Scheduled and child transactions share the ID; the payment is the successful one
+    records = [r for r in response.json().get("transactions", []) if r.get("result") == "SUCCESS"]
+    if not records:
+        logger.warning("Transaction %s did not succeed on %s", transaction_id, network)
+        return
+
+    pay_to = payment_requirements.get("payTo")
+    if pay_to:
+        asset = payment_requirements.get("asset", "0.0.0")
+        required = int(payment_requirements.get("maxAmountRequired") or 0)
+        if asset == "0.0.0" or asset.lower() == "hbar":
+            transfers = [t for r in records for t in r.get("transfers", [])]
+        else:
+            transfers = [
+                t
+                for r in records
+                for t in r.get("token_transfers", [])
+                if t.get("token_id") == asset
+            ]
+        received = sum(t.get("amount", 0) for t in transfers if t.get("account") == pay_to)
+        if received < required:
+            logger.warning(
+                "Transaction %s paid %s %s to %s, %s required",
+                transaction_id,
+                received,
+                asset,
+                pay_to,
+                required,
+            )
+            return
+
+    logger.info("✅ Transaction %s verified on %s", transaction_id, network)
+
+
+# Settled transaction IDs waiting for their on-chain check, drained one at a time by a
+# single worker task on the event loop (see PaymentVerifier.verify_transaction_id)
+TX_CHECK_QUEUE_MAX_SIZE = 1024
+_tx_check_queue: asyncio.Queue | None = None
+_tx_check_worker: asyncio.Task | None = None
+
+
+async def _drain_transaction_checks(queue: asyncio.Queue) -> None:
+    while True:
+        transaction_id, network, payment_requirements = await queue.get()
+        try:
+            await _check_transaction_on_chain(transaction_id, network, payment_requirements)
+        except Exception as e:
+            logger.warning("On-chain check of transaction %s failed: %s", transaction_id, e)
+        finally:
+            queue.task_done()
+
+
+def _enqueue_transaction_check(
+    transaction_id: str, network: str, payment_requirements: dict[str, Any]
+) -> None:
+    global _tx_check_queue, _tx_check_worker
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("Transaction %s not checked on-chain: no running event loop", transaction_id)
+        return
+    if _tx_check_worker is None or _tx_check_worker.done():
+        _tx_check_queue = asyncio.Queue(maxsize=TX_CHECK_QUEUE_MAX_SIZE)
+        _tx_check_worker = loop.create_task(_drain_transaction_checks(_tx_check_queue))
+    if _tx_check_queue.full():
+        # Dropped rather than checked inline, so a backlog never stalls requests
+        logger.warning("Transaction %s not checked on-chain: check queue full", transaction_id)
+        return
+    _tx_check_queue.put_nowait((transaction_id, network, payment_requirements))
+
+
+async def flush_transaction_checks() -> None:
+    """
+    Wait until every queued transaction ID has been checked on-chain.
+
+    For shutdown and other points where pending checks must have completed.
+    """
+    if _tx_check_worker is not None and not _tx_check_worker.done():
+        await _tx_check_queue.join()
+
 
 class PaymentVerificationError(Exception):
     """Exception raised when payment verification fails."""
@@ -52,6 +258,7 @@ class PaymentVerifier:
         facilitator_account_id: Optional[str] = None,
         facilitator_private_key: Optional[str] = None,
         facilitator_url: Optional[str] = None,
+        enforce_facilitator_verdict: bool | None = None,
     ):
         """
         Initialize payment verifier.
@@ -60,6 +267,9 @@ class PaymentVerifier:
             facilitator_account_id: Facilitator's Hedera account ID
             facilitator_private_key: Facilitator's private key (for transaction verification)
             facilitator_url: URL of facilitator API (preferred method if available)
+            enforce_facilitator_verdict: Reject payloads the facilitator API reports invalid
+                (other than for its signature check) instead of falling back to the basic
+                result; off unless FACILITATOR_ENFORCE_VERDICT=1
         """
         self.facilitator_account_id = facilitator_account_id or os.getenv(
             "HEDERA_FACILITATOR_ACCOUNT_ID"
@@ -71,28 +281,13 @@ class PaymentVerifier:
         self.facilitator_url = facilitator_url or os.getenv(
             "FACILITATOR_URL", "http://localhost:3000/api/facilitator"
         )
-        self._hedera_client: Optional[Client] = None
-
-    def _get_hedera_client(self, network: str = "testnet") -> Client:
-        """Get or create Hedera client for the specified network."""
-        if self._hedera_client is None:
-            if network == "testnet":
-                self._hedera_client = Client.forTestnet()
-            elif network == "mainnet":
-                self._hedera_client = Client.forMainnet()
-            else:
-                raise ValueError(f"Unsupported network: {network}")
-
-            # Set operator if credentials are available
-            if self.facilitator_account_id and self.facilitator_private_key:
-                try:
-                    account_id = AccountId.fromString(self.facilitator_account_id)
-                    private_key = PrivateKey.fromStringECDSA(self.facilitator_private_key)
-                    self._hedera_client.setOperator(account_id, private_key)
-                except Exception as e:
-                    print(f"⚠️  Warning: Could not set Hedera operator: {e}")
-
-        return self._hedera_client
+        # Off by default: the frontend facilitator verifies and settles a payment before
+        # its header reaches the orchestrator. Deployments where clients can call the
+        # orchestrator directly turn it on, so a well-formed payload the facilitator
+        # rejects (wrong amount or payee, expired) isn't accepted on structure alone
+        if enforce_facilitator_verdict is None:
+            enforce_facilitator_verdict = os.getenv("FACILITATOR_ENFORCE_VERDICT") == "1"
+        self.enforce_facilitator_verdict = enforce_facilitator_verdict
 
     def is_transaction_id(self, x_payment_header: str) -> bool:
         """
@@ -106,9 +301,12 @@ class PaymentVerifier:
         Returns:
             True if it's a transaction ID, False otherwise
         """
-        # Hedera transaction ID format: 0.0.xxxxx@timestamp.nanos
-        pattern = r"^0\.0\.\d+@\d+\.\d+$"
-        return bool(re.match(pattern, x_payment_header.strip()))
+        # Checked with string operations; isdecimal() accepts the same digits as \d
+        account, at, timestamp = x_payment_header.strip().partition("@")
+        if not at or not account.startswith("0.0.") or not account[4:].isdecimal():
+            return False
+        seconds, dot, nanos = timestamp.partition(".")
+        return bool(dot) and seconds.isdecimal() and nanos.isdecimal()
 
     def decode_payment_header(self, x_payment_header: str) -> dict[str, Any]:
         """
@@ -128,27 +326,26 @@ class PaymentVerifier:
             PaymentVerificationError: If decoding fails
         """
         # Check if it's a transaction ID (after settlement)
-        if self.is_transaction_id(x_payment_header):
+        header = x_payment_header.strip()
+        if self.is_transaction_id(header):
             return {
                 "type": "transaction_id",
-                "transaction_id": x_payment_header.strip(),
+                "transaction_id": header,
             }
 
         # Otherwise, try to decode as base64 payment payload
         try:
-            # Decode base64
-            decoded_bytes = base64.b64decode(x_payment_header)
-            decoded_str = decoded_bytes.decode("utf-8")
-
-            # Parse JSON
-            payment_payload = json.loads(decoded_str)
-            payment_payload["type"] = "payment_payload"
+            if len(header) <= _DECODE_CACHE_MAX_HEADER_LEN:
+                payment_payload = _cached_payment_payload(header)
+            else:
+                payment_payload = _parse_payment_payload(header)
 
-            return payment_payload
+            # Shallow copy, so the cached payload itself is never modified
+            return {**payment_payload, "type": "payment_payload"}
         except Exception as e:
             raise PaymentVerificationError(f"Failed to decode payment header: {e}") from e
 
-    def verify_payment(
+    async def verify_payment(
         self,
         payment_payload: dict[str, Any],
         payment_requirements: dict[str, Any],
@@ -156,57 +353,43 @@ class PaymentVerifier:
         """
         Verify payment payload against payment requirements.
 
-        Tries facilitator API first (if available), then falls back to basic validation.
-        Since payments are already verified by the frontend facilitator before settlement,
-        basic structure validation is sufficient for the orchestrator.
+        Runs the basic structure checks first and rejects malformed payloads without
+        calling the facilitator API; structurally valid payloads are then checked by the
+        facilitator API (if available), falling back to the basic result. Since payments
+        are already verified by the frontend facilitator before settlement, basic
+        structure validation is sufficient for the orchestrator. With
+        enforce_facilitator_verdict, a facilitator "invalid" is returned instead.
 
         Args:
             payment_payload: Decoded payment payload
             payment_requirements: Payment requirements to verify against
 
         Returns:
-            Verification result with 'isValid' and 'invalidReason' fields
-
-        Raises:
-            PaymentVerificationError: If verification fails critically
+            Verification result with 'isValid' and 'invalidReason' fields; failed checks
+            are reported there rather than raised
         """
-        # Try facilitator API first (preferred method)
-        if HTTPX_AVAILABLE and self.facilitator_url:
-            try:
-                result = self._verify_via_facilitator_api(payment_payload, payment_requirements)
-                # If facilitator API returns valid, use it
-                if result.get("isValid"):
-                    return result
-                # If invalid, fall through to basic validation
-            except PaymentVerificationError as e:
-                # If facilitator API is unavailable or signature check failed, fall back to basic validation
-                # This is expected if facilitator isn't running or has signature validation issues
-                # Silent fallback - no warnings needed
-                pass
-            except Exception as e:
-                # Silent fallback for other errors
-                pass
-
-        # Fallback to basic validation (structure checks only)
-        # Note: Since payment was already verified by frontend facilitator before settlement,
-        # this structure validation is sufficient for the orchestrator
+        # Structure checks first: they are cheap and local, so a malformed payload is
+        # rejected without a facilitator round trip
         try:
+            # Look up the fields the checks need once, and pass them down
+            network = payment_payload.get("network")
+            required_network = payment_requirements.get("network")
+            is_hedera = (required_network or "").startswith("hedera")
+
             # Verify scheme and network match
-            self._verify_scheme_and_network(payment_payload, payment_requirements)
+            self._verify_scheme_and_network(
+                payment_payload.get("scheme"),
+                payment_requirements.get("scheme"),
+                network,
+                required_network,
+            )
 
             # Verify payment payload structure
-            self._verify_payload_structure(payment_payload, payment_requirements)
+            payload_data = self._verify_payload_structure(payment_payload, is_hedera)
 
             # Verify transaction (if Hedera) - basic validation only
-            if payment_requirements.get("network", "").startswith("hedera"):
-                self._verify_hedera_transaction(payment_payload, payment_requirements)
-
-            # Basic validation passed
-            # Note: Payment was already verified by frontend facilitator, so structure validation is sufficient
-            return {
-                "isValid": True,
-                "invalidReason": None,
-            }
+            if is_hedera:
+                self._verify_hedera_transaction(payload_data, payment_requirements.get("asset", ""))
         except PaymentVerificationError as e:
             return {
                 "isValid": False,
@@ -219,7 +402,34 @@ class PaymentVerifier:
                 "invalidReason": "unexpected_verify_error",
             }
 
-    def _verify_via_facilitator_api(
+        # Then the facilitator API (preferred method), for structurally valid payloads only
+        if HTTPX_AVAILABLE and self.facilitator_url:
+            try:
+                result = await self._verify_via_facilitator_api(
+                    payment_payload, payment_requirements
+                )
+                # If facilitator API returns valid (or its verdict is enforced), use it
+                if result.get("isValid") or self.enforce_facilitator_verdict:
+                    return result
+                # If invalid, fall back to the basic validation result
+            except PaymentVerificationError:
+                # If facilitator API is unavailable or signature check failed, fall back to basic validation
+                # This is expected if facilitator isn't running or has signature validation issues
+                # Silent fallback - no warnings needed
+                pass
+            except Exception:
+                # Silent fallback for other errors
+                pass
+
+        # Basic validation passed
+        # Note: Since payment was already verified by frontend facilitator before settlement,
+        # this structure validation is sufficient for the orchestrator
+        return {
+            "isValid": True,
+            "invalidReason": None,
+        }
+
+    async def _verify_via_facilitator_api(
         self, payment_payload: dict[str, Any], payment_requirements: dict[str, Any]
     ) -> dict[str, Any]:
         """
@@ -243,26 +453,20 @@ class PaymentVerifier:
             verify_url = f"{self.facilitator_url}/verify"
             if not verify_url.startswith("http"):
                 verify_url = f"http://{verify_url}"
-            
-            # Also try direct facilitator URL if different
-            facilitator_urls = [
-                verify_url,  # Primary: configured facilitator URL
-                "http://localhost:3000/api/facilitator/verify",  # Frontend facilitator (fallback)
-            ]
+
+            # Configured facilitator first, then the frontend facilitator if it's a
+            # different URL (the default configuration points at the same one)
+            facilitator_urls = dict.fromkeys((verify_url, _FALLBACK_VERIFY_URL))
 
             last_error = None
             for verify_url in facilitator_urls:
                 try:
-                    if not verify_url.startswith("http"):
-                        verify_url = f"http://{verify_url}"
-
-                    response = httpx.post(
+                    response = await _get_facilitator_client().post(
                         verify_url,
                         json={
                             "paymentPayload": payment_payload,
                             "paymentRequirements": payment_requirements,
                         },
-                        timeout=5.0,  # Shorter timeout for faster fallback
                     )
 
                     if response.status_code == 200:
@@ -271,15 +475,15 @@ class PaymentVerifier:
                             "isValid": result.get("isValid", False),
                             "invalidReason": result.get("invalidReason"),
                         }
-                        
+
                         # If verification failed due to signature but structure is valid,
                         # this might be a false positive (payment was already verified by frontend)
                         if not verification_result["isValid"]:
-                            invalid_reason = verification_result.get("invalidReason", "").lower()
+                            invalid_reason = (verification_result["invalidReason"] or "").lower()
                             if "signature" in invalid_reason:
                                 # Don't return invalid - let it fall through to basic validation
                                 raise PaymentVerificationError("facilitator_signature_check_failed")
-                        
+
                         return verification_result
                 except (httpx.RequestError, httpx.TimeoutException) as e:
                     last_error = e
@@ -346,18 +550,16 @@ class PaymentVerifier:
         }
 
     def _verify_scheme_and_network(
-        self, payment_payload: dict[str, Any], payment_requirements: dict[str, Any]
+        self,
+        scheme: str | None,
+        required_scheme: str | None,
+        network: str | None,
+        required_network: str | None,
     ) -> None:
         """Verify scheme and network match."""
-        scheme = payment_payload.get("scheme")
-        required_scheme = payment_requirements.get("scheme")
-
         if scheme != required_scheme:
             raise PaymentVerificationError("unsupported_scheme")
 
-        network = payment_payload.get("network")
-        required_network = payment_requirements.get("network")
-
         if network != required_network:
             raise PaymentVerificationError("invalid_network")
 
@@ -366,30 +568,30 @@ class PaymentVerifier:
             raise PaymentVerificationError("invalid_network")
 
     def _verify_payload_structure(
-        self, payment_payload: dict[str, Any], payment_requirements: dict[str, Any]
-    ) -> None:
-        """Verify payment payload has required structure."""
+        self, payment_payload: dict[str, Any], is_hedera: bool
+    ) -> dict[str, Any]:
+        """Verify payment payload has required structure and return its payload data."""
         if "x402Version" not in payment_payload:
             raise PaymentVerificationError("invalid_payment_payload_structure")
 
-        if payment_payload.get("x402Version") != 1:
+        if payment_payload["x402Version"] != 1:
             raise PaymentVerificationError("invalid_x402_version")
 
         if "payload" not in payment_payload:
             raise PaymentVerificationError("invalid_payment_payload_structure")
 
-        payload_data = payment_payload.get("payload", {})
+        payload_data = payment_payload["payload"]
         if not isinstance(payload_data, dict):
             raise PaymentVerificationError("invalid_payment_payload_structure")
 
         # For Hedera, check for transaction field
-        if payment_requirements.get("network", "").startswith("hedera"):
+        if is_hedera:
             if "transaction" not in payload_data:
                 raise PaymentVerificationError("invalid_exact_hedera_payload_transaction")
 
-    def _verify_hedera_transaction(
-        self, payment_payload: dict[str, Any], payment_requirements: dict[str, Any]
-    ) -> None:
+        return payload_data
+
+    def _verify_hedera_transaction(self, payload_data: dict[str, Any], asset: str) -> None:
         """
         Verify Hedera transaction structure and details.
 
@@ -397,22 +599,21 @@ class PaymentVerifier:
         Full verification should be done via facilitator API.
         """
         # Extract transaction from payload
-        payload_data = payment_payload.get("payload", {})
         transaction_base64 = payload_data.get("transaction")
 
         if not transaction_base64:
             raise PaymentVerificationError("invalid_exact_hedera_payload_transaction")
 
-        # Basic validation: Check that transaction is base64 encoded
-        try:
-            transaction_bytes = base64.b64decode(transaction_base64)
-            if len(transaction_bytes) == 0:
-                raise PaymentVerificationError("invalid_exact_hedera_payload_transaction")
-        except Exception as e:
-            raise PaymentVerificationError("invalid_exact_hedera_payload_transaction") from e
+        # Basic validation: Check that transaction is base64 encoded. The bytes aren't
+        # needed here, so the string is matched rather than decoded
+        if (
+            not isinstance(transaction_base64, str)
+            or len(transaction_base64) % 4
+            or not _B64_RE.fullmatch(transaction_base64)
+        ):
+            raise PaymentVerificationError("invalid_exact_hedera_payload_transaction")
 
         # Verify asset type matches (basic validation)
-        asset = payment_requirements.get("asset", "")
         if asset == "0.0.0" or asset.lower() == "hbar":
             # HBAR transfer - basic validation passed
             pass
@@ -420,15 +621,14 @@ class PaymentVerifier:
             # Token transfer - verify token ID format
             if HIERO_AVAILABLE:
                 try:
-                    TokenId.fromString(asset)
+                    _hiero().TokenId.from_string(asset)
                 except Exception:
                     raise PaymentVerificationError(
                         "invalid_exact_hedera_payload_transaction_asset_mismatch"
                     )
             else:
                 # Without SDK, just check format (0.0.xxxxx)
-                import re
-                if not re.match(r"^0\.0\.\d+$", asset):
+                if not _ENTITY_ID_RE.match(asset):
                     raise PaymentVerificationError(
                         "invalid_exact_hedera_payload_transaction_asset_mismatch"
                     )
@@ -444,6 +644,9 @@ class PaymentVerifier:
         Verify a Hedera transaction ID on-chain.
 
         This is used when payment has already been settled and we have the transaction ID.
+        The ID's format and network are checked here; the transaction is then looked up
+        on the Hedera mirror node in the background (flush_transaction_checks() waits for
+        pending lookups), and mismatches are logged.
 
         Args:
             transaction_id: Hedera transaction ID (format: 0.0.xxxxx@timestamp.nanos)
@@ -451,11 +654,14 @@ class PaymentVerifier:
 
         Returns:
             Verification result with 'isValid' and 'invalidReason' fields
+
+        Raises:
+            PaymentVerificationError: If the transaction ID or network is invalid
         """
-        if not HIERO_AVAILABLE:
-            # Without Hedera SDK, we can't verify on-chain
+        if not HTTPX_AVAILABLE:
+            # Without httpx, we can't look the transaction up on-chain
             # But if we have a transaction ID, it means payment was already settled
-            print("⚠️  Warning: Cannot verify transaction on-chain (Hedera SDK not available)")
+            print("⚠️  Warning: Cannot verify transaction on-chain (httpx not available)")
             print(f"   Transaction ID: {transaction_id}")
             print("   Assuming valid (payment was already settled)")
             return {
@@ -464,50 +670,35 @@ class PaymentVerifier:
                 "note": "Transaction ID provided but on-chain verification unavailable",
             }
 
-        try:
-            # Parse transaction ID
-            # Format: 0.0.xxxxx@timestamp.nanos
-            parts = transaction_id.split("@")
-            if len(parts) != 2:
-                raise PaymentVerificationError("invalid_transaction_id_format")
-
-            account_id_str = parts[0]
-            timestamp_parts = parts[1].split(".")
-            if len(timestamp_parts) != 2:
-                raise PaymentVerificationError("invalid_transaction_id_format")
-
-            # Get Hedera client
-            network = payment_requirements.get("network", "hedera-testnet")
-            if "testnet" in network:
-                client = self._get_hedera_client("testnet")
-            elif "mainnet" in network:
-                client = self._get_hedera_client("mainnet")
-            else:
-                raise PaymentVerificationError("invalid_network")
+        # Parse transaction ID
+        # Format: 0.0.xxxxx@timestamp.nanos
+        parts = transaction_id.split("@")
+        if len(parts) != 2:
+            raise PaymentVerificationError("invalid_transaction_id_format")
+
+        timestamp_parts = parts[1].split(".")
+        if len(timestamp_parts) != 2:
+            raise PaymentVerificationError("invalid_transaction_id_format")
+
+        network = payment_requirements.get("network", "hedera-testnet")
+        if "testnet" in network:
+            network = "testnet"
+        elif "mainnet" in network:
+            network = "mainnet"
+        else:
+            raise PaymentVerificationError("invalid_network")
 
-            # Try to get transaction record (basic verification)
-            # Note: Full verification would require checking transaction details
-            # For now, if we can parse the transaction ID, we consider it valid
-            # In production, you'd want to query the transaction record from Hedera
+        # The payment was already settled, so the mirror node lookup doesn't hold up the
+        # response: it's queued for a background worker (see flush_transaction_checks)
+        # and the transaction ID is accepted now
+        _enqueue_transaction_check(transaction_id, network, payment_requirements)
 
-            print(f"✅ Transaction ID verified: {transaction_id}")
-            return {
-                "isValid": True,
-                "invalidReason": None,
-            }
-        except PaymentVerificationError:
-            raise
-        except Exception as e:
-            print(f"⚠️  Error verifying transaction ID: {e}")
-            # If verification fails but we have a transaction ID, assume it's valid
-            # (payment was already settled)
-            return {
-                "isValid": True,
-                "invalidReason": None,
-                "note": f"Transaction ID provided but verification failed: {e}",
-            }
+        return {
+            "isValid": True,
+            "invalidReason": None,
+        }
 
-    def verify_payment_header(
+    async def verify_payment_header(
         self, x_payment_header: str, payment_requirements: dict[str, Any]
     ) -> dict[str, Any]:
         """
@@ -538,8 +729,20 @@ class PaymentVerifier:
                         "invalidReason": "invalid_transaction_id",
                     }
 
-            # Otherwise, it's a payment payload - verify normally
-            return self.verify_payment(decoded, payment_requirements)
+            # Otherwise, it's a payment payload - verify normally, joining a verification
+            # of the same header that's already in progress
+            key = (x_payment_header.strip(), id(payment_requirements))
+            verification = _in_flight_verifications.get(key)
+            if verification is None:
+                verification = asyncio.ensure_future(
+                    self.verify_payment(decoded, payment_requirements)
+                )
+                _in_flight_verifications[key] = verification
+                verification.add_done_callback(lambda _: _in_flight_verifications.pop(key, None))
+
+            # Shielded, so one cancelled request doesn't cancel the others' verification;
+            # each caller gets its own copy of the shared result
+            return {**await asyncio.shield(verification)}
         except PaymentVerificationError as e:
             return {
                 "isValid": False,
@@ -0,0 +1,211 @@
+"""
+Request routing for Orchestrator Agent.
+
+Classifies user messages into intents and picks the A2A agent for them without
+an LLM call: keywords first, then common query shapes, then n-gram similarity to
+short intent profiles.
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Final
+
+from .agent_cards import AGENT_CARDS
+from .constants import SUPPORTED_CHAINS
+
+# Agent (as registered with send_message_to_a2a_agent) that serves each single-agent
+# intent. Swaps are a multi-agent workflow, so they are never routed directly
+_INTENT_AGENTS: Final[dict[str, str]] = {
+    intent: card.name for intent, card in AGENT_CARDS.items() if intent != "swap"
+}
+
+# One alternation with a named group per intent, so a message is classified in a
+# single regex pass
+_INTENT_PATTERN = re.compile(
+    "|".join(
+        rf"(?P<{intent}>\b(?:{keywords})\b)"
+        for intent, keywords in (
+            ("balance", r"balances?|wallets?|holdings?|popular|top\s+tokens?|trending\s+tokens?"),
+            ("swap", r"swap|swapping|exchange|convert"),
+            ("liquidity", r"liquidity|pools?|tvl|reserves?"),
+            ("sentiment", r"sentiment|social|trending\s+words?|mentions?|mentioned"),
+            ("trading", r"buy|sell|trade|trading"),
+            ("research", r"search|discover|research|token\s+address|contract"),
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# A token symbol; pronouns and determiners are excluded so follow-ups ("get it on
+# polygon") and advice questions ("buy BTC with my savings") don't match
+_SYMBOL = (
+    r"(?!(?:it|me|us|them|that|this|those|these|one|all|out|more|my|your|the)\b)"
+    r"[a-z][a-z0-9]{1,9}"
+)
+_ON_CHAIN = rf"\s+on\s+(?:{'|'.join(SUPPORTED_CHAINS)})"
+_AMOUNT = r"\$?\d+(?:\.\d+)?"
+
+# buy/sell/trade that names both sides ("buy USDC with HBAR", "sell 5 HBAR for USDC") is a
+# swap; naming only an amount ("sell 5 HBAR") could be either, so the model decides. Only
+# a bare token ("should I buy BTC") is a request for trading advice
+_TRADE_AS_SWAP = re.compile(
+    rf"\b(?:buy|sell|trade)\s+(?:{_AMOUNT}\s*)?{_SYMBOL}\s+(?:for|with|to|into)\s+"
+    rf"(?:{_AMOUNT}\s*)?{_SYMBOL}\b"
+)
+_TRADE_AMOUNT = re.compile(rf"\b(?:buy|sell|trade)\s+{_AMOUNT}")
+
+# Whole-message shapes of common requests that name no keyword, matched against the
+# normalized message: "check USDC on Polygon", "find WBTC on Polygon", "ETH/USDT"
+_QUERY_SHAPES: Final[tuple[tuple[str, re.Pattern[str]], ...]] = (
+    ("balance", re.compile(rf"(?:get|check|show)\s+(?:my\s+)?{_SYMBOL}{_ON_CHAIN}")),
+    ("research", re.compile(rf"find\s+{_SYMBOL}(?:{_ON_CHAIN})?")),
+    ("liquidity", re.compile(rf"{_SYMBOL}\s*/\s*{_SYMBOL}(?:{_ON_CHAIN}|\s+on\s+all)?")),
+)
+
+# What each single-agent intent is about, for messages no keyword or shape matches. Chain
+# names and token symbols are left out on purpose: they appear in every workflow and
+# in bare follow-ups ("on polygon please"), so they carry no routing signal
+_INTENT_PROFILES: Final[dict[str, str]] = {
+    "balance": (
+        "account balance wallet balances native token balances erc-20 hts tokens usd value "
+        "how much do I have own holdings portfolio popular trending top tokens"
+    ),
+    "liquidity": (
+        "liquidity pools pool address dex tvl reserves token pair slot0 depth of a market "
+        "pair swap route available"
+    ),
+    "sentiment": (
+        "cryptocurrency sentiment analysis social volume social dominance trending words "
+        "social shifts what people are saying mentions on social media santiment"
+    ),
+    "trading": (
+        "should I buy or sell trading recommendation entry price stop loss targets technical "
+        "analysis rsi macd moving averages good time to invest price prediction outlook"
+    ),
+    "research": (
+        "search discover token contract address find token on chain coingecko market cap "
+        "rank decimals new tokens token info lookup"
+    ),
+}
+
+# A profile only wins when it is both similar enough and clearly ahead of the next
+# one; follow-ups such as "yes" or an account address score well below this
+_MIN_SIMILARITY = 0.2
+_MIN_MARGIN = 0.08
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Trailing characters that don't change what a message asks for ("get balance?!")
+_TRAILING_PUNCTUATION = " .,;:!?"
+
+
+def _ngram_features(text: str) -> Counter[str]:
+    """Bag of words plus character trigrams (so plurals and typos still overlap)."""
+    features: Counter[str] = Counter()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        features["w:" + word] += 1
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            features[padded[i : i + 3]] += 1
+    return features
+
+
+def _norm(features: Counter[str]) -> float:
+    return math.sqrt(sum(count * count for count in features.values()))
+
+
+# Profile vectors are built once at import; a query is then compared against each
+# with a sparse dot product over the query's own features
+_PROFILE_VECTORS: Final[tuple[tuple[str, Counter[str], float], ...]] = tuple(
+    (intent, features, _norm(features))
+    for intent, features in (
+        (intent, _ngram_features(profile)) for intent, profile in _INTENT_PROFILES.items()
+    )
+)
+
+
+def nearest_intent(query: str) -> str | None:
+    """
+    Match a message to the most similar intent profile by cosine similarity.
+
+    Args:
+        query: The user's message text
+
+    Returns:
+        Intent name, or None if no profile is a clear match
+    """
+    features = _ngram_features(query)
+    query_norm = _norm(features)
+    if not query_norm:
+        return None
+    best_intent, best, runner_up = None, 0.0, 0.0
+    for intent, profile, profile_norm in _PROFILE_VECTORS:
+        score = sum(count * profile.get(feature, 0) for feature, count in features.items())
+        score /= query_norm * profile_norm
+        if score > best:
+            best_intent, best, runner_up = intent, score, best
+        elif score > runner_up:
+            runner_up = score
+    if best < _MIN_SIMILARITY or best - runner_up < _MIN_MARGIN:
+        return None
+    return best_intent
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case, collapse whitespace and drop trailing punctuation."""
+    return _WHITESPACE_PATTERN.sub(" ", query).strip().rstrip(_TRAILING_PUNCTUATION).lower()
+
+
+@lru_cache(maxsize=1024)
+def _classify_normalized(query: str) -> frozenset[str]:
+    intents = frozenset(match.lastgroup for match in _INTENT_PATTERN.finditer(query))
+    if "trading" in intents:
+        if _TRADE_AS_SWAP.search(query):
+            intents = intents - {"trading"} | {"swap"}
+        elif _TRADE_AMOUNT.search(query):
+            intents |= {"swap"}
+    if intents:
+        return intents
+    for intent, shape in _QUERY_SHAPES:
+        if shape.fullmatch(query):
+            return frozenset((intent,))
+    intent = nearest_intent(query)
+    return frozenset((intent,)) if intent else frozenset()
+
+
+def classify_intents(query: str) -> frozenset[str]:
+    """
+    Classify a user message into the intents it touches.
+
+    Keywords are tried first, then the shapes of common requests that name no
+    keyword ("check USDC on Polygon"); anything else falls back to nearest_intent.
+    A buy/sell naming both tokens is a swap, and one naming an amount may be either.
+    Results are cached by normalized message, since users repeat the same short
+    requests ("get popular tokens") across sessions.
+
+    Args:
+        query: The user's message text
+
+    Returns:
+        Set of intent names (empty if nothing matched)
+    """
+    return _classify_normalized(normalize_query(query))
+
+
+def route_intent(intents: frozenset[str]) -> str | None:
+    """
+    Pick the agent for a request deterministically from its classified intents.
+
+    Args:
+        intents: Intent names from classify_intents
+
+    Returns:
+        Agent name, or None when the request is ambiguous (no intent, several
+        intents, or a swap) and the model has to decide from the routing rules
+    """
+    if len(intents) != 1:
+        return None
+    return _INTENT_AGENTS.get(next(iter(intents)))
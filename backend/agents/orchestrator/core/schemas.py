@@ -0,0 +1,31 @@
+"""
+Response schemas for Orchestrator Agent.
+
+Example shapes of the structured JSON the orchestrator returns, rendered into the
+instruction so the prompt and any consumer share one definition.
+"""
+
+from typing import Any, Final
+
+# Multi-chain liquidity response; "results" holds one entry per queried chain, in the
+# shape LiquidityFinder's response builder returns
+LIQUIDITY_RESPONSE_V1: Final[dict[str, Any]] = {
+    "type": "liquidity",
+    "chain": "ethereum | polygon | hedera | all",
+    "token_a": "0x...",
+    "token_b": "0x...",
+    "results": [
+        {
+            "chain": "ethereum",
+            "pool_address": "0x...",
+            "token_a": "0x...",
+            "token_b": "0x...",
+            "fee": 3000,
+            "liquidity": "1000000",
+            "tick": 12345,
+            "sqrt_price_x96": "0x...",
+            "status": "success",
+        }
+    ],
+    "error": None,
+}
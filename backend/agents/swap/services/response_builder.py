@@ -312,50 +312,55 @@ def _get_pool_info(
                 token_out_address_evm = whbar_info.get("address", token_out_address_evm)
                 print(f"🔄 Converted HBAR to wHBAR for pool lookup: {token_out_address_evm}")
 
-        # Try each fee tier until we find a pool
-        for fee in FEE_TIERS:
-            try:
-                if chain == "hedera":
-                    from packages.blockchain.hedera.saucerswap.pool.web3_client import (
-                        SaucerSwapWeb3Client,
-                    )
-
-                    client = SaucerSwapWeb3Client(rpc_url=rpc_url, network="mainnet")
-                elif chain == "polygon":
-                    from packages.blockchain.polygon.uniswap.pool.web3_client import (
-                        UniswapWeb3Client,
-                    )
-
-                    client = UniswapWeb3Client(rpc_url=rpc_url, network="mainnet")
-                elif chain == "ethereum":
-                    from packages.blockchain.ethereum.uniswap.pool.web3_client import (
-                        UniswapWeb3Client,
-                    )
-
-                    client = UniswapWeb3Client(rpc_url=rpc_url, network="mainnet")
-                else:
-                    return None
-
-                pool_info = client.get_pool_info(
-                    token_a=token_in_address_evm,
-                    token_b=token_out_address_evm,
-                    fee=fee,
-                )
+        # SaucerSwap also has a 1500 (0.15%) tier that the generic Uniswap tiers lack
+        fee_tiers = FEE_TIERS
+        if chain == "hedera":
+            from packages.blockchain.hedera.saucerswap.pool.web3_client import (
+                HEDERA_FEE_TIERS,
+                SaucerSwapWeb3Client,
+            )
+
+            client = SaucerSwapWeb3Client(rpc_url=rpc_url, network="mainnet")
+            fee_tiers = HEDERA_FEE_TIERS
+        elif chain == "polygon":
+            from packages.blockchain.polygon.uniswap.pool.web3_client import (
+                UniswapWeb3Client,
+            )
+
+            client = UniswapWeb3Client(rpc_url=rpc_url, network="mainnet")
+        elif chain == "ethereum":
+            from packages.blockchain.ethereum.uniswap.pool.web3_client import (
+                UniswapWeb3Client,
+            )
+
+            client = UniswapWeb3Client(rpc_url=rpc_url, network="mainnet")
+        else:
+            return None
+
+        try:
+            # One aggregated getPool lookup across all fee tiers, then one pool read
+            pool_info = client.get_pool_info_multicall(
+                token_in_address_evm, token_out_address_evm, fee_tiers
+            )
+        except ValueError as e:
+            # Multicall3 unavailable; get_pool_info walks the fee tiers one call at a time
+            print(f"⚠️ Multicall pool lookup failed on {chain}, trying each fee tier: {e}")
+            pool_info = client.get_pool_info(
+                token_a=token_in_address_evm,
+                token_b=token_out_address_evm,
+                fee=fee_tiers[0],
+            )
 
-                if pool_info:
-                    print(
-                        f"✅ Found pool on {chain} with fee {fee} bps: {pool_info.get('pool_address')}"
-                    )
-                    return {
-                        "pool_address": pool_info.get("pool_address"),
-                        "liquidity": str(pool_info.get("liquidity", "0")),
-                        "fee": pool_info.get("fee", fee),
-                        "tick": pool_info.get("slot0", {}).get("tick", 0),
-                        "sqrt_price_x96": str(pool_info.get("slot0", {}).get("sqrtPriceX96", "0")),
-                    }
-            except Exception as e:
-                print(f"⚠️ Error checking fee tier {fee}: {e}")
-                continue
+        if pool_info:
+            fee = pool_info.get("fee")
+            print(f"✅ Found pool on {chain} with fee {fee} bps: {pool_info.get('pool_address')}")
+            return {
+                "pool_address": pool_info.get("pool_address"),
+                "liquidity": str(pool_info.get("liquidity", "0")),
+                "fee": fee,
+                "tick": pool_info.get("slot0", {}).get("tick", 0),
+                "sqrt_price_x96": str(pool_info.get("slot0", {}).get("sqrtPriceX96", "0")),
+            }
 
         print(f"⚠️ No pool found for {token_in_address_evm}/{token_out_address_evm} on {chain}")
         return None
@@ -6,6 +6,11 @@ from typing import Optional
 import requests
 from langchain_community.tools import DuckDuckGoSearchRun
 
+# Contract lookups by (symbol, chain). Addresses, decimals and names don't change, so
+# hits are kept for the life of the process; misses aren't cached, since they include
+# rate limits and network errors
+_CONTRACT_ADDRESS_CACHE: dict[tuple[str, str], dict] = {}
+
 
 def search_token_on_web(token_symbol: str) -> dict | None:
     """
@@ -56,6 +61,9 @@ def search_token_contract_address(token_symbol: str, chain: str) -> dict | None:
     """
     Search for token contract address on a specific chain using CoinGecko API.
 
+    Results are cached per symbol and chain, so repeat lookups (the swap and
+    liquidity resolvers ask for the same tokens on every request) skip CoinGecko.
+
     Args:
         token_symbol: Token symbol (e.g., "USDT")
         chain: Chain name (e.g., "ethereum", "polygon", "hedera")
@@ -63,6 +71,17 @@ def search_token_contract_address(token_symbol: str, chain: str) -> dict | None:
     Returns:
         Dictionary with contract address and token info, or None if not found
     """
+    key = (token_symbol.upper(), chain.lower())
+    cached = _CONTRACT_ADDRESS_CACHE.get(key)
+    if cached is not None:
+        return cached.copy()
+    token_info = _fetch_token_contract_address(token_symbol, chain)
+    if token_info is not None:
+        _CONTRACT_ADDRESS_CACHE[key] = token_info.copy()
+    return token_info
+
+
+def _fetch_token_contract_address(token_symbol: str, chain: str) -> dict | None:
     api_key = os.getenv("COINGECKO_API_KEY")
 
     try:
@@ -0,0 +1,130 @@
+"""Tests for batched ERC-20 balance reads, with the RPC node mocked."""
+
+import logging
+
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from packages.blockchain.dex.abis.multicall3 import MULTICALL3_ADDRESS
+from packages.blockchain.dex.utils.token_balances import get_token_balances_multicall
+from packages.blockchain.ethereum.balance import balance_client as ethereum_balance_client
+from packages.blockchain.ethereum.constants import ETHEREUM_TOKENS
+from packages.blockchain.polygon.balance import balance_client as polygon_balance_client
+
+ACCOUNT = "0x000000000000000000000000000000000000dEaD"
+
+
+class _MulticallNode(BaseProvider):
+    """Provider answering Multicall3 aggregate3 eth_calls with per-token balances."""
+
+    def __init__(self, balances: dict[str, int | None]):
+        super().__init__()
+        # Token address (lower case) -> balance, or None for a reverting balanceOf
+        self.balances = {address.lower(): balance for address, balance in balances.items()}
+        self.batches: list[list[str]] = []
+
+    def make_request(self, method, params):
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x1"}
+        assert method == "eth_call"
+        call = params[0]
+        assert call["to"].lower() == MULTICALL3_ADDRESS.lower()
+        (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(call["data"][10:]))
+        self.batches.append([target for target, _allow_failure, _data in calls])
+        results = [
+            (False, b"")
+            if self.balances.get(target.lower()) is None
+            else (True, encode(["uint256"], [self.balances[target.lower()]]))
+            for target, _allow_failure, _data in calls
+        ]
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": "0x" + encode(["(bool,bytes)[]"], [results]).hex(),
+        }
+
+
+def _address(symbol: str) -> str:
+    return ETHEREUM_TOKENS[symbol]["address"]
+
+
+def test_balances_are_read_in_one_batch():
+    """Every known token is read in a single eth_call and returned in request order."""
+    node = _MulticallNode({_address("USDC"): 2_500_000, _address("WETH"): 10**18})
+    w3 = Web3(node)
+
+    balances = get_token_balances_multicall(
+        w3, ACCOUNT, ["usdc", "WETH", "USDC"], ETHEREUM_TOKENS, "ETHEREUM_TOKENS"
+    )
+
+    assert len(node.batches) == 1
+    assert len(node.batches[0]) == 2  # USDC is only read once
+    assert [b["token_symbol"] for b in balances] == ["USDC", "WETH", "USDC"]
+    assert balances[0]["balance"] == "2.5"
+    assert balances[0]["balance_raw"] == "2500000"
+    assert balances[0]["decimals"] == 6
+    assert balances[1]["balance"] == "1.0"
+    assert "error" not in balances[1]
+
+
+def test_unknown_and_reverting_tokens_get_errors():
+    """Unknown symbols and reverting balanceOf calls are reported per token."""
+    node = _MulticallNode({_address("DAI"): None, _address("WBTC"): 10**8})
+    w3 = Web3(node)
+
+    balances = get_token_balances_multicall(
+        w3, ACCOUNT, ["NOPE", "DAI", "WBTC"], ETHEREUM_TOKENS, "ETHEREUM_TOKENS"
+    )
+
+    assert balances[0]["error"] == "Token NOPE not found in ETHEREUM_TOKENS"
+    assert balances[1]["error"] == "Failed to fetch DAI balance: balanceOf reverted"
+    assert balances[1]["balance"] == "0"
+    assert balances[2]["balance"] == "1.0"
+
+
+def test_only_unknown_tokens_make_no_call():
+    """Without a known token there is nothing to batch."""
+    node = _MulticallNode({})
+
+    balances = get_token_balances_multicall(
+        Web3(node), ACCOUNT, ["NOPE"], ETHEREUM_TOKENS, "ETHEREUM_TOKENS"
+    )
+
+    assert node.batches == []
+    assert "error" in balances[0]
+
+
+@pytest.mark.parametrize(
+    ("balance_client", "get_multiple", "get_one"),
+    [
+        (
+            ethereum_balance_client,
+            "get_multiple_token_balances_ethereum",
+            "get_token_balance_ethereum",
+        ),
+        (
+            polygon_balance_client,
+            "get_multiple_token_balances_polygon",
+            "get_token_balance_polygon",
+        ),
+    ],
+)
+def test_failed_batch_is_logged_and_falls_back(
+    monkeypatch, caplog, balance_client, get_multiple, get_one
+):
+    """A failing multicall is logged and the tokens are fetched one at a time."""
+
+    def failing_batch(*args):
+        raise ValueError("execution reverted")
+
+    monkeypatch.setattr(balance_client, "_get_web3_instance", lambda: None)
+    monkeypatch.setattr(balance_client, "get_token_balances_multicall", failing_batch)
+    monkeypatch.setattr(balance_client, get_one, lambda account, symbol: {"token_symbol": symbol})
+
+    with caplog.at_level(logging.WARNING, logger=balance_client.__name__):
+        balances = getattr(balance_client, get_multiple)(ACCOUNT, ["USDC", "DAI"])
+
+    assert balances == [{"token_symbol": "USDC"}, {"token_symbol": "DAI"}]
+    assert "execution reverted" in caplog.text
@@ -1,6 +1,7 @@
 """DEX ABI definitions."""
 
 from packages.blockchain.dex.abis.erc20 import ERC20_ABI
+from packages.blockchain.dex.abis.multicall3 import MULTICALL3_ABI, MULTICALL3_ADDRESS
 from packages.blockchain.dex.abis.uniswapv2router import UNISWAP_V2_ROUTER_ABI
 from packages.blockchain.dex.abis.uniswapv3factory import UNISWAP_V3_FACTORY_ABI
 from packages.blockchain.dex.abis.uniswapv3pool import UNISWAP_V3_POOL_ABI
@@ -12,4 +13,6 @@ __all__ = [
     "UNISWAP_V3_POOL_ABI",
     "UNISWAP_V3_ROUTER_ABI",
     "ERC20_ABI",
+    "MULTICALL3_ABI",
+    "MULTICALL3_ADDRESS",
 ]
@@ -6,7 +6,12 @@ from typing import Optional
 from web3 import Web3
 from web3.contract import Contract
 
-from packages.blockchain.dex.abis import UNISWAP_V3_FACTORY_ABI, UNISWAP_V3_POOL_ABI
+from packages.blockchain.dex.abis import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    UNISWAP_V3_FACTORY_ABI,
+    UNISWAP_V3_POOL_ABI,
+)
 from packages.blockchain.dex.base.types import PoolInfo, Slot0Data
 from packages.blockchain.dex.utils.address import normalize_address
 from packages.blockchain.dex.utils.errors import InvalidAddressError, InvalidFeeTierError
@@ -14,6 +19,11 @@ from packages.blockchain.dex.utils.errors import InvalidAddressError, InvalidFee
 # Uniswap V3 fee tiers (in basis points)
 FEE_TIERS = [500, 3000, 10000]  # 0.05%, 0.3%, 1%
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# ABI output types used to decode aggregated pool reads
+_SLOT0_OUTPUT_TYPES = ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"]
+
 __all__ = ["BaseUniswapV3Client", "FEE_TIERS"]
 
 
@@ -25,6 +35,7 @@ class BaseUniswapV3Client:
         rpc_url: str,
         factory_address: str,
         network_name: str = "mainnet",
+        multicall_address: str = MULTICALL3_ADDRESS,
     ):
         """
         Initialize Web3 client.
@@ -33,13 +44,16 @@ class BaseUniswapV3Client:
             rpc_url: RPC endpoint URL
             factory_address: Factory contract address
             network_name: Network name for identification
+            multicall_address: Multicall3 contract address used to batch reads
         """
         from web3.providers import HTTPProvider
 
         self.w3 = Web3(HTTPProvider(rpc_url))
         self.factory_address = factory_address
         self.network_name = network_name
+        self.multicall_address = multicall_address
         self._factory_contract: Contract | None = None
+        self._multicall_contract: Contract | None = None
         self.logger = logging.getLogger(f"{self.__class__.__name__}.{network_name}")
 
     @property
@@ -52,6 +66,16 @@ class BaseUniswapV3Client:
             )
         return self._factory_contract
 
+    @property
+    def multicall_contract(self) -> Contract:
+        """Get Multicall3 contract instance."""
+        if self._multicall_contract is None:
+            self._multicall_contract = self.w3.eth.contract(
+                address=normalize_address(self.multicall_address),
+                abi=MULTICALL3_ABI,
+            )
+        return self._multicall_contract
+
     def get_pool_address(
         self,
         token_a: str,
@@ -250,6 +274,125 @@ class BaseUniswapV3Client:
         )
         return None
 
+    def get_pool_info_multicall(
+        self,
+        token_a: str,
+        token_b: str,
+        fee_tiers: tuple[int, ...] | list[int],
+    ) -> PoolInfo | None:
+        """
+        Get pool information for the first fee tier (in order) that has a pool.
+
+        Batches every factory.getPool lookup into one Multicall3 aggregate3 call, then
+        reads liquidity() and slot0() of the matching pool in a second aggregate3 call,
+        instead of issuing up to three eth_calls per fee tier.
+
+        Args:
+            token_a: Token A address
+            token_b: Token B address
+            fee_tiers: Fee tiers to look up, in order of preference
+
+        Returns:
+            PoolInfo dictionary or None if pool doesn't exist for any fee tier
+
+        Raises:
+            InvalidAddressError: If invalid address format
+            ValueError: If the multicall fails
+        """
+        if not token_a or not token_b:
+            raise InvalidAddressError("Both token_a and token_b addresses are required")
+
+        if token_a == token_b:
+            raise InvalidAddressError("token_a and token_b must be different")
+
+        try:
+            token_a = normalize_address(token_a)
+            token_b = normalize_address(token_b)
+        except ValueError as e:
+            raise InvalidAddressError(f"Invalid address format: {str(e)}") from e
+
+        token0, token1 = (token_a, token_b) if token_a < token_b else (token_b, token_a)
+        codec = self.w3.codec
+        factory = self.factory_contract
+
+        try:
+            get_pool_results = self.multicall_contract.functions.aggregate3(
+                [
+                    (
+                        factory.address,
+                        True,
+                        factory.functions.getPool(token0, token1, fee)._encode_transaction_data(),
+                    )
+                    for fee in fee_tiers
+                ]
+            ).call()
+
+            pool_address = None
+            found_fee = None
+            for fee, (success, return_data) in zip(fee_tiers, get_pool_results, strict=True):
+                if not success or not return_data:
+                    continue
+                candidate = codec.decode(["address"], return_data)[0]
+                if candidate and candidate != ZERO_ADDRESS:
+                    # The codec returns lower-case hex; contracts need the checksummed form
+                    pool_address, found_fee = normalize_address(candidate), fee
+                    break
+
+            if pool_address is None:
+                self.logger.info(
+                    f"No pool found for fee tiers {list(fee_tiers)} (multicall). "
+                    f"token_a={token_a}, token_b={token_b}, network={self.network_name}"
+                )
+                return None
+
+            pool_contract = self.w3.eth.contract(address=pool_address, abi=UNISWAP_V3_POOL_ABI)
+            (liquidity_ok, liquidity_data), (slot0_ok, slot0_data) = (
+                self.multicall_contract.functions.aggregate3(
+                    [
+                        (
+                            pool_address,
+                            False,
+                            pool_contract.functions.liquidity()._encode_transaction_data(),
+                        ),
+                        (
+                            pool_address,
+                            False,
+                            pool_contract.functions.slot0()._encode_transaction_data(),
+                        ),
+                    ]
+                ).call()
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to get pool info via multicall: {str(e)}") from e
+
+        liquidity = codec.decode(["uint128"], liquidity_data)[0]
+        slot0 = codec.decode(_SLOT0_OUTPUT_TYPES, slot0_data)
+
+        self.logger.info(
+            f"Successfully retrieved pool info (multicall): fee={found_fee} bps, "
+            f"liquidity={liquidity}, tick={slot0[1]}, pool_address={pool_address}"
+        )
+
+        token_a_norm = token_a.lower()
+        token_b_norm = token_b.lower()
+
+        return PoolInfo(
+            pool_address=pool_address,
+            token0=min(token_a_norm, token_b_norm),
+            token1=max(token_a_norm, token_b_norm),
+            fee=found_fee,
+            liquidity=liquidity,
+            slot0=Slot0Data(
+                sqrtPriceX96=slot0[0],
+                tick=slot0[1],
+                observationIndex=slot0[2],
+                observationCardinality=slot0[3],
+                observationCardinalityNext=slot0[4],
+                feeProtocol=slot0[5],
+                unlocked=slot0[6],
+            ),
+        )
+
     def get_all_fee_tier_pools(
         self,
         token_a: str,
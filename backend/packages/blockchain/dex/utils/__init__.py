@@ -9,6 +9,7 @@ from packages.blockchain.dex.utils.errors import (
     InvalidFeeTierError,
     PoolNotFoundError,
 )
+from packages.blockchain.dex.utils.token_balances import get_token_balances_multicall
 
 __all__ = [
     "normalize_address",
@@ -17,4 +18,5 @@ __all__ = [
     "InvalidAddressError",
     "InvalidFeeTierError",
     "PoolNotFoundError",
+    "get_token_balances_multicall",
 ]
@@ -0,0 +1,91 @@
+"""Batched ERC-20 balance reads through Multicall3."""
+
+from web3 import Web3
+
+from packages.blockchain.dex.abis.erc20 import ERC20_ABI
+from packages.blockchain.dex.abis.multicall3 import MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+
+def get_token_balances_multicall(
+    w3: Web3,
+    account_address: str,
+    token_symbols: list[str],
+    tokens: dict[str, dict],
+    tokens_name: str,
+) -> list[dict]:
+    """
+    Fetch token balances with one Multicall3 aggregate3 eth_call.
+
+    Args:
+        w3: Web3 instance for the chain
+        account_address: Account address (0x...)
+        token_symbols: List of token symbols
+        tokens: The chain's token table (symbol -> address and decimals)
+        tokens_name: Name of the token table, for the error of unknown symbols
+
+    Returns:
+        List of balance dictionaries, in token_symbols order
+
+    Raises:
+        Exception: Whatever web3 raises if the batched call itself fails
+    """
+    account_address = w3.to_checksum_address(account_address)
+
+    # One balanceOf per distinct known token; allowFailure keeps one bad token from
+    # failing the whole batch
+    known = list(dict.fromkeys(s.upper() for s in token_symbols if s.upper() in tokens))
+    addresses = {symbol: w3.to_checksum_address(tokens[symbol]["address"]) for symbol in known}
+    returns = {}
+    if known:
+        # balanceOf(account) encodes the same for every token
+        call_data = (
+            w3.eth.contract(address=addresses[known[0]], abi=ERC20_ABI)
+            .functions.balanceOf(account_address)
+            ._encode_transaction_data()
+        )
+        multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        results = multicall.functions.aggregate3(
+            [(addresses[symbol], True, call_data) for symbol in known]
+        ).call()
+        returns = dict(zip(known, results, strict=True))
+
+    balances = []
+    for token_symbol in token_symbols:
+        symbol = token_symbol.upper()
+        if symbol not in returns:
+            balances.append(
+                {
+                    "token_symbol": token_symbol,
+                    "token_address": "0x0",
+                    "balance": "0",
+                    "balance_raw": "0",
+                    "decimals": 18,
+                    "error": f"Token {token_symbol} not found in {tokens_name}",
+                }
+            )
+            continue
+        decimals = tokens[symbol].get("decimals", 18)
+        success, return_data = returns[symbol]
+        if not success or not return_data:
+            balances.append(
+                {
+                    "token_symbol": symbol,
+                    "token_address": addresses[symbol],
+                    "balance": "0",
+                    "balance_raw": "0",
+                    "decimals": decimals,
+                    "error": f"Failed to fetch {token_symbol} balance: balanceOf reverted",
+                }
+            )
+            continue
+        balance_raw = w3.codec.decode(["uint256"], return_data)[0]
+        balances.append(
+            {
+                "token_symbol": symbol,
+                "token_address": addresses[symbol],
+                "balance": str(balance_raw / (10**decimals)),
+                "balance_raw": str(balance_raw),
+                "decimals": decimals,
+            }
+        )
+    return balances
@@ -1,15 +1,19 @@
 """Ethereum balance client for getting token and native ETH balances."""
 
+import logging
 import os
 
 from web3 import Web3
 from web3.providers import HTTPProvider
 
 from packages.blockchain.dex.abis.erc20 import ERC20_ABI
+from packages.blockchain.dex.utils.token_balances import get_token_balances_multicall
 from packages.blockchain.ethereum.constants import ETHEREUM_TOKENS
 
 ETHEREUM_MAINNET_RPC = os.getenv("ETHEREUM_MAINNET_RPC", "https://eth.llamarpc.com")
 
+logger = logging.getLogger(__name__)
+
 
 def _get_web3_instance() -> Web3:
     """Get Web3 instance for Ethereum."""
@@ -171,15 +175,20 @@ def get_multiple_token_balances_ethereum(
     """
     Get balances for multiple tokens on Ethereum.
 
+    All balanceOf reads go out as one Multicall3 eth_call; if that batch fails, the
+    tokens are fetched one at a time.
+
     Args:
         account_address: Account address (0x...)
         token_symbols: List of token symbols
 
     Returns:
-        List of balance dictionaries
+        List of balance dictionaries, in token_symbols order
     """
-    results = []
-    for symbol in token_symbols:
-        result = get_token_balance_ethereum(account_address, symbol)
-        results.append(result)
-    return results
+    try:
+        return get_token_balances_multicall(
+            _get_web3_instance(), account_address, token_symbols, ETHEREUM_TOKENS, "ETHEREUM_TOKENS"
+        )
+    except Exception as e:
+        logger.warning("Multicall balance batch failed, fetching tokens one at a time: %s", e)
+        return [get_token_balance_ethereum(account_address, symbol) for symbol in token_symbols]
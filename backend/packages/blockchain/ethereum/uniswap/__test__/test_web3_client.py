@@ -141,6 +141,30 @@ class TestGetPoolSlot0:
             raise
 
 
+class TestGetPoolInfoMulticall:
+    """Tests for get_pool_info_multicall method - Real network calls."""
+
+    def test_get_pool_info_multicall_real_pool(self, mainnet_client, sample_tokens):
+        """Test batched pool lookup across all fee tiers."""
+        try:
+            pool_info = mainnet_client.get_pool_info_multicall(
+                sample_tokens["WETH"], sample_tokens["USDC"], tuple(FEE_TIERS)
+            )
+
+            if pool_info:
+                assert pool_info["fee"] in FEE_TIERS
+                assert pool_info["pool_address"].startswith("0x")
+                assert isinstance(pool_info["liquidity"], int)
+                assert "tick" in pool_info["slot0"]
+                print(f"\nPool info (multicall): fee={pool_info['fee']}")
+            else:
+                pytest.skip("Pool does not exist on mainnet")
+        except ValueError as e:
+            if "Failed to get" in str(e):
+                pytest.skip(f"Multicall failed: {e}")
+            raise
+
+
 class TestFeeTiers:
     """Tests for FEE_TIERS constant."""
 
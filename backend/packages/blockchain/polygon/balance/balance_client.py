@@ -1,15 +1,19 @@
 """Polygon balance client for getting token and native balances."""
 
+import logging
 import os
 
 from web3 import Web3
 from web3.providers import HTTPProvider
 
 from packages.blockchain.dex.abis.erc20 import ERC20_ABI
+from packages.blockchain.dex.utils.token_balances import get_token_balances_multicall
 from packages.blockchain.polygon.constants import POLYGON_TOKENS
 
 POLYGON_MAINNET_RPC = os.getenv("POLYGON_MAINNET_RPC", "https://polygon-rpc.com")
 
+logger = logging.getLogger(__name__)
+
 
 def _get_web3_instance() -> Web3:
     """Get Web3 instance for Polygon."""
@@ -132,15 +136,20 @@ def get_multiple_token_balances_polygon(
     """
     Get balances for multiple tokens on Polygon.
 
+    All balanceOf reads go out as one Multicall3 eth_call; if that batch fails, the
+    tokens are fetched one at a time.
+
     Args:
         account_address: Account address (0x...)
         token_symbols: List of token symbols
 
     Returns:
-        List of balance dictionaries
+        List of balance dictionaries, in token_symbols order
     """
-    results = []
-    for symbol in token_symbols:
-        result = get_token_balance_polygon(account_address, symbol)
-        results.append(result)
-    return results
+    try:
+        return get_token_balances_multicall(
+            _get_web3_instance(), account_address, token_symbols, POLYGON_TOKENS, "POLYGON_TOKENS"
+        )
+    except Exception as e:
+        logger.warning("Multicall balance batch failed, fetching tokens one at a time: %s", e)
+        return [get_token_balance_polygon(account_address, symbol) for symbol in token_symbols]
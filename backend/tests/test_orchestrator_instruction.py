@@ -0,0 +1,67 @@
+"""Tests for the orchestrator's per-turn instruction provider."""
+
+from types import SimpleNamespace
+
+from google.adk.events import Event
+from google.genai import types
+
+from agents.orchestrator.agent import make_instruction_provider
+from agents.orchestrator.core.constants import SUPPORTED_AGENTS, SUPPORTED_CHAINS
+from agents.orchestrator.core.instruction import INSTRUCTION_SECTIONS
+
+ENABLED_AGENTS = frozenset(SUPPORTED_AGENTS)
+ENABLED_CHAINS = frozenset(SUPPORTED_CHAINS)
+
+
+def _content(role: str, text: str) -> types.Content:
+    return types.Content(role=role, parts=[types.Part(text=text)])
+
+
+def _context(*turns: tuple[str, str]) -> SimpleNamespace:
+    """Read-only context whose session holds the given (author, text) turns."""
+    events = [
+        Event(author=author, content=_content("user" if author == "user" else "model", text))
+        for author, text in turns
+    ]
+    user_content = next(event.content for event in reversed(events) if event.author == "user")
+    return SimpleNamespace(session=SimpleNamespace(events=events), user_content=user_content)
+
+
+def _instruction(*turns: tuple[str, str]) -> str:
+    provider = make_instruction_provider(ENABLED_AGENTS, ENABLED_CHAINS)
+    return provider(_context(*turns))
+
+
+def test_single_turn_gets_only_its_workflow():
+    """A lone balance request gets the balance workflow and a routing hint."""
+    instruction = _instruction(("user", "get my wallet balance on hedera"))
+
+    assert INSTRUCTION_SECTIONS["workflow_balance"] in instruction
+    assert INSTRUCTION_SECTIONS["workflow_swap"] not in instruction
+    assert "ROUTING HINT:" in instruction
+
+
+def test_swap_follow_up_keeps_the_swap_workflow():
+    """A follow-up in the middle of a swap keeps the swap workflow and its routing rules."""
+    instruction = _instruction(
+        ("user", "swap 10 HBAR for USDC on hedera"),
+        ("OrchestratorAgent", "What is your Hedera account address?"),
+        ("user", "my wallet address is 0.0.1234"),
+    )
+
+    assert INSTRUCTION_SECTIONS["workflow_swap"] in instruction
+    assert INSTRUCTION_SECTIONS["workflow_balance"] in instruction
+    assert INSTRUCTION_SECTIONS["routing_rules"] in instruction
+    assert "ROUTING HINT:" not in instruction
+
+
+def test_agent_replies_do_not_add_intents():
+    """Only user turns are classified; the agent's own wording never pulls in sections."""
+    instruction = _instruction(
+        ("user", "get my wallet balance on hedera"),
+        ("OrchestratorAgent", "You could also swap or check liquidity pools."),
+        ("user", "get my wallet balance on polygon"),
+    )
+
+    assert INSTRUCTION_SECTIONS["workflow_swap"] not in instruction
+    assert INSTRUCTION_SECTIONS["workflow_liquidity"] not in instruction
@@ -0,0 +1,208 @@
+"""ASGI-level tests for the orchestrator's payment tracking and paid session store."""
+
+import json
+
+import pytest
+
+from agents.orchestrator import __main__ as orchestrator
+from agents.orchestrator.core import paid_sessions as paid_sessions_module
+from agents.orchestrator.core.paid_sessions import PaidSessions
+
+SYSTEM_MESSAGE = {"id": "system", "role": "system", "content": "You are a DeFi assistant."}
+USER_MESSAGE = {"id": "user-1", "role": "user", "content": "swap 1 HBAR for USDC"}
+
+
+class _StubApp:
+    """ASGI app that records the request body it receives."""
+
+    def __init__(self):
+        self.body = None
+        self.messages = []
+
+    async def __call__(self, scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            self.messages.append(message)
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        self.body = body
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _json(value) -> bytes:
+    return orchestrator._json_dumps(value)
+
+
+def _request_body(thread_id="thread-1"):
+    return {"threadId": thread_id, "messages": [dict(SYSTEM_MESSAGE), dict(USER_MESSAGE)]}
+
+
+async def _call(app, chunks, headers=()):
+    """Send the body chunks through app as one POST / request."""
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": list(headers), "state": {}}
+    await app(scope, receive, send)
+
+
+def _injected(agent_body: bytes) -> dict:
+    """The request body re-encoded in full, with the IDs the middleware gave its messages."""
+    messages = json.loads(agent_body)["messages"]
+    expected = _request_body()
+    expected["messages"][0]["content"] = (
+        orchestrator._PAYMENT_INSTRUCTION + SYSTEM_MESSAGE["content"]
+    )
+    expected["messages"][1:1] = [
+        {
+            "id": messages[1]["id"],
+            "role": "user",
+            "content": orchestrator._PAYMENT_REQUIRED_USER_MESSAGE,
+        },
+        {
+            "id": messages[2]["id"],
+            "role": "assistant",
+            "content": orchestrator._PAYMENT_REQUIREMENTS_MESSAGE,
+        },
+    ]
+    return expected
+
+
+@pytest.fixture
+def splices(monkeypatch):
+    """Results of _splice_first_message calls (None when the middleware re-encoded)."""
+    results = []
+    splice = orchestrator._splice_first_message
+
+    def spy(*args):
+        results.append(splice(*args))
+        return results[-1]
+
+    monkeypatch.setattr(orchestrator, "_splice_first_message", spy)
+    return results
+
+
+async def test_spliced_body_matches_full_reencode(splices):
+    """Splicing the injected messages into the raw body gives the bytes a re-encode would."""
+    app = _StubApp()
+    await _call(orchestrator.PaymentTrackingMiddleware(app), [_json(_request_body())])
+
+    assert splices and splices[0] is not None
+    assert app.body == orchestrator._json_dumps(_injected(app.body))
+
+
+async def test_injection_falls_back_when_serialization_differs(splices):
+    """A body serialized differently from ours can't be spliced and is re-encoded in full."""
+    body = json.dumps(_request_body(), indent=2).encode()
+    app = _StubApp()
+    await _call(orchestrator.PaymentTrackingMiddleware(app), [body])
+
+    assert splices == [None]
+    assert app.body == orchestrator._json_dumps(_injected(app.body))
+
+
+async def test_chunked_body_is_buffered_and_replayed_once():
+    """A body sent in several chunks reaches the app as a single injected message."""
+    body = _json(_request_body())
+    chunks = [body[:7], body[7:40], body[40:]]
+    app = _StubApp()
+    await _call(orchestrator.PaymentTrackingMiddleware(app), chunks)
+
+    assert len(app.messages) == 1
+    assert app.body == orchestrator._json_dumps(_injected(app.body))
+
+
+async def test_paid_session_header_bypasses_buffering_and_injection():
+    """A request naming a paid session in X-Session-Id reaches the app untouched."""
+    body = _json(_request_body())
+    chunks = [body[:10], body[10:]]
+    app = _StubApp()
+    middleware = orchestrator.PaymentTrackingMiddleware(app)
+    middleware.paid_sessions.add("thread-1")
+
+    await _call(middleware, chunks, headers=[(b"x-session-id", b"thread-1")])
+
+    assert [message["body"] for message in app.messages] == chunks
+
+
+async def test_paying_request_marks_the_body_thread_paid():
+    """A valid payment marks the thread the agent runs under, not the header's session."""
+
+    async def verify_payment_header(header, requirements):
+        return {"isValid": True}
+
+    app = _StubApp()
+    middleware = orchestrator.PaymentTrackingMiddleware(app)
+    middleware.payment_verifier.verify_payment_header = verify_payment_header
+    headers = [(b"x-payment", b"p" * 20), (b"x-session-id", b"other-session")]
+
+    await _call(middleware, [_json(_request_body())], headers=headers)
+
+    assert "thread-1" in middleware.paid_sessions
+    assert "other-session" not in middleware.paid_sessions
+    assert app.body == _json(_request_body())
+
+
+async def test_logged_body_is_not_modified_by_injection(monkeypatch):
+    """The parsed body shared with the request log keeps what the client sent."""
+    monkeypatch.setenv("LOG_BODIES", "1")
+    logged = []
+    monkeypatch.setattr(
+        orchestrator, "log_in_background", lambda function, *args: logged.append(args)
+    )
+    app = _StubApp()
+    stack = orchestrator.LoggingMiddleware(orchestrator.PaymentTrackingMiddleware(app))
+
+    await _call(stack, [_json(_request_body())])
+
+    # (method, path, raw_headers, body, truncated, body_json) of the request log
+    logged_request = next(args for args in logged if len(args) == 6)
+    assert logged_request[3] == _json(_request_body())
+    assert logged_request[5] == _request_body()
+    assert len(json.loads(app.body)["messages"]) == 4
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock for the paid session store."""
+    now = [1000.0]
+    monkeypatch.setattr(paid_sessions_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_paid_sessions_expire_after_ttl(clock):
+    """A paid session is forgotten once its TTL has passed."""
+    sessions = PaidSessions(maxsize=10, ttl=60)
+    sessions.add("a")
+
+    clock[0] += 59
+    assert "a" in sessions
+    clock[0] += 1
+    assert "a" not in sessions
+    assert len(sessions) == 0
+
+
+def test_paid_sessions_evict_least_recently_used(clock):
+    """When full, the session looked up least recently is evicted first."""
+    sessions = PaidSessions(maxsize=2, ttl=60)
+    sessions.add("a")
+    sessions.add("b")
+    assert "a" in sessions  # "b" is now the least recently used
+
+    sessions.add("c")
+
+    assert "a" in sessions
+    assert "b" not in sessions
+    assert "c" in sessions
+    assert len(sessions) == 2
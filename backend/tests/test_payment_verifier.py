@@ -0,0 +1,304 @@
+"""Tests for the orchestrator's payment verifier, with the facilitator API mocked."""
+
+import asyncio
+import base64
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from agents.orchestrator.core import payment_verifier
+from agents.orchestrator.core.payment_verifier import PaymentVerifier
+
+REQUIREMENTS = {
+    "scheme": "exact",
+    "network": "hedera-testnet",
+    "maxAmountRequired": "10000000",
+    "asset": "0.0.0",
+    "payTo": "0.0.5000",
+}
+
+PAYLOAD = {
+    "x402Version": 1,
+    "scheme": "exact",
+    "network": "hedera-testnet",
+    "payload": {"transaction": "AAAA"},
+}
+
+
+@pytest.fixture
+def facilitator(monkeypatch):
+    """Route the shared HTTP client to a handler; returns the requests it received."""
+    requests: list[httpx.Request] = []
+    responses = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses["handler"](request)
+
+    def install(respond):
+        responses["handler"] = respond
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(payment_verifier, "_facilitator_client", client)
+        monkeypatch.setattr(
+            payment_verifier, "_facilitator_client_loop", asyncio.get_running_loop()
+        )
+        return requests
+
+    return install
+
+
+def _verdict(is_valid: bool, reason: str | None = None):
+    return lambda request: httpx.Response(200, json={"isValid": is_valid, "invalidReason": reason})
+
+
+async def test_malformed_payload_is_rejected_without_calling_the_facilitator(facilitator):
+    """Structure checks run first, so a malformed payload never reaches the facilitator."""
+    requests = facilitator(_verdict(True))
+
+    result = await PaymentVerifier().verify_payment({**PAYLOAD, "x402Version": 2}, REQUIREMENTS)
+
+    assert result == {"isValid": False, "invalidReason": "invalid_x402_version"}
+    assert requests == []
+
+
+async def test_facilitator_valid_is_returned(facilitator):
+    """A facilitator 'valid' is the result."""
+    requests = facilitator(_verdict(True))
+
+    result = await PaymentVerifier().verify_payment(PAYLOAD, REQUIREMENTS)
+
+    assert result == {"isValid": True, "invalidReason": None}
+    assert len(requests) == 1
+
+
+async def test_facilitator_invalid_falls_back_to_basic_result_by_default(facilitator):
+    """The frontend already settled the payment, so by default the structure checks stand."""
+    facilitator(_verdict(False, "insufficient_funds"))
+
+    result = await PaymentVerifier(enforce_facilitator_verdict=False).verify_payment(
+        PAYLOAD, REQUIREMENTS
+    )
+
+    assert result == {"isValid": True, "invalidReason": None}
+
+
+async def test_enforced_facilitator_invalid_rejects_the_payment(facilitator):
+    """With the verdict enforced, a facilitator 'invalid' is returned."""
+    facilitator(_verdict(False, "insufficient_funds"))
+
+    result = await PaymentVerifier(enforce_facilitator_verdict=True).verify_payment(
+        PAYLOAD, REQUIREMENTS
+    )
+
+    assert result == {"isValid": False, "invalidReason": "insufficient_funds"}
+
+
+async def test_enforced_verdict_still_ignores_signature_failures(facilitator):
+    """A failed facilitator signature check falls back to the basic result even when enforced."""
+    facilitator(_verdict(False, "invalid_exact_hedera_payload_signature"))
+
+    result = await PaymentVerifier(enforce_facilitator_verdict=True).verify_payment(
+        PAYLOAD, REQUIREMENTS
+    )
+
+    assert result == {"isValid": True, "invalidReason": None}
+
+
+def test_enforced_verdict_is_read_from_the_environment(monkeypatch):
+    """FACILITATOR_ENFORCE_VERDICT=1 turns enforcement on; it is off otherwise."""
+    monkeypatch.delenv("FACILITATOR_ENFORCE_VERDICT", raising=False)
+    assert PaymentVerifier().enforce_facilitator_verdict is False
+
+    monkeypatch.setenv("FACILITATOR_ENFORCE_VERDICT", "1")
+    assert PaymentVerifier().enforce_facilitator_verdict is True
+
+
+def _header(payload: dict) -> str:
+    return base64.b64encode(json.dumps(payload).encode()).decode()
+
+
+async def test_concurrent_verifications_of_one_header_share_a_facilitator_call(facilitator):
+    """Requests carrying the same header wait on one verification and get their own copy."""
+    release = asyncio.Event()
+
+    async def slow_verdict(request):
+        await release.wait()
+        return httpx.Response(200, json={"isValid": True, "invalidReason": None})
+
+    requests = facilitator(slow_verdict)
+    verifier = PaymentVerifier()
+    header = _header(PAYLOAD)
+
+    pending = [
+        asyncio.ensure_future(verifier.verify_payment_header(header, REQUIREMENTS))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*pending)
+
+    assert len(requests) == 1
+    assert results == [{"isValid": True, "invalidReason": None}] * 3
+    assert len({id(result) for result in results}) == 3
+    assert not payment_verifier._in_flight_verifications
+
+
+async def test_different_requirements_are_verified_separately(facilitator):
+    """The in-flight key includes the requirements, so other requirements don't coalesce."""
+    requests = facilitator(_verdict(True))
+    verifier = PaymentVerifier()
+    header = _header(PAYLOAD)
+
+    await asyncio.gather(
+        verifier.verify_payment_header(header, REQUIREMENTS),
+        verifier.verify_payment_header(header, {**REQUIREMENTS}),
+    )
+
+    assert len(requests) == 2
+
+
+def test_facilitator_client_is_rebound_per_event_loop(monkeypatch):
+    """A client created on a closed loop is replaced; within a loop it is reused."""
+    monkeypatch.setattr(payment_verifier, "_facilitator_client", None)
+    monkeypatch.setattr(payment_verifier, "_facilitator_client_loop", None)
+
+    async def get_client_twice():
+        client = payment_verifier._get_facilitator_client()
+        assert payment_verifier._get_facilitator_client() is client
+        return client
+
+    first = asyncio.run(get_client_twice())
+    second = asyncio.run(get_client_twice())
+
+    assert second is not first
+    asyncio.run(payment_verifier.aclose_facilitator_client())
+    assert payment_verifier._facilitator_client is None
+    assert second.is_closed
+
+
+TRANSACTION_ID = "0.0.1234@1700000000.123"
+MIRROR_NODE_URL = (
+    "https://testnet.mirrornode.hedera.com/api/v1/transactions/0.0.1234-1700000000-000000123"
+)
+
+
+@pytest.fixture
+def mirror_node(monkeypatch, facilitator):
+    """Answer mirror node lookups with the given responses in turn; logs are recorded."""
+    monkeypatch.setattr(payment_verifier, "_MIRROR_NODE_RETRY_DELAY", 0)
+    log = MagicMock()
+    monkeypatch.setattr(payment_verifier, "logger", log)
+
+    def install(*responses: httpx.Response):
+        pending = list(responses)
+        requests = facilitator(lambda request: pending.pop(0))
+        return requests, log
+
+    return install
+
+
+def _transactions(*records: dict) -> httpx.Response:
+    return httpx.Response(200, json={"transactions": list(records)})
+
+
+def _hbar_payment(amount: int, result: str = "SUCCESS") -> dict:
+    return {
+        "result": result,
+        "transfers": [
+            {"account": "0.0.1234", "amount": -amount},
+            {"account": REQUIREMENTS["payTo"], "amount": amount},
+        ],
+    }
+
+
+async def test_transaction_not_yet_on_mirror_node_is_retried(mirror_node):
+    """A 404 (not yet imported) is retried, then the payment is verified."""
+    requests, log = mirror_node(httpx.Response(404), _transactions(_hbar_payment(10_000_000)))
+
+    await payment_verifier._check_transaction_on_chain(TRANSACTION_ID, "testnet", REQUIREMENTS)
+
+    assert [str(request.url) for request in requests] == [MIRROR_NODE_URL] * 2
+    log.info.assert_called_once()
+    log.warning.assert_not_called()
+
+
+async def test_transaction_never_found_is_logged(mirror_node):
+    """After the last attempt, a missing transaction is logged."""
+    requests, log = mirror_node(*[httpx.Response(404)] * payment_verifier._MIRROR_NODE_ATTEMPTS)
+
+    await payment_verifier._check_transaction_on_chain(TRANSACTION_ID, "testnet", REQUIREMENTS)
+
+    assert len(requests) == payment_verifier._MIRROR_NODE_ATTEMPTS
+    assert "not found" in log.warning.call_args.args[0]
+
+
+async def test_only_successful_records_count(mirror_node):
+    """A record that failed on-chain doesn't count as the payment."""
+    _, log = mirror_node(_transactions(_hbar_payment(10_000_000, "INSUFFICIENT_PAYER_BALANCE")))
+
+    await payment_verifier._check_transaction_on_chain(TRANSACTION_ID, "testnet", REQUIREMENTS)
+
+    assert "did not succeed" in log.warning.call_args.args[0]
+    log.info.assert_not_called()
+
+
+async def test_underpayment_to_pay_to_is_logged(mirror_node):
+    """Less than maxAmountRequired reaching payTo is logged as a mismatch."""
+    _, log = mirror_node(_transactions(_hbar_payment(9_999_999)))
+
+    await payment_verifier._check_transaction_on_chain(TRANSACTION_ID, "testnet", REQUIREMENTS)
+
+    assert log.warning.call_args.args[0].startswith("Transaction %s paid")
+    log.info.assert_not_called()
+
+
+async def test_token_payments_are_summed_per_token(mirror_node):
+    """For a token asset, only that token's transfers to payTo count."""
+    requirements = {**REQUIREMENTS, "asset": "0.0.456858", "maxAmountRequired": "100"}
+    record = {
+        "result": "SUCCESS",
+        "token_transfers": [
+            {"token_id": "0.0.456858", "account": REQUIREMENTS["payTo"], "amount": 60},
+            {"token_id": "0.0.456858", "account": REQUIREMENTS["payTo"], "amount": 40},
+            {"token_id": "0.0.731861", "account": REQUIREMENTS["payTo"], "amount": 500},
+        ],
+    }
+    _, log = mirror_node(_transactions(record))
+
+    await payment_verifier._check_transaction_on_chain(TRANSACTION_ID, "testnet", requirements)
+
+    log.warning.assert_not_called()
+    log.info.assert_called_once()
+
+
+async def test_full_check_queue_drops_the_check(monkeypatch):
+    """When the check queue is full, the check is logged and dropped, never run inline."""
+    monkeypatch.setattr(payment_verifier, "TX_CHECK_QUEUE_MAX_SIZE", 1)
+    monkeypatch.setattr(payment_verifier, "_tx_check_queue", None)
+    monkeypatch.setattr(payment_verifier, "_tx_check_worker", None)
+    log = MagicMock()
+    monkeypatch.setattr(payment_verifier, "logger", log)
+    release = asyncio.Event()
+    checked = []
+
+    async def check(transaction_id, network, requirements):
+        await release.wait()
+        checked.append(transaction_id)
+
+    monkeypatch.setattr(payment_verifier, "_check_transaction_on_chain", check)
+    verifier = PaymentVerifier()
+
+    for transaction_id in ("0.0.1@1.1", "0.0.2@2.2", "0.0.3@3.3"):
+        assert verifier.verify_transaction_id(transaction_id, REQUIREMENTS)["isValid"]
+        # Let the worker take the first check off the queue
+        await asyncio.sleep(0)
+
+    release.set()
+    await payment_verifier.flush_transaction_checks()
+    payment_verifier._tx_check_worker.cancel()
+
+    assert checked == ["0.0.1@1.1", "0.0.2@2.2"]
+    assert "check queue full" in log.warning.call_args.args[0]
+    assert log.warning.call_args.args[1] == "0.0.3@3.3"
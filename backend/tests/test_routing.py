@@ -0,0 +1,79 @@
+"""Tests for the orchestrator's keyword, query-shape and n-gram request routing."""
+
+import pytest
+
+from agents.orchestrator.core.routing import (
+    _classify_normalized,
+    classify_intents,
+    nearest_intent,
+    normalize_query,
+    route_intent,
+)
+
+
+@pytest.mark.parametrize(
+    ("query", "intents", "agent"),
+    [
+        # Keywords
+        ("get popular tokens", {"balance"}, "Balance Agent"),
+        ("get my wallet balance on hedera", {"balance"}, "Balance Agent"),
+        ("trending words", {"sentiment"}, "Sentiment Agent"),
+        ("show me the tvl", {"liquidity"}, "LiquidityFinder"),
+        ("search for the SAUCE token address", {"research"}, "Token Research"),
+        ("swap 1 HBAR to USDC", {"swap"}, None),
+        ("check my balance and swap HBAR", {"balance", "swap"}, None),
+        # Query shapes that name no keyword
+        ("ETH/USDT", {"liquidity"}, "LiquidityFinder"),
+        ("HBAR/USDC on hedera", {"liquidity"}, "LiquidityFinder"),
+        ("check USDC on Polygon", {"balance"}, "Balance Agent"),
+        ("find WBTC on Polygon", {"research"}, "Token Research"),
+        # n-gram similarity to the intent profiles
+        ("how much do I have", {"balance"}, "Balance Agent"),
+        ("technical analysis rsi macd outlook", {"trading"}, "Trading Agent"),
+        # Follow-ups that carry no routing signal
+        ("yes", set(), None),
+        ("0.0.123456", set(), None),
+        ("0x" + "ab" * 20, set(), None),
+        ("get it on polygon", set(), None),
+        ("on polygon please", set(), None),
+        # Trading advice versus swaps phrased with buy/sell/trade
+        ("should I buy BTC", {"trading"}, "Trading Agent"),
+        ("should I buy BTC with my savings", {"trading"}, "Trading Agent"),
+        ("trading recommendation for ETH", {"trading"}, "Trading Agent"),
+        ("buy USDC with HBAR", {"swap"}, None),
+        ("Trade HBAR for USDC", {"swap"}, None),
+        ("sell 5 HBAR for USDC", {"swap"}, None),
+        ("sell 5 HBAR", {"swap", "trading"}, None),
+        ("buy $100 of ETH", {"swap", "trading"}, None),
+    ],
+)
+def test_classify_and_route(query, intents, agent):
+    """Each message gets its intents and, only when unambiguous, a single agent."""
+    classified = classify_intents(query)
+
+    assert classified == intents
+    assert route_intent(classified) == agent
+
+
+def test_route_intent_leaves_swaps_and_mixed_intents_to_the_model():
+    """Swaps, several intents and no intent have no deterministic agent."""
+    assert route_intent(frozenset({"swap"})) is None
+    assert route_intent(frozenset({"balance", "liquidity"})) is None
+    assert route_intent(frozenset()) is None
+
+
+def test_nearest_intent_needs_a_clear_match():
+    """Messages below the similarity threshold or margin get no intent."""
+    assert nearest_intent("how much do I have") == "balance"
+    assert nearest_intent("hi") is None
+    assert nearest_intent("") is None
+
+
+def test_equivalent_messages_share_one_cached_result():
+    """Case, spacing and trailing punctuation don't change (or re-run) classification."""
+    assert normalize_query("  GET   popular tokens?! ") == "get popular tokens"
+    first = classify_intents("get popular tokens")
+    hits = _classify_normalized.cache_info().hits
+
+    assert classify_intents("  GET   popular tokens?! ") is first
+    assert _classify_normalized.cache_info().hits == hits + 1
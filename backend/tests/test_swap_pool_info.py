@@ -0,0 +1,68 @@
+"""Tests for the swap agent's pool lookup with the Multicall3 contract mocked."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from eth_abi import encode
+
+from agents.swap.services.response_builder import _get_pool_info
+from packages.blockchain.hedera.constants import HEDERA_TOKENS
+from packages.blockchain.hedera.saucerswap.pool.web3_client import SaucerSwapWeb3Client
+
+POOL_ADDRESS = "0x00000000000000000000000000000000003AD5e1"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+SQRT_PRICE_X96 = 2**96
+
+
+def _mock_multicall(pool_fee: int) -> tuple[MagicMock, list[int]]:
+    """Multicall3 mock with a pool only at pool_fee; records the fee tiers looked up."""
+    looked_up: list[int] = []
+
+    def aggregate3(calls):
+        if not calls[0][1]:
+            # liquidity() and slot0() of the pool (allowFailure is off for these)
+            results = [
+                (True, encode(["uint128"], [10**18])),
+                (
+                    True,
+                    encode(
+                        ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"],
+                        [SQRT_PRICE_X96, 0, 0, 1, 1, 0, True],
+                    ),
+                ),
+            ]
+        else:
+            # factory.getPool(token0, token1, fee) per fee tier; fee is the last argument
+            results = []
+            for _target, _allow_failure, call_data in calls:
+                fee = int(call_data[-64:], 16)
+                looked_up.append(fee)
+                pool = POOL_ADDRESS if fee == pool_fee else ZERO_ADDRESS
+                results.append((True, encode(["address"], [pool])))
+        call = MagicMock()
+        call.call.return_value = results
+        return call
+
+    contract = MagicMock()
+    contract.functions.aggregate3.side_effect = aggregate3
+    return contract, looked_up
+
+
+def test_hedera_pool_info_finds_saucerswap_1500_tier():
+    """A pair pooled only at SaucerSwap's 0.15% tier is found on Hedera."""
+    contract, looked_up = _mock_multicall(pool_fee=1500)
+    with patch.object(
+        SaucerSwapWeb3Client, "multicall_contract", new_callable=PropertyMock
+    ) as multicall_contract:
+        multicall_contract.return_value = contract
+        pool_info = _get_pool_info(
+            "hedera",
+            HEDERA_TOKENS["USDC"]["address"],
+            HEDERA_TOKENS["SAUCE"]["address"],
+            rpc_url="http://localhost:8545",
+        )
+
+    assert 1500 in looked_up
+    assert pool_info is not None
+    assert pool_info["fee"] == 1500
+    assert pool_info["pool_address"] == POOL_ADDRESS
+    assert pool_info["liquidity"] == str(10**18)
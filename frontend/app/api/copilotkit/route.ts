@@ -22,9 +22,22 @@ export async function POST(request: NextRequest) {
 
   // STEP 3: Extract X-PAYMENT header and wrap orchestrator with HttpAgent (AG-UI client)
   const xPaymentHeader = request.headers.get("X-PAYMENT") || request.headers.get("x-payment");
+  // Forwarding the thread ID the orchestrator will run under lets it skip body buffering for
+  // paid sessions; it is read from a clone so the runtime still gets the untouched body
+  let xSessionIdHeader: string | null = null;
+  try {
+    const body = await request.clone().json();
+    const threadId = body?.variables?.data?.threadId;
+    xSessionIdHeader = typeof threadId === "string" && threadId ? threadId : null;
+  } catch {
+    // Not a JSON body; the orchestrator reads the session from the request instead
+  }
   const orchestrationAgent = new HttpAgent({
     url: orchestratorUrl,
-    headers: xPaymentHeader ? { "X-PAYMENT": xPaymentHeader } : {},
+    headers: {
+      ...(xPaymentHeader ? { "X-PAYMENT": xPaymentHeader } : {}),
+      ...(xSessionIdHeader ? { "X-Session-Id": xSessionIdHeader } : {}),
+    },
   });
 
   // STEP 4: Create A2A Middleware Agent